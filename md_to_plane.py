@@ -13,35 +13,214 @@ PLANE_PROJECT_TEMPLATE.md 기반 기획서를 Plane API로 변환
         --api-key your-api-key \\
         --api-url http://localhost:8090
 
+    # 여러 기획서 / 디렉터리 / glob 패턴을 한 번에
+    python md_to_plane.py plans/ -w my-workspace -p project-id -k your-api-key
+
+    # 파싱과 검증만 (접속 정보 불필요, -m으로 실행하면 바이트코드 캐시를 써서 더 빨리 시작)
+    python -m md_to_plane plans/ --dry-run
+
+    # Plane 프로젝트를 기획서로 내보내기
+    python md_to_plane.py -w my-workspace -p project-id -k your-api-key --export exported.md
+
 요구사항:
     - Python 3.7+
     - pip install requests pyyaml
+    - (선택) pip install 'httpx[http2]'  # --async
 """
 
+import os
 import re
 import sys
-import yaml
-import requests
+import json
+import hashlib
+import io
+import glob
+import gzip
+import mmap
+import pickle
+import select
+import struct
 import argparse
+import bisect
+import heapq
+import datetime
+import contextlib
+import importlib.util
 import time
-from typing import List, Dict, Optional
-from dataclasses import dataclass, field
+import random
+import queue
+import collections
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import List, Dict, Optional, Iterable, Iterator, Tuple, Union, Set, TYPE_CHECKING
+from dataclasses import dataclass, field, fields
+
+if TYPE_CHECKING:  # 타입 표기용 (실행 중에는 import 하지 않아 시작이 느려지지 않음)
+    from urllib3.util.retry import Retry
+
+
+def _lazy_import(name: str):
+    """
+    처음 속성에 접근할 때 실제로 import 되는 모듈 (설치되어 있지 않으면 None)
+
+    requests(urllib3, SSL 포함) / httpx / yaml / asyncio는 import에만 수십 ms가 걸린다.
+    --dry-run처럼 네트워크를 쓰지 않는 경로나, 파싱 캐시가 맞아 YAML을 읽지 않는
+    실행에서는 끝까지 import 되지 않는다. 모듈 속성을 import 시점에 읽으면
+    (기본값, 상속, 평가되는 타입 표기) 바로 로드되므로 함수 안에서만 접근한다.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        return None
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+yaml = _lazy_import('yaml')
+requests = _lazy_import('requests')
+httpx = _lazy_import('httpx')  # 선택: --async (AsyncPlaneAPIClient)
+asyncio = _lazy_import('asyncio')
+markdown = _lazy_import('markdown')  # 선택: --markdown (DescriptionRenderer)
+
+_YAML_LOADER = None
+_BLOCK_DUMPER = None
+
+
+def _yaml_load(text: str):
+    """YAML 블록 하나 로드 (yaml.safe_load와 같은 결과)"""
+    global _YAML_LOADER
+    if _YAML_LOADER is None:
+        # libyaml이 설치되어 있으면 C 로더 사용 (순수 Python SafeLoader보다 수 배 빠름)
+        _YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    return yaml.load(text, Loader=_YAML_LOADER)
+
+
+def _block_dumper():
+    """여러 줄 문자열은 | 블록으로, 목록은 한 줄로 쓰는 YAML Dumper (--export)"""
+    global _BLOCK_DUMPER
+    if _BLOCK_DUMPER is None:
+        dumper = type('_BlockDumper', (getattr(yaml, 'CSafeDumper', yaml.SafeDumper),), {})
+        dumper.add_representer(str, lambda dumper, value: dumper.represent_scalar(
+            'tag:yaml.org,2002:str', value, style='|' if '\n' in value else None))
+        dumper.add_representer(list, lambda dumper, value: dumper.represent_sequence(
+            'tag:yaml.org,2002:seq', value, flow_style=True))
+        _BLOCK_DUMPER = dumper
+    return _BLOCK_DUMPER
+
+
+def _yaml_dump(data: Dict) -> str:
+    """기획서 YAML 블록 내용 (키 순서 유지, 목록은 한 줄)"""
+    return yaml.dump(data, Dumper=_block_dumper(), sort_keys=False, allow_unicode=True,
+                     default_flow_style=False, width=4096)
+
+
+def _slotted(cls):
+    """
+    @dataclass 클래스를 __slots__ 클래스로 다시 만듦 (Python 3.10의 slots=True와 같음)
+
+    인스턴스마다 __dict__가 없어져 수만 개의 Issue를 들고 있을 때 메모리가 크게 준다.
+    """
+    names = tuple(f.name for f in fields(cls))
+    namespace = {key: value for key, value in cls.__dict__.items()
+                 if key not in names + ('__dict__', '__weakref__')}
+    namespace['__slots__'] = names
+    slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
+_NAME_TUPLES: Dict[Tuple, Tuple] = {}
+
+
+def _names(values) -> Tuple:
+    """
+    YAML 목록 값(라벨, 담당자 등)을 intern된 문자열 튜플로
+
+    같은 이름은 문자열 하나를, 같은 조합(["backend", "api"])은 튜플 하나를 공유한다.
+    """
+    if not values:
+        return ()
+    if isinstance(values, str):
+        values = [values]
+    names = tuple(sys.intern(v) if isinstance(v, str) else v for v in values)
+    try:
+        return _NAME_TUPLES.setdefault(names, names)
+    except TypeError:  # 해시할 수 없는 값이 섞인 잘못된 목록
+        return names
 
 
+# 경로 -> ((inode, mtime_ns, 크기), mmap). 파일이 다시 쓰이면 새로 매핑하고 이전 매핑은 닫는다
+_MAPPED_FILES: Dict[str, Tuple[Tuple[int, int, int], mmap.mmap]] = {}
+_MAPPED_FILES_LOCK = threading.Lock()
+
+
+@_slotted
+@dataclass
+class DescriptionRef:
+    """
+    기획서 파일 안의 Issue YAML 블록 위치 (설명을 요청 본문을 만들 때 읽기 위한 참조)
+
+    start / end는 블록 내용의 바이트 위치, digest는 파싱할 때 본 블록 내용의 해시.
+    파일은 처음 읽을 때 mmap으로 열어 프로세스 안에서 공유하고, 파일의 inode / 수정
+    시각 / 크기가 바뀌면 (--watch 중 저장 등) 다시 매핑한다.
+    """
+    path: str
+    start: int
+    end: int
+    digest: bytes
+
+    def load(self) -> str:
+        """블록을 다시 읽어 description_html 반환 (그사이 파일이 바뀌었으면 ValueError)"""
+        with _MAPPED_FILES_LOCK:
+            with open(self.path, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                version = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+                cached = _MAPPED_FILES.get(self.path)
+                if cached is None or cached[0] != version:
+                    if cached is not None:
+                        cached[1].close()
+                    source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    _MAPPED_FILES[self.path] = cached = (version, source)
+            raw = cached[1][self.start:self.end].decode('utf-8')
+        text = '\n'.join(line.rstrip('\r') for line in raw.split('\n')[:-1])
+        if hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest() != self.digest:
+            raise ValueError(f"기획서가 파싱 이후 바뀌어 설명을 읽을 수 없습니다: {self.path}")
+        return (_yaml_load(text) or {}).get('description_html') or ''
+
+
+@_slotted
 @dataclass
 class Issue:
-    """이슈 데이터"""
+    """
+    이슈 데이터
+
+    labels / assignees는 intern된 문자열 튜플. description_html은 문자열이거나,
+    설명을 메모리에 두지 않는 모드에서는 DescriptionRef (get_description_html()로 읽음).
+    """
     name: str
-    description_html: str = ""
+    description_html: Union[str, DescriptionRef] = ""
     priority: str = "medium"
-    assignees: List[str] = field(default_factory=list)
-    labels: List[str] = field(default_factory=list)
+    assignees: Tuple[str, ...] = ()
+    labels: Tuple[str, ...] = ()
     start_date: Optional[str] = None
     target_date: Optional[str] = None
     estimate_point: Optional[int] = None
     state: Optional[str] = None
+    identifier: Optional[str] = None  # 기획서 상의 번호 (예: PROJ-001)
+    line: int = field(default=0, compare=False)  # 기획서의 #### 제목 줄 번호
 
+    def get_description_html(self) -> str:
+        if isinstance(self.description_html, DescriptionRef):
+            return self.description_html.load()
+        return self.description_html
 
+
+@_slotted
 @dataclass
 class Module:
     """모듈(에픽) 데이터"""
@@ -50,11 +229,13 @@ class Module:
     start_date: Optional[str] = None
     target_date: Optional[str] = None
     lead: Optional[str] = None
-    members: List[str] = field(default_factory=list)
+    members: Tuple[str, ...] = ()
     status: str = "planned"
+    line: int = field(default=0, compare=False)  # 기획서의 ### 제목 줄 번호
     issues: List[Issue] = field(default_factory=list)
 
 
+@_slotted
 @dataclass
 class Cycle:
     """사이클(스프린트) 데이터"""
@@ -63,6 +244,7 @@ class Cycle:
     start_date: Optional[str] = None
     end_date: Optional[str] = None
     owned_by: Optional[str] = None
+    line: int = field(default=0, compare=False)  # 기획서의 ### 제목 줄 번호
     modules: List[Module] = field(default_factory=list)
 
 
@@ -90,174 +272,321 @@ class YAMLMarkdownParser:
         priority: "high"
         estimate_point: 8
         ```
+
+    문서를 한 줄씩 한 번만 훑으면서 제목(##, ###, ####)과 코드 펜스를
+    토큰으로 나누고, Module / Cycle 섹션이 닫히는 즉시 객체를 완성한다.
+    문자열 대신 파일 핸들 같은 줄 이터러블도 받을 수 있어서 문서 전체를
+    메모리에 올리지 않고 파싱할 수 있다 (from_file).
+
+    섹션은 다음 '## ' 제목에서 끝나고, 코드 펜스 안의 '#' 줄은 제목으로
+    보지 않는다. 프로젝트 식별자는 Modules 섹션보다 앞에 있어야 한다.
+
+    block_cache(YAML 블록 해시 → 로드 결과)를 주면 같은 내용의 블록은 YAML을
+    다시 로드하지 않고, 이번 파싱에서 본 블록을 yaml_blocks에 모은다 (ParseCache).
+
+    from_file(..., lazy_descriptions=True)면 Issue 설명을 메모리에 두지 않고
+    파일 안의 YAML 블록 위치(DescriptionRef)만 기억한다. 설명은 요청 본문을
+    만들 때 mmap으로 다시 읽으므로 업로드가 끝날 때까지 파일을 바꾸면 안 된다.
+
+    파싱하면서 고치거나 버린 내용(알 수 없는 priority, YAML 없는 Issue, YAML 오류)은
+    출력하지 않고 (줄 번호, 'error' | 'warning', 메시지)로 problems에 모은다
+    (PlanValidator가 검증 결과와 함께 보고).
     """
 
-    def __init__(self, md_content: str):
-        self.content = md_content
+    VERSION = 3  # 파싱 결과가 달라지는 변경이면 올림 (파싱 캐시 무효화)
+
+    SECTION_RE = re.compile(r'##\s+(\d+)\.\s*(.*)')
+    MODULE_RE = re.compile(r'###\s+Module\s+\d+:\s+(.+)')
+    CYCLE_RE = re.compile(r'###\s+Cycle\s+\d+:\s+(.+)')
+    ISSUE_RE = re.compile(r'####\s+([A-Z]{3,7})-(\d+):\s+(.+)')
+    IDENTIFIER_RE = re.compile(r'\*\*프로젝트 식별자\*\*:\s*`([A-Z]{3,7})`')
+    POINTS_RE = re.compile(r'\s*\(\d+pt,\s*\w+\)')
+
+    def __init__(self, md_content: Union[str, Iterable[str]],
+                 block_cache: Optional[Dict[bytes, object]] = None,
+                 source_path: Optional[str] = None):
+        if isinstance(md_content, str):
+            md_content = md_content.splitlines(keepends=True)
+        self.lines = md_content
+        self.block_cache = block_cache
+        self.source_path = source_path  # 있으면 Issue 설명을 DescriptionRef로 (lines는 원본 그대로)
+        self.yaml_blocks: Dict[bytes, object] = {}
+        self.blocks_reused = 0
         self.cycles: List[Cycle] = []
         self.modules: List[Module] = []
         self.project_identifier = "PROJ"
+        self.problems: List[Tuple[int, str, str]] = []
+        self._identifier_found = False
+        self._modules_section_found = False
+
+    @classmethod
+    def from_file(cls, path: str, block_cache: Optional[Dict[bytes, object]] = None,
+                  lazy_descriptions: bool = False) -> 'YAMLMarkdownParser':
+        """파일을 열어 줄 단위로 읽는 파서 (parse/iter_parse가 끝나면 파일을 닫음)"""
+        if lazy_descriptions:
+            # 바이트 위치를 세야 하므로 줄바꿈을 바꾸지 않고 읽음
+            return cls(_iter_file_lines(path, newline=''), block_cache, os.path.abspath(path))
+        return cls(_iter_file_lines(path), block_cache)
 
     def parse(self) -> List[Module]:
         """메인 파싱 로직"""
-        # 1. 프로젝트 식별자 추출
-        self._extract_project_identifier()
+        for _ in self.iter_parse():
+            pass
+        return self.modules
+
+    def iter_parse(self) -> Iterator[Union[Module, Cycle]]:
+        """
+        Module / Cycle이 완성되는 순서대로 yield
 
-        # 2. Cycles 섹션 파싱 (있으면)
-        self._parse_cycles_section()
+        yield한 객체는 self.modules / self.cycles에도 쌓인다.
+        """
+        section = None        # 'modules' | 'cycles' | None
+        heading = None        # 현재 ### 블록: ('module' | 'cycle', 제목, 줄 번호)
+        block_yaml = None     # ### 블록의 YAML
+        issues: List[Issue] = []
+        issue = None          # 현재 #### 이슈: [식별자, 제목, YAML, YAML 바이트 위치, 줄 번호]
+        fence = None          # 펜스 안이면 'yaml' 또는 'other'
+        fence_lines: List[str] = []
+        track = self.source_path is not None
+        offset = fence_start = 0  # 바이트 위치 (lazy_descriptions일 때만 셈)
 
-        # 3. Modules 섹션 파싱
-        self._parse_modules_section()
+        for line_no, raw_line in enumerate(self.lines, 1):
+            line = raw_line.rstrip('\r\n')
+            line_start = offset
+            if track:
+                offset += len(raw_line.encode('utf-8'))
 
-        return self.modules
+            # 1. 코드 펜스 안
+            if fence is not None:
+                if line.strip() == '```':
+                    if fence == 'yaml':
+                        text = '\n'.join(fence_lines)
+                        if issue is not None:
+                            if issue[2] is None:
+                                issue[2] = text
+                                if track:
+                                    issue[3] = (fence_start, line_start)
+                        elif heading is not None and block_yaml is None:
+                            block_yaml = text
+                    fence = None
+                    fence_lines = []
+                elif fence == 'yaml':
+                    fence_lines.append(line)
+                continue
 
-    def _extract_project_identifier(self):
-        """프로젝트 식별자 추출: **프로젝트 식별자**: `[PROJ]`"""
-        match = re.search(r'\*\*프로젝트 식별자\*\*:\s*`([A-Z]{3,7})`', self.content)
-        if match:
-            self.project_identifier = match.group(1)
-
-    def _parse_cycles_section(self):
-        """## 8. Cycles 계획 섹션 파싱"""
-        # Cycles 섹션 찾기
-        cycles_match = re.search(
-            r'## 8\. Cycles 계획(.+?)(?=##|\Z)',
-            self.content,
-            re.DOTALL
-        )
+            stripped = line.strip()
+            if stripped.startswith('```'):
+                fence = 'yaml' if stripped == '```yaml' and section else 'other'
+                fence_start = offset
+                continue
 
-        if not cycles_match:
-            return
+            if not self._identifier_found:
+                match = self.IDENTIFIER_RE.search(line)
+                if match:
+                    self.project_identifier = match.group(1)
+                    self._identifier_found = True
 
-        cycles_section = cycles_match.group(1)
+            if not line.startswith('#'):
+                continue
 
-        # Cycle별 파싱: ### Cycle N: 이름
-        cycle_blocks = re.finditer(
-            r'###\s+Cycle\s+\d+:\s+(.+?)\n```yaml\n(.+?)\n```',
-            cycles_section,
-            re.DOTALL
-        )
+            # 2. 제목: 진행 중인 이슈 / 블록 마감
+            level = len(line) - len(line.lstrip('#'))
+            if level > 4 or level < 2 or line[level:level + 1] not in (' ', '\t'):
+                continue
 
-        for match in cycle_blocks:
-            cycle_name = match.group(1).strip()
-            yaml_content = match.group(2)
+            if issue is not None:
+                issues.append(self._build_issue(*issue))
+                issue = None
 
-            try:
-                cycle_data = yaml.safe_load(yaml_content)
-                cycle = Cycle(
-                    name=cycle_data.get('name', cycle_name),
-                    description=cycle_data.get('description', ''),
-                    start_date=cycle_data.get('start_date'),
-                    end_date=cycle_data.get('end_date'),
-                    owned_by=cycle_data.get('owned_by')
-                )
-                self.cycles.append(cycle)
-            except yaml.YAMLError as e:
-                print(f"⚠️  Cycle YAML 파싱 오류: {cycle_name} - {e}")
-
-    def _parse_modules_section(self):
-        """## 7. Modules 계획 섹션 파싱"""
-        # Modules 섹션 찾기
-        modules_match = re.search(
-            r'## 7\. Modules 계획(.+?)(?=## \d+\.)',
-            self.content,
-            re.DOTALL
-        )
+            if level == 4:
+                match = self.ISSUE_RE.match(line)
+                if section == 'modules' and heading and match \
+                        and match.group(1) == self.project_identifier:
+                    issue = [f"{match.group(1)}-{match.group(2)}", match.group(3), None, None,
+                             line_no]
+                continue
 
-        if not modules_match:
-            print("⚠️  Modules 섹션을 찾을 수 없습니다.")
-            return
+            if level == 3 and section == 'modules' and not self.MODULE_RE.match(line):
+                continue  # Module 안의 다른 ### 제목은 이슈만 끊는다
 
-        modules_section = modules_match.group(1)
+            if heading is not None:
+                item = self._close_block(heading, block_yaml, issues)
+                if item is not None:
+                    yield item
+                heading, block_yaml, issues = None, None, []
 
-        # Module별 파싱: ### Module N: 이름
-        module_pattern = r'###\s+Module\s+\d+:\s+(.+?)(?=###\s+Module|\Z)'
-        module_blocks = re.finditer(module_pattern, modules_section, re.DOTALL)
+            if level == 2:
+                section = self._section_of(line)
+                continue
 
-        for module_match in module_blocks:
-            module_text = module_match.group(0)
-            module_name = module_match.group(1).strip()
+            # level == 3
+            pattern = {'modules': self.MODULE_RE, 'cycles': self.CYCLE_RE}.get(section)
+            match = pattern.match(line) if pattern else None
+            if match:
+                heading = ('module' if section == 'modules' else 'cycle', match.group(1).strip(),
+                           line_no)
 
-            # Module YAML 파싱
-            yaml_match = re.search(r'```yaml\n(.+?)\n```', module_text, re.DOTALL)
+        # 문서 끝: 남은 블록 마감
+        if issue is not None:
+            issues.append(self._build_issue(*issue))
+        if heading is not None:
+            item = self._close_block(heading, block_yaml, issues)
+            if item is not None:
+                yield item
 
-            if not yaml_match:
-                print(f"⚠️  Module YAML을 찾을 수 없음: {module_name}")
-                continue
+        if not self._modules_section_found:
+            print("⚠️  Modules 섹션을 찾을 수 없습니다.")
 
-            try:
-                module_data = yaml.safe_load(yaml_match.group(1))
-                module = Module(
-                    name=module_data.get('name', module_name),
-                    description=module_data.get('description', ''),
-                    start_date=module_data.get('start_date'),
-                    target_date=module_data.get('target_date'),
-                    lead=module_data.get('lead'),
-                    members=module_data.get('members', []),
-                    status=module_data.get('status', 'planned')
-                )
-
-                # 이 Module의 Issues 파싱
-                module.issues = self._parse_issues_in_module(module_text)
+    def _section_of(self, line: str) -> Optional[str]:
+        """## N. 제목 → 'modules' / 'cycles' / None"""
+        match = self.SECTION_RE.match(line)
+        if not match:
+            return None
+        number, title = match.group(1), match.group(2)
+        if number == '7' and title.startswith('Modules 계획'):
+            self._modules_section_found = True
+            return 'modules'
+        if number == '8' and title.startswith('Cycles 계획'):
+            return 'cycles'
+        return None
 
+    def _close_block(self, heading, yaml_text: Optional[str],
+                     issues: List[Issue]) -> Optional[Union[Module, Cycle]]:
+        kind, name, line = heading
+        if kind == 'module':
+            module = self._build_module(name, yaml_text, issues, line)
+            if module is not None:
                 self.modules.append(module)
+            return module
+
+        cycle = self._build_cycle(name, yaml_text, line)
+        if cycle is not None:
+            self.cycles.append(cycle)
+        return cycle
+
+    def _build_cycle(self, cycle_name: str, yaml_text: Optional[str],
+                     line: int = 0) -> Optional[Cycle]:
+        """### Cycle N: 이름 + YAML → Cycle"""
+        if yaml_text is None:
+            self._problem(line, 'warning', f"Cycle YAML을 찾을 수 없어 건너뜀: {cycle_name}")
+            return None
+
+        try:
+            cycle_data = self._mapping(self._load_yaml(yaml_text), line, f"Cycle {cycle_name}")
+            return Cycle(
+                name=cycle_data.get('name', cycle_name),
+                description=cycle_data.get('description', ''),
+                start_date=cycle_data.get('start_date'),
+                end_date=cycle_data.get('end_date'),
+                owned_by=cycle_data.get('owned_by'),
+                line=line
+            )
+        except yaml.YAMLError as e:
+            self._problem(line, 'error', f"Cycle YAML 파싱 오류: {cycle_name} - {e}")
+            return None
 
-            except yaml.YAMLError as e:
-                print(f"⚠️  Module YAML 파싱 오류: {module_name} - {e}")
+    def _build_module(self, module_name: str, yaml_text: Optional[str],
+                      issues: List[Issue], line: int = 0) -> Optional[Module]:
+        """### Module N: 이름 + YAML + Issues → Module"""
+        if yaml_text is None:
+            self._problem(line, 'error', f"Module YAML을 찾을 수 없음: {module_name}")
+            return None
 
-    def _parse_issues_in_module(self, module_text: str) -> List[Issue]:
-        """Module 내의 Issues 파싱"""
-        issues = []
+        try:
+            module_data = self._mapping(self._load_yaml(yaml_text), line, f"Module {module_name}")
+            return Module(
+                name=module_data.get('name', module_name),
+                description=module_data.get('description', ''),
+                start_date=module_data.get('start_date'),
+                target_date=module_data.get('target_date'),
+                lead=module_data.get('lead'),
+                members=_names(module_data.get('members')),
+                status=module_data.get('status', 'planned'),
+                line=line,
+                issues=issues
+            )
+        except yaml.YAMLError as e:
+            self._problem(line, 'error', f"Module YAML 파싱 오류: {module_name} - {e}")
+            return None
 
-        # Issue 패턴: #### PROJ-XXX: 제목 (Xpt, Priority)
-        issue_pattern = r'####\s+' + self.project_identifier + r'-(\d+):\s+(.+?)(?=####|###|\Z)'
-        issue_blocks = re.finditer(issue_pattern, module_text, re.DOTALL)
+    def _build_issue(self, identifier: str, title_line: str, yaml_text: Optional[str],
+                     span: Optional[Tuple[int, int]] = None, line: int = 0) -> Issue:
+        """#### PROJ-XXX: 제목 (Xpt, Priority) + YAML → Issue"""
+        # (Xpt, Priority) 제거하여 순수 제목 추출
+        clean_title = self.POINTS_RE.sub('', title_line.strip()).strip()
 
-        for issue_match in issue_blocks:
-            issue_number = issue_match.group(1)
-            issue_text = issue_match.group(0)
+        if yaml_text is None:
+            # YAML 없으면 기본값으로 생성
+            self._problem(line, 'error', f"Issue {identifier}: YAML 블록이 없음 (```yaml 펜스 확인)")
+            return Issue(name=clean_title, identifier=identifier, line=line)
 
-            # 제목 파싱: "제목 (8pt, High)" 형식
-            title_line = issue_match.group(2).split('\n')[0].strip()
+        try:
+            lazy = span is not None
+            issue_data = self._mapping(
+                self._load_yaml(yaml_text, drop='description_html' if lazy else None),
+                line, f"Issue {identifier}")
 
-            # (Xpt, Priority) 제거하여 순수 제목 추출
-            clean_title = re.sub(r'\s*\(\d+pt,\s*\w+\)', '', title_line).strip()
+            description = issue_data.get('description_html', '')
+            if lazy and 'description_html' in issue_data:
+                digest = hashlib.blake2b(yaml_text.encode('utf-8'), digest_size=8).digest()
+                description = DescriptionRef(self.source_path, span[0], span[1], digest)
 
-            # YAML 블록 파싱
-            yaml_match = re.search(r'```yaml\n(.+?)\n```', issue_text, re.DOTALL)
+            state = issue_data.get('state')
+            return Issue(
+                name=clean_title,
+                description_html=description,
+                priority=self._normalize_priority(issue_data.get('priority', 'medium'),
+                                                  line, identifier),
+                assignees=_names(issue_data.get('assignees')),
+                labels=_names(issue_data.get('labels')),
+                start_date=issue_data.get('start_date'),
+                target_date=issue_data.get('target_date'),
+                estimate_point=issue_data.get('estimate_point'),
+                state=sys.intern(state) if isinstance(state, str) else state,
+                identifier=identifier,
+                line=line
+            )
 
-            if not yaml_match:
-                # YAML 없으면 기본값으로 생성
-                issue = Issue(name=clean_title)
-                issues.append(issue)
-                continue
+        except yaml.YAMLError as e:
+            self._problem(line, 'error', f"Issue YAML 파싱 오류: {identifier} - {e}")
+            # 에러 발생 시에도 기본 Issue 생성
+            return Issue(name=clean_title, identifier=identifier, line=line)
 
-            try:
-                issue_data = yaml.safe_load(yaml_match.group(1))
-
-                issue = Issue(
-                    name=clean_title,
-                    description_html=issue_data.get('description_html', ''),
-                    priority=self._normalize_priority(issue_data.get('priority', 'medium')),
-                    assignees=issue_data.get('assignees', []),
-                    labels=issue_data.get('labels', []),
-                    start_date=issue_data.get('start_date'),
-                    target_date=issue_data.get('target_date'),
-                    estimate_point=issue_data.get('estimate_point'),
-                    state=issue_data.get('state')
-                )
-
-                issues.append(issue)
-
-            except yaml.YAMLError as e:
-                print(f"⚠️  Issue YAML 파싱 오류: {clean_title} - {e}")
-                # 에러 발생 시에도 기본 Issue 생성
-                issues.append(Issue(name=clean_title))
-
-        return issues
-
-    def _normalize_priority(self, priority: str) -> str:
-        """우선순위 정규화"""
+    def _mapping(self, data, line: int, label: str) -> Dict:
+        """YAML 블록 내용이 매핑이 아니면 오류로 기록하고 빈 dict"""
+        if isinstance(data, dict):
+            return data
+        if data is not None:
+            self._problem(line, 'error', f"{label}: YAML 블록이 '키: 값' 형식이 아님")
+        return {}
+
+    def _problem(self, line: int, level: str, message: str):
+        self.problems.append((line, level, message))
+
+    def _load_yaml(self, text: str, drop: Optional[str] = None):
+        """
+        YAML 블록 로드 (block_cache에 같은 블록이 있으면 재사용)
+
+        drop 키는 값을 None으로 바꿔 yaml_blocks에 저장한다 (설명을 캐시에 들고 있지 않도록).
+        """
+        if self.block_cache is None:
+            return _yaml_load(text)
+        key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+        if key in self.block_cache:
+            data = self.block_cache[key]
+            self.blocks_reused += 1
+        else:
+            data = _yaml_load(text)
+        stored = data
+        if drop and isinstance(data, dict) and data.get(drop) is not None:
+            stored = dict(data)
+            stored[drop] = None
+        self.yaml_blocks[key] = stored
+        return data
+
+    def _normalize_priority(self, priority: str, line: int = 0,
+                            identifier: Optional[str] = None) -> str:
+        """우선순위 정규화 (알 수 없는 값은 medium으로 바꾸고 오류로 기록)"""
         priority_map = {
             'urgent': 'urgent',
             'high': 'high',
@@ -265,363 +594,4298 @@ class YAMLMarkdownParser:
             'low': 'low',
             'none': 'none'
         }
-        return priority_map.get(priority.lower(), 'medium')
+        normalized = priority_map.get(str(priority).lower())
+        if normalized is None:
+            self._problem(line, 'error', f"Issue {identifier}: 알 수 없는 priority: {priority!r} "
+                                         f"({', '.join(priority_map)} 중 하나)")
+            return 'medium'
+        return normalized
 
 
-class PlaneAPIClient:
-    """Plane API 클라이언트"""
+def _iter_file_lines(path: str, newline: Optional[str] = None) -> Iterator[str]:
+    """파일을 줄 단위로 읽는 제너레이터 (다 읽으면 닫힘)"""
+    with open(path, 'r', encoding='utf-8', newline=newline) as f:
+        for line in f:
+            yield line
 
-    def __init__(self, api_url: str, api_key: str, workspace_slug: str, project_id: str):
-        self.api_url = api_url.rstrip('/')
-        self.workspace_slug = workspace_slug
-        self.project_id = project_id
-        self.headers = {
-            'x-api-key': api_key,
-            'Content-Type': 'application/json'
-        }
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
 
-    def create_module(self, module: Module) -> Optional[str]:
-        """모듈 생성 (Rate Limit 재시도 포함)"""
-        url = f"{self.api_url}/api/v1/workspaces/{self.workspace_slug}/projects/{self.project_id}/modules/"
+def percentile(values: List[float], pct: float) -> float:
+    """nearest-rank 백분위수 (values는 정렬된 상태)"""
+    if not values:
+        return 0.0
+    rank = max(1, -(-len(values) * pct // 100))
+    return values[int(rank) - 1]
 
-        payload = {
-            "name": module.name,
-            "description": module.description,
-            "status": module.status,
-        }
 
-        if module.start_date:
-            payload["start_date"] = module.start_date
-        if module.target_date:
-            payload["target_date"] = module.target_date
+class Instrumentation:
+    """
+    실행 계측: 구간 타이머와 HTTP 요청 기록 (스레드 안전)
 
-        # Rate Limit 재시도 로직
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                response = self.session.post(url, json=payload)
-
-                if response.status_code == 201:
-                    module_id = response.json().get('id')
-                    print(f"✅ Module 생성: {module.name} (ID: {module_id})")
-                    time.sleep(0.5)  # API Rate Limit 대응
-                    return module_id
-                elif response.status_code == 429:
-                    wait_time = 5 * (attempt + 1)  # 5초, 10초, 15초
-                    print(f"⏳ Rate Limit! {wait_time}초 대기 후 재시도... (시도 {attempt + 1}/{max_retries})")
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    print(f"❌ Module 생성 실패: {module.name}")
-                    print(f"   Status: {response.status_code}")
-                    print(f"   Response: {response.text}")
-                    return None
-            except Exception as e:
-                print(f"❌ Module 생성 오류: {module.name} - {str(e)}")
-                return None
+    파싱 / 메타데이터 / 업로드 단계는 span()으로, PlaneAPIClient의 모든 HTTP
+    요청(재시도 포함)은 request()로, Rate Limit 대기는 'throttle' 구간으로 기록된다.
+    add_hook()으로 등록한 함수는 이벤트가 끝날 때마다 이벤트 dict를 받는다.
 
-        print(f"❌ Module 생성 최종 실패 (Rate Limit 초과): {module.name}")
-        return None
+        {"type": "span", "name": "parse", "cat": "parse", "ts": 0.01, "dur": 0.2,
+         "thread": "MainThread", "args": {"path": "..."}}
+        {"type": "request", "method": "POST", "endpoint": "issues/", "status": 201,
+         "attempt": 0, "ts": 0.3, "dur": 0.012, "bytes_sent": 812,
+         "bytes_received": 640, "thread": "upload_0", "error": null}
 
-    def create_issue(self, issue: Issue, module_id: Optional[str] = None) -> Optional[str]:
-        """이슈 생성 (Rate Limit 재시도 포함)"""
-        url = f"{self.api_url}/api/v1/workspaces/{self.workspace_slug}/projects/{self.project_id}/issues/"
+    ts / dur는 초 단위 (ts는 계측 시작 기준). record=False면 이벤트를 보관하지
+    않고 훅만 호출하므로 보고서가 필요 없을 때 비용이 거의 없다.
+    """
 
-        payload = {
-            "name": issue.name,
-            "description_html": issue.description_html or "<p>내용 없음</p>",
-            "priority": issue.priority,
-        }
+    def __init__(self, record: bool = False):
+        self.record = record
+        self.events: List[Dict] = []
+        self.info: Dict = {}  # 보고서에 함께 쓸 실행 정보
+        self.started = time.perf_counter()
+        self.started_wall = time.time()
+        self._hooks: List = []
+        self._lock = threading.Lock()
 
-        if issue.start_date:
-            payload["start_date"] = issue.start_date
-        if issue.target_date:
-            payload["target_date"] = issue.target_date
+    def add_hook(self, hook):
+        """이벤트마다 hook(event)를 호출 (요청을 보낸 스레드에서 호출됨)"""
+        self._hooks.append(hook)
 
-        # Rate Limit 재시도 로직
-        max_retries = 3
-        for attempt in range(max_retries):
-            try:
-                response = self.session.post(url, json=payload)
-
-                if response.status_code == 201:
-                    issue_id = response.json().get('id')
-                    print(f"  ✅ Issue 생성: {issue.name}")
-
-                    # 모듈에 이슈 연결
-                    if module_id:
-                        self._add_issue_to_module(module_id, issue_id)
-
-                    time.sleep(0.3)  # API Rate Limit 대응
-                    return issue_id
-                elif response.status_code == 429:
-                    wait_time = 5 * (attempt + 1)
-                    print(f"  ⏳ Rate Limit! {wait_time}초 대기 후 재시도... (시도 {attempt + 1}/{max_retries})")
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    print(f"  ❌ Issue 생성 실패: {issue.name}")
-                    print(f"     Status: {response.status_code}")
-                    print(f"     Response: {response.text}")
-                    return None
-            except Exception as e:
-                print(f"  ❌ Issue 생성 오류: {issue.name} - {str(e)}")
-                return None
+    @contextlib.contextmanager
+    def span(self, name: str, cat: str, **args):
+        """with 블록의 실행 시간을 구간 이벤트로 기록"""
+        if not (self.record or self._hooks):
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.emit({'type': 'span', 'name': name, 'cat': cat,
+                       'ts': started - self.started, 'dur': time.perf_counter() - started,
+                       'thread': threading.current_thread().name, 'args': args})
 
-        print(f"  ❌ Issue 생성 최종 실패 (Rate Limit 초과): {issue.name}")
-        return None
+    def add_span(self, name: str, cat: str, started_wall: float, duration: float,
+                 thread: str, **args):
+        """다른 프로세스에서 잰 구간 기록 (started_wall은 time.time() 값)"""
+        self.emit({'type': 'span', 'name': name, 'cat': cat,
+                   'ts': started_wall - self.started_wall, 'dur': duration,
+                   'thread': thread, 'args': args})
+
+    def request(self, method: str, endpoint: str, status: Optional[int], attempt: int,
+                started: float, duration: float, bytes_sent: int = 0,
+                bytes_received: int = 0, error: Optional[str] = None,
+                thread: Optional[str] = None):
+        """HTTP 요청 1회 기록 (started는 time.perf_counter() 값, thread 기본값은 현재 스레드)"""
+        if not (self.record or self._hooks):
+            return
+        self.emit({'type': 'request', 'method': method, 'endpoint': endpoint,
+                   'status': status, 'attempt': attempt, 'ts': started - self.started,
+                   'dur': duration, 'bytes_sent': bytes_sent,
+                   'bytes_received': bytes_received,
+                   'thread': thread or threading.current_thread().name, 'error': error})
 
-    def _add_issue_to_module(self, module_id: str, issue_id: str):
-        """모듈에 이슈 추가"""
-        url = f"{self.api_url}/api/v1/workspaces/{self.workspace_slug}/projects/{self.project_id}/modules/{module_id}/module-issues/"
+    def emit(self, event: Dict):
+        if self.record:
+            with self._lock:
+                self.events.append(event)
+        for hook in self._hooks:
+            hook(event)
 
-        payload = {"issues": [issue_id]}
+    def summary(self) -> Dict:
+        """
+        기록된 이벤트 집계
 
-        try:
-            response = self.session.post(url, json=payload)
-            if response.status_code in [200, 201]:
-                print(f"     → Module에 연결됨")
-                return True
-            else:
-                print(f"     ⚠️  Module 연결 실패 (Status: {response.status_code})")
-                return False
-        except Exception as e:
-            print(f"     ⚠️  Module 연결 오류: {str(e)}")
-            return False
+        phases: 구간 종류별 시간 합계 (throttle은 워커 합산)
+        requests / endpoints: 요청 수, 상태 코드, 재시도, 전송량, 지연 백분위수
+        """
+        with self._lock:
+            events = list(self.events)
 
-    def create_cycle(self, cycle: Cycle) -> Optional[str]:
-        """사이클 생성"""
-        url = f"{self.api_url}/api/v1/workspaces/{self.workspace_slug}/projects/{self.project_id}/cycles/"
+        phases: Dict[str, float] = {}
+        endpoints: Dict[str, Dict] = {}
+        latencies: Dict[str, List[float]] = {}
+        for event in events:
+            if event['type'] == 'span':
+                phases[event['cat']] = phases.get(event['cat'], 0.0) + event['dur']
+                continue
 
-        payload = {
-            "name": cycle.name,
-            "description": cycle.description,
-            "project_id": self.project_id,
+            for key in ('*', f"{event['method']} {event['endpoint']}"):
+                stats = endpoints.setdefault(key, {
+                    'count': 0, 'statuses': {}, 'errors': 0, 'retries': 0,
+                    'bytes_sent': 0, 'bytes_received': 0, 'seconds': 0.0,
+                })
+                stats['count'] += 1
+                status = str(event['status']) if event['status'] is not None else 'error'
+                stats['statuses'][status] = stats['statuses'].get(status, 0) + 1
+                if event['error'] or (event['status'] or 0) >= 400:
+                    stats['errors'] += 1
+                if event['attempt']:
+                    stats['retries'] += 1
+                stats['bytes_sent'] += event['bytes_sent']
+                stats['bytes_received'] += event['bytes_received']
+                stats['seconds'] += event['dur']
+                latencies.setdefault(key, []).append(event['dur'])
+
+        for key, stats in endpoints.items():
+            values = sorted(latencies[key])
+            stats['seconds'] = round(stats['seconds'], 6)
+            stats['latency_ms'] = {
+                name: round(percentile(values, pct) * 1000, 3)
+                for name, pct in (('p50', 50), ('p95', 95), ('p99', 99), ('max', 100))
+            }
+
+        total = endpoints.pop('*', None)
+        return {
+            'wall_seconds': round(time.perf_counter() - self.started, 6),
+            'phases': {cat: round(seconds, 6) for cat, seconds in sorted(phases.items())},
+            'requests': total or {'count': 0},
+            'endpoints': dict(sorted(endpoints.items())),
         }
 
-        if cycle.start_date:
-            payload["start_date"] = cycle.start_date
-        if cycle.end_date:
-            payload["end_date"] = cycle.end_date
+    def write_report(self, path: str):
+        """
+        실행 보고서 저장
 
-        try:
-            response = self.session.post(url, json=payload)
+        .ndjson / .jsonl이면 한 줄에 이벤트 하나 + 마지막 줄에 요약,
+        그 밖에는 {"info", "summary", "events"} JSON 문서 하나.
+        """
+        summary = self.summary()
+        with self._lock:
+            events = list(self.events)
 
-            if response.status_code == 201:
-                cycle_id = response.json().get('id')
-                print(f"✅ Cycle 생성: {cycle.name} (ID: {cycle_id})")
-                return cycle_id
+        with open(path, 'w', encoding='utf-8') as f:
+            if path.endswith(('.ndjson', '.jsonl')):
+                for event in events:
+                    f.write(json.dumps(event, ensure_ascii=False) + '\n')
+                f.write(json.dumps(dict(type='summary', info=self.info, **summary),
+                                   ensure_ascii=False) + '\n')
             else:
-                print(f"❌ Cycle 생성 실패: {cycle.name}")
-                print(f"   Status: {response.status_code}")
-                print(f"   Response: {response.text}")
-                return None
-        except Exception as e:
-            print(f"❌ Cycle 생성 오류: {cycle.name} - {str(e)}")
-            return None
-
-    def add_issues_to_cycle(self, cycle_id: str, issue_ids: List[str]) -> bool:
-        """사이클에 이슈들 추가"""
-        if not issue_ids:
-            return True
+                json.dump({'info': self.info, 'summary': summary, 'events': events},
+                          f, ensure_ascii=False, indent=2)
 
-        url = f"{self.api_url}/api/v1/workspaces/{self.workspace_slug}/projects/{self.project_id}/cycles/{cycle_id}/cycle-issues/"
+    def write_trace(self, path: str):
+        """
+        Chrome trace 형식 타임라인 저장
 
-        payload = {"issues": issue_ids}
+        chrome://tracing, https://ui.perfetto.dev, speedscope 등에서 열 수 있다.
+        스레드마다 한 줄로, 구간과 요청이 막대로 표시된다.
+        """
+        with self._lock:
+            events = list(self.events)
 
-        try:
-            response = self.session.post(url, json=payload)
-            if response.status_code in [200, 201]:
-                print(f"  → Cycle에 {len(issue_ids)}개 Issue 연결됨")
-                return True
+        pid = os.getpid()
+        threads: Dict[str, int] = {}
+        trace = []
+        for event in events:
+            tid = threads.setdefault(event['thread'], len(threads) + 1)
+            if event['type'] == 'span':
+                name, cat, args = event['name'], event['cat'], event['args']
             else:
-                print(f"  ⚠️  Cycle 연결 실패 (Status: {response.status_code})")
-                if response.status_code == 400:
-                    print(f"     {response.text}")
-                return False
-        except Exception as e:
-            print(f"  ⚠️  Cycle 연결 오류: {str(e)}")
-            return False
+                name, cat = f"{event['method']} {event['endpoint']}", 'http'
+                args = {k: event[k] for k in ('status', 'attempt', 'bytes_sent',
+                                              'bytes_received', 'error')}
+            trace.append({'name': name, 'cat': cat, 'ph': 'X', 'pid': pid, 'tid': tid,
+                          'ts': round(event['ts'] * 1e6, 1),
+                          'dur': round(event['dur'] * 1e6, 1), 'args': args})
 
+        trace += [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid,
+                   'args': {'name': thread}} for thread, tid in threads.items()]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': trace, 'displayTimeUnit': 'ms'}, f, ensure_ascii=False)
 
-def main():
-    parser = argparse.ArgumentParser(
-        description='PLANE_PROJECT_TEMPLATE.md 기반 기획서를 Plane으로 업로드',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-사용 예시:
-  python md_to_plane.py plans/my-service.md \\
-      --workspace pluck \\
-      --project abc123-def456 \\
-      --api-key your-api-key \\
-      --api-url http://localhost:8090
-        """
-    )
 
-    parser.add_argument('md_file', help='기획서 마크다운 파일 경로')
-    parser.add_argument('--workspace', '-w', required=True, help='Plane workspace slug')
-    parser.add_argument('--project', '-p', required=True, help='Plane project ID (UUID)')
-    parser.add_argument('--api-key', '-k', required=True, help='Plane API key')
-    parser.add_argument('--api-url', default='http://localhost:8090',
-                       help='Plane API URL (기본값: http://localhost:8090)')
-    parser.add_argument('--dry-run', action='store_true',
-                       help='실제 생성 없이 파싱 결과만 출력')
-    parser.add_argument('--yes', '-y', action='store_true',
-                       help='확인 프롬프트 건너뛰기')
+class RateLimiter:
+    """
+    토큰 버킷 기반 요청 속도 제한기 (스레드 안전)
 
-    args = parser.parse_args()
+    모든 PlaneAPIClient 요청은 보내기 전에 reserve()로 토큰을 예약하고 필요한 만큼 기다린다.
+    응답의 X-RateLimit-Limit / X-RateLimit-Remaining / X-RateLimit-Reset 헤더로
+    서버가 알려주는 예산에 버킷을 맞추고, 429 응답이면 Retry-After(없으면
+    지수 백오프 + 지터)만큼 모든 요청을 함께 멈춘다.
 
-    # 1. MD 파일 읽기
-    print(f"\n📖 기획서 읽는 중: {args.md_file}")
-    try:
-        with open(args.md_file, 'r', encoding='utf-8') as f:
-            md_content = f.read()
-    except FileNotFoundError:
-        print(f"❌ 파일을 찾을 수 없습니다: {args.md_file}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"❌ 파일 읽기 오류: {str(e)}")
-        sys.exit(1)
+    통계:
+        requests: acquire() 호출 수
+        throttled_seconds / throttle_events: 속도 제한으로 대기한 시간 / 횟수
+        rate_limited: 429 응답 수
+    """
 
-    # 2. 파싱
-    print("🔍 YAML 구조 분석 중...\n")
-    parser_obj = YAMLMarkdownParser(md_content)
-    modules = parser_obj.parse()
+    def __init__(self, rate_per_minute: float = 60, burst: Optional[float] = None,
+                 window: float = 60.0, max_backoff: float = 60.0):
+        self.window = window
+        self.max_backoff = max_backoff
+        self.rate = rate_per_minute / window if rate_per_minute > 0 else 0.0  # 초당 토큰
+        self.capacity = float(burst or rate_per_minute or 1)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
 
-    # 3. 파싱 결과 출력
-    print("=" * 70)
-    print("📊 파싱 결과")
-    print("=" * 70)
+        self.requests = 0
+        self.throttled_seconds = 0.0
+        self.throttle_events = 0
+        self.rate_limited = 0
 
-    total_issues = 0
-    total_story_points = 0
+    def acquire(self):
+        """요청 1회분 토큰을 받을 때까지 대기"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
 
-    for module in modules:
-        issue_count = len(module.issues)
-        total_issues += issue_count
+    def reserve(self) -> float:
+        """토큰 1개를 예약하고 기다려야 할 시간(초)을 반환 (부족분은 빚으로 남김)"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.requests += 1
 
-        # Story Points 합계
-        module_points = sum(
-            issue.estimate_point for issue in module.issues
-            if issue.estimate_point is not None
-        )
-        total_story_points += module_points
+            wait = max(0.0, self.blocked_until - now)
+            if self.rate > 0:
+                self.tokens -= 1
+                if self.tokens < 0:
+                    wait = max(wait, -self.tokens / self.rate)
 
-        print(f"\n📦 Module: {module.name}")
-        print(f"   기간: {module.start_date or 'N/A'} ~ {module.target_date or 'N/A'}")
-        print(f"   Issues: {issue_count}개, Story Points: {module_points}pt")
+            if wait > 0:
+                self.throttle_events += 1
+                self.throttled_seconds += wait
+            return wait
 
-        for issue in module.issues:
-            priority_emoji = {
-                'urgent': '🔥',
-                'high': '⚡',
-                'medium': '📌',
-                'low': '💤',
-                'none': '⚪'
-            }.get(issue.priority, '📌')
+    def observe(self, headers):
+        """응답 헤더의 Rate Limit 정보로 버킷 갱신"""
+        limit = _header_number(headers, 'X-RateLimit-Limit')
+        remaining = _header_number(headers, 'X-RateLimit-Remaining')
+        reset = _header_number(headers, 'X-RateLimit-Reset')
 
-            points_str = f"{issue.estimate_point}pt" if issue.estimate_point else "?pt"
-            labels_str = f" [{', '.join(issue.labels)}]" if issue.labels else ""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
 
-            print(f"    {priority_emoji} {issue.name} ({points_str}){labels_str}")
+            if limit and limit > 0:
+                self.capacity = limit
+                self.rate = limit / self.window
 
-    print("\n" + "=" * 70)
-    print(f"총 {len(modules)}개 Module, {total_issues}개 Issue, {total_story_points}pt")
-    print("=" * 70)
+            if remaining is not None:
+                self.tokens = min(self.tokens, remaining)
+                if remaining <= 0 and reset is not None:
+                    self.blocked_until = max(self.blocked_until, now + _reset_delay(reset))
 
-    # Dry run이면 종료
-    if args.dry_run:
-        print("\n✅ Dry-run 모드: 실제 생성하지 않고 종료합니다.")
-        return
+    def backoff(self, headers, attempt: int) -> float:
+        """429 응답 처리: 모든 요청을 멈출 시간(초)을 정하고 반환"""
+        retry_after = _retry_after_seconds(headers.get('Retry-After'))
+        if retry_after is not None:
+            delay = retry_after + random.uniform(0, min(1.0, retry_after * 0.1))
+        else:
+            ceiling = min(self.max_backoff, 2 ** attempt)
+            delay = ceiling / 2 + random.uniform(0, ceiling / 2)
 
-    # 4. 사용자 확인
-    print(f"\n🎯 업로드 대상:")
-    print(f"   API URL: {args.api_url}")
-    print(f"   Workspace: {args.workspace}")
-    print(f"   Project: {args.project}")
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate_limited += 1
+            self.tokens = min(self.tokens, 0.0)
+            self.blocked_until = max(self.blocked_until, now + delay)
+            wait = self.blocked_until - now
+            self.throttle_events += 1
+            self.throttled_seconds += wait
+        return wait
 
-    if not args.yes:
-        confirm = input("\n🚀 Plane에 업로드하시겠습니까? (y/n): ")
-        if confirm.lower() != 'y':
-            print("❌ 취소되었습니다.")
+    def stats(self) -> Dict[str, float]:
+        """통계 스냅샷"""
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'throttled_seconds': round(self.throttled_seconds, 3),
+                'throttle_events': self.throttle_events,
+                'rate_limited': self.rate_limited,
+            }
+
+    def _refill(self, now: float):
+        if self.rate > 0:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+def _header_number(headers, name: str) -> Optional[float]:
+    """숫자 헤더 값 (없거나 잘못되면 None)"""
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _reset_delay(reset: float) -> float:
+    """X-RateLimit-Reset 값을 남은 초로 변환 (epoch 타임스탬프 / 초 모두 허용)"""
+    if reset > 1_000_000_000:
+        return max(0.0, reset - time.time())
+    return max(0.0, reset)
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP-date)를 초로 변환"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime  # HTTP-date 형식일 때만 필요
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _connect_retry(retries: int) -> 'Retry':
+    """
+    urllib3 재시도 정책: 연결 실패는 모든 메서드, 읽기 중 끊김은 멱등 메서드만 재시도
+
+    HTTP 상태 코드(429 등)는 재시도하지 않고 PlaneAPIClient._request가 처리한다.
+    """
+    from urllib3.util.retry import Retry
+
+    options = dict(total=retries, connect=retries, read=retries, redirect=0, status=0,
+                   backoff_factor=0.2, raise_on_status=False)
+    idempotent = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'PATCH', 'DELETE'])
+    try:
+        return Retry(allowed_methods=idempotent, **options)
+    except TypeError:  # urllib3 < 1.26
+        return Retry(method_whitelist=idempotent, **options)
+
+
+class DescriptionRenderer:
+    """
+    Issue 설명(description_html) 전처리: 요청 본문을 만들기 전에 한 번만 렌더링
+
+    단계 (켠 것만, 이 순서로):
+      - templates: {{ 이름 }}을 템플릿 파일의 내용으로 바꿈 (템플릿 안의 {{ }}도 펼침)
+      - use_markdown: Markdown → HTML (markdown 패키지, HTML 블록은 그대로 둠)
+      - minify: 태그 사이 줄바꿈과 연속 공백을 줄임 (<pre> 안은 그대로)
+    빈 설명은 PLACEHOLDER로 바꾼다 (Plane이 빈 설명을 받지 않음).
+
+    설명은 제목(<h1>~<h6>, # 제목) 단위 구역으로 나눠 구역 내용을 키로 캐시한다.
+    <pre> 블록과 ``` / ~~~ 코드 블록 안의 # 줄에서는 나누지 않는다.
+    완료 조건 / 체크리스트처럼 여러 Issue에 반복되는 구역은 한 번만 렌더링되고,
+    같은 Issue의 요청 본문을 여러 번 만들어도(동기화 해시, 생성, 비교) 다시 하지 않는다.
+    단계를 하나도 켜지 않으면 캐시 없이 원문을 그대로 돌려준다.
+    동기화 해시는 렌더링된 본문으로 계산하므로 단계를 바꾸면 --sync에서 Issue가 한 번씩 수정된다.
+    """
+
+    PLACEHOLDER = "<p>내용 없음</p>"
+    SECTION = re.compile(r'(?m)^(?=[ \t]*(?:<h[1-6][\s>]|#{1,6}[ \t]))')
+    TEMPLATE = re.compile(r'\{\{\s*([\w.-]+)\s*\}\}')
+    MAX_TEMPLATE_DEPTH = 8
+    _TAG_GAP = re.compile(r'>\s*\n\s*<')
+    _SPACES = re.compile(r'\s+')
+    _PRE = re.compile(r'(<pre\b.*?</pre>)', re.IGNORECASE | re.DOTALL)
+    # 구역을 나누지 않는 블록 (닫히지 않았으면 설명 끝까지)
+    _VERBATIM = re.compile(r'<pre\b.*?(?:</pre>|\Z)'
+                           r'|^[ \t]*(`{3,}|~{3,}).*?(?:^[ \t]*\1[ \t]*$|\Z)',
+                           re.IGNORECASE | re.DOTALL | re.MULTILINE)
+
+    def __init__(self, templates: Optional[Dict[str, str]] = None, use_markdown: bool = False,
+                 minify: bool = False):
+        self.templates = templates or {}
+        self.use_markdown = use_markdown
+        self.minify = minify
+        self.enabled = bool(self.templates or use_markdown or minify)
+        self._descriptions: Dict[str, str] = {}  # 설명 원문 → 렌더링 결과
+        self._sections: Dict[str, str] = {}      # 구역 원문 → 렌더링 결과
+        self._markdown = None
+        self._lock = threading.Lock()
+        self.missing_templates: set = set()
+        self.stats = {'descriptions': 0, 'sections': 0, 'rendered': 0,
+                      'raw_bytes': 0, 'rendered_bytes': 0}
+
+    @staticmethod
+    def load_templates(path: str) -> Dict[str, str]:
+        """템플릿 파일(YAML: 이름 → 내용) 읽기 (형식이 틀리면 ValueError)"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = _yaml_load(f.read()) or {}
+        if not isinstance(data, dict) or not all(isinstance(v, str) for v in data.values()):
+            raise ValueError("'이름: 내용' 형식의 YAML이어야 합니다")
+        return {str(name): value for name, value in data.items()}
+
+    def render(self, description: str) -> str:
+        """설명 원문 → 요청 본문에 넣을 HTML"""
+        if not self.enabled:
+            return description or self.PLACEHOLDER
+        rendered = self._descriptions.get(description)
+        if rendered is None:
+            sections = self._split(description or '')
+            rendered = ''.join(self._render_section(section) for section in sections)
+            rendered = sys.intern(rendered or self.PLACEHOLDER)  # 같은 결과는 문자열 하나로
+            with self._lock:
+                if description not in self._descriptions:
+                    self._descriptions[description] = rendered
+                    self.stats['descriptions'] += 1
+                    self.stats['sections'] += len(sections)
+                    self.stats['raw_bytes'] += len(description.encode('utf-8'))
+                    self.stats['rendered_bytes'] += len(rendered.encode('utf-8'))
+        return rendered
+
+    def _split(self, text: str) -> List[str]:
+        """제목 줄 앞에서 구역 나누기 (<pre> / 코드 블록 안은 제외, 빈 구역은 버림)"""
+        verbatim = [match.span() for match in self._VERBATIM.finditer(text)]
+        cuts = [0] + [match.start() for match in self.SECTION.finditer(text)
+                      if not any(start < match.start() < end for start, end in verbatim)]
+        cuts.append(len(text))
+        return [text[start:end] for start, end in zip(cuts, cuts[1:]) if end > start]
+
+    def _render_section(self, section: str) -> str:
+        rendered = self._sections.get(section)
+        if rendered is not None:
+            return rendered
+        html = self._expand(section)
+        if self.use_markdown:
+            html = self._to_html(html)
+        if self.minify:
+            html = self._minify(html)
+        with self._lock:
+            self._sections.setdefault(section, html)
+            self.stats['rendered'] += 1
+        return html
+
+    def _expand(self, text: str, depth: int = 0) -> str:
+        """{{ 이름 }} 템플릿 펼치기 (없는 이름은 그대로 두고 기록)"""
+        if not self.templates or depth >= self.MAX_TEMPLATE_DEPTH:
+            return text
+
+        def substitute(match):
+            name = match.group(1)
+            if name not in self.templates:
+                self.missing_templates.add(name)
+                return match.group(0)
+            return self._expand(self.templates[name], depth + 1)
+
+        return self.TEMPLATE.sub(substitute, text)
+
+    def _to_html(self, text: str) -> str:
+        if self._markdown is None:
+            self._markdown = markdown.Markdown(extensions=['extra', 'sane_lists'])
+        with self._lock:  # Markdown 객체는 스레드 안전하지 않음
+            return self._markdown.reset().convert(text)
+
+    def _minify(self, html: str) -> str:
+        parts = self._PRE.split(html)
+        for i in range(0, len(parts), 2):  # 짝수 번째가 <pre> 밖
+            parts[i] = self._SPACES.sub(' ', self._TAG_GAP.sub('><', parts[i]))
+        return ''.join(parts).strip()
+
+    def summary(self) -> Optional[str]:
+        """실행 요약 한 줄 (단계를 켜지 않았으면 None)"""
+        if not self.enabled or not self.stats['descriptions']:
+            return None
+        stats = self.stats
+        saved = stats['raw_bytes'] - stats['rendered_bytes']
+        ratio = abs(saved) / stats['raw_bytes'] * 100 if stats['raw_bytes'] else 0.0
+        return (f"설명 {stats['descriptions']}개 (구역 {stats['sections']}개 중 "
+                f"{stats['rendered']}개만 렌더링), {stats['raw_bytes'] / 1024:.1f}KB → "
+                f"{stats['rendered_bytes'] / 1024:.1f}KB "
+                f"({ratio:.0f}% {'절약' if saved >= 0 else '증가'})")
+
+
+class PlaneAPIClient:
+    """
+    Plane API 클라이언트
+
+    연결:
+        pool_size: 호스트당 유지할 keep-alive 연결 수 (동시 요청 수 이상으로)
+        timeout: (연결, 응답) 타임아웃 초
+        connect_retries: 연결 실패 / 끊긴 keep-alive 연결 재시도 횟수.
+            POST는 서버에 도달하지 않은 연결 오류만 재시도한다 (중복 생성 방지).
+        gzip_min_bytes: 이 크기 이상의 요청 본문은 gzip으로 압축 (None = 사용 안 함).
+            서버가 압축 요청을 415로 (또는 Content-Encoding을 언급한 400으로) 거부하면
+            압축을 끄고 원본으로 다시 보낸다. 다른 400(검증 오류 등)은 그대로 반환한다.
+
+    일괄 생성:
+        bulk_size: 새 Issue를 issues/bulk-create/ 한 번에 보낼 개수 (0/1 = 사용 안 함).
+            detect_bulk_issues()로 엔드포인트가 있는지 확인한 뒤에만 쓰며,
+            없거나 묶음이 실패하면 Issue마다 만드는 기존 경로로 넘어간다.
+
+    계측:
+        instrumentation: 요청마다 (메서드, 엔드포인트, 상태, 지연, 시도 번호, 전송량)과
+            Rate Limit 대기 구간을 기록 (Instrumentation 참고)
+
+    설명:
+        descriptions: Issue 설명 전처리 (DescriptionRenderer, 기본값은 빈 설명만 바꿈)
+    """
+
+    def __init__(self, api_url: str, api_key: str, workspace_slug: str, project_id: str,
+                 rate_limiter: Optional[RateLimiter] = None, max_retries: int = 5,
+                 link_chunk_size: int = 100, pool_size: int = 10,
+                 timeout: Tuple[float, float] = (5.0, 30.0), connect_retries: int = 3,
+                 gzip_min_bytes: Optional[int] = None, bulk_size: int = 0,
+                 instrumentation: Optional[Instrumentation] = None,
+                 descriptions: Optional[DescriptionRenderer] = None):
+        self.api_url = api_url.rstrip('/')
+        self.workspace_slug = workspace_slug
+        self.project_id = project_id
+        self.headers = {
+            'x-api-key': api_key,
+            'Content-Type': 'application/json'
+        }
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=max(1, pool_size),
+                              max_retries=_connect_retry(connect_retries))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.timeout = timeout
+        self.gzip_min_bytes = gzip_min_bytes
+        self._gzip_accepted: Optional[bool] = None  # 첫 압축 요청 결과로 결정
+        self.bytes_sent = 0   # 실제 전송한 요청 본문 크기
+        self.bytes_saved = 0  # gzip으로 줄인 크기
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.max_retries = max_retries
+        self.retries = 0  # 429로 인한 재시도 횟수
+        self.link_chunk_size = max(1, link_chunk_size)
+        self.link_failures: List[Dict] = []  # 실패한 연결 묶음
+        self.bulk_size = max(0, bulk_size)
+        self.bulk_issues: Optional[bool] = None  # 일괄 생성 엔드포인트 사용 가능 여부 (None = 확인 전)
+        self.bulk_created = 0  # 일괄 생성으로 만든 Issue 수
+        self.metadata: Optional['ProjectMetadata'] = None
+        self.instrumentation = instrumentation or Instrumentation()
+        self.descriptions = descriptions or DescriptionRenderer()
+        self._lock = threading.Lock()
+
+    @property
+    def project_url(self) -> str:
+        return f"{self.api_url}/api/v1/workspaces/{self.workspace_slug}/projects/{self.project_id}"
+
+    def _request(self, method: str, url: str, payload: Optional[Dict] = None,
+                 indent: str = "", params: Optional[Dict] = None) -> 'requests.Response':
+        """
+        Rate Limiter를 거쳐 요청 전송
+
+        429 응답이면 max_retries까지 대기 후 재시도하고, 그래도 429면
+        마지막 응답을 그대로 반환한다. 네트워크 예외는 호출자에게 전달된다.
+        """
+        body = None
+        if payload is not None:
+            body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+        instrumentation = self.instrumentation
+        endpoint = self._endpoint(url)
+        attempt = 0
+        while True:
+            wait = self.rate_limiter.reserve()
+            if wait > 0:
+                with instrumentation.span('rate limit', 'throttle', endpoint=endpoint):
+                    time.sleep(wait)
+
+            started = time.perf_counter()
+            try:
+                response = self._send(method, url, body, params)
+            except Exception as e:
+                instrumentation.request(method, endpoint, None, attempt, started,
+                                        time.perf_counter() - started, error=str(e))
+                raise
+            sent = len(response.request.body or b'')
+            instrumentation.request(method, endpoint, response.status_code, attempt, started,
+                                    time.perf_counter() - started, sent, len(response.content))
+            self.rate_limiter.observe(response.headers)
+            if self._gzip_rejected(response, body, sent):
+                continue  # 압축 없이 다시 보냄
+
+            if response.status_code != 429 or attempt >= self.max_retries:
+                return response
+
+            attempt += 1
+            self.retries += 1
+            wait_time = self.rate_limiter.backoff(response.headers, attempt)
+            print(f"{indent}⏳ Rate Limit! {wait_time:.1f}초 대기 후 재시도... "
+                  f"(시도 {attempt}/{self.max_retries})")
+            with instrumentation.span('429 backoff', 'throttle', endpoint=endpoint,
+                                      attempt=attempt):
+                time.sleep(wait_time)
+
+    _ID_SEGMENT = re.compile(r'^(?:[0-9a-fA-F-]{32,36}|\d+)$')
+
+    def _endpoint(self, url: str) -> str:
+        """계측용 엔드포인트 이름: 프로젝트 하위 경로의 ID(UUID/숫자)를 {id}로 바꾼 것"""
+        if not url.startswith(self.project_url):
+            return url
+        parts = [p for p in url[len(self.project_url):].split('/') if p]
+        return '/'.join('{id}' if self._ID_SEGMENT.match(p) else p for p in parts) + '/'
+
+    def _send(self, method: str, url: str, body: Optional[bytes],
+              params: Optional[Dict]) -> 'requests.Response':
+        """요청 1회 전송 (필요하면 gzip 압축, 거부 처리는 _gzip_rejected()로 호출자가)"""
+        if body is None or not self._use_gzip(len(body)):
+            self._count_bytes(len(body or b''), 0)
+            return self.session.request(method, url, data=body, params=params,
+                                        timeout=self.timeout)
+
+        compressed = gzip.compress(body, compresslevel=6)
+        self._count_bytes(len(compressed), len(body) - len(compressed))
+        response = self.session.request(method, url, data=compressed, params=params,
+                                        headers={'Content-Encoding': 'gzip'},
+                                        timeout=self.timeout)
+        if response.status_code < 400 and self._gzip_accepted is None:
+            self._gzip_accepted = True
+        return response
+
+    _ENCODING_ERROR = re.compile(r'content[-_ ]?encoding|gzip', re.IGNORECASE)
+
+    def _gzip_rejected(self, response, body: Optional[bytes], sent: int) -> bool:
+        """
+        압축한 요청을 서버가 인코딩 때문에 거부했는지
+
+        415, 또는 본문이 Content-Encoding / gzip을 언급한 400이면 압축을 끄고 True
+        (호출자가 Rate Limiter와 계측을 거쳐 원본으로 다시 보냄). 압축이 한 번이라도
+        받아들여졌으면 서버가 압축을 이해하므로 거부로 보지 않는다.
+        """
+        if (self._gzip_accepted is True or body is None
+                or response.request.headers.get('Content-Encoding') != 'gzip'):
+            return False
+        if not (response.status_code == 415 or (response.status_code == 400
+                                                and self._ENCODING_ERROR.search(response.text))):
+            return False
+        with self._lock:
+            first = self._gzip_accepted is None
+            self._gzip_accepted = False
+        if first:
+            print("ℹ️  서버가 gzip 요청 본문을 받지 않아 압축 없이 전송합니다.")
+        self._count_bytes(0, -(len(body) - sent))
+        return True
+
+    def _use_gzip(self, size: int) -> bool:
+        return (self.gzip_min_bytes is not None and size >= self.gzip_min_bytes
+                and self._gzip_accepted is not False)
+
+    def _count_bytes(self, sent: int, saved: int):
+        with self._lock:
+            self.bytes_sent += sent
+            self.bytes_saved += saved
+
+    _CURSOR = re.compile(r'^(\d+):(\d+):(\d+)$')
+
+    def list_all(self, path: str, per_page: int = 100,
+                 concurrency: int = 1) -> Optional[List[Dict]]:
+        """
+        프로젝트 하위 목록 GET (커서 페이지네이션을 끝까지 따라감)
+
+        페이지네이션 없는 목록 응답도 받는다. 실패하면 None.
+        concurrency가 2 이상이고 첫 페이지에 전체 개수(total_count)와 Plane 형식
+        커서('페이지크기:페이지번호:0')가 있으면 나머지 페이지를 동시에 받는다.
+        """
+        data = self._get_page(path, per_page, None)
+        if data is None or isinstance(data, list):
+            return data
+
+        items: List[Dict] = list(data.get('results', []))
+        cursor = data.get('next_cursor')
+        if not data.get('next_page_results') or not cursor:
+            return items
+
+        match = self._CURSOR.match(str(cursor))
+        total = data.get('total_count')
+        pages = range(1, -(-total // per_page)) if isinstance(total, int) else range(0)
+        if concurrency > 1 and match and int(match.group(1)) == per_page and len(pages) > 1:
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(pages)),
+                                    thread_name_prefix='list') as pool:
+                results = list(pool.map(
+                    lambda page: self._get_page(path, per_page, f"{per_page}:{page}:0"), pages))
+            if any(result is None for result in results):
+                return None
+            for result in results:
+                items.extend(result if isinstance(result, list) else result.get('results', []))
+            return items
+
+        while True:
+            data = self._get_page(path, per_page, cursor)
+            if data is None:
+                return None
+            if isinstance(data, list):
+                return items + data
+
+            items.extend(data.get('results', []))
+            cursor = data.get('next_cursor')
+            if not data.get('next_page_results') or not cursor:
+                return items
+
+    def _get_page(self, path: str, per_page: int,
+                  cursor: Optional[str]) -> Optional[Union[Dict, List]]:
+        """목록 한 페이지 GET (실패하면 None)"""
+        params = {'per_page': per_page}
+        if cursor:
+            params['cursor'] = cursor
+        try:
+            response = self._request('GET', f"{self.project_url}/{path}", params=params)
+        except Exception as e:
+            print(f"⚠️  목록 조회 오류: {path} - {str(e)}")
+            return None
+
+        if response.status_code != 200:
+            if response.status_code != 404:
+                print(f"⚠️  목록 조회 실패: {path} (Status: {response.status_code})")
+            return None
+        return response.json()
+
+    def create_label(self, name: str) -> Optional[Dict]:
+        """라벨 생성 (색상은 이름에서 결정)"""
+        url = f"{self.project_url}/labels/"
+        payload = {"name": name, "color": "#" + hashlib.md5(name.encode('utf-8')).hexdigest()[:6]}
+
+        try:
+            response = self._request('POST', url, payload)
+        except Exception as e:
+            print(f"❌ Label 생성 오류: {name} - {str(e)}")
+            return None
+
+        if response.status_code == 201:
+            label = response.json()
+            print(f"🏷️  Label 생성: {name}")
+            return label
+        print(f"❌ Label 생성 실패: {name} (Status: {response.status_code})")
+        return None
+
+    def module_payload(self, module: Module) -> Dict:
+        """Module 생성/수정 요청 본문"""
+        payload = {
+            "name": module.name,
+            "description": module.description,
+            "status": module.status,
+        }
+
+        if module.start_date:
+            payload["start_date"] = module.start_date
+        if module.target_date:
+            payload["target_date"] = module.target_date
+
+        return payload
+
+    def issue_payload(self, issue: Issue) -> Dict:
+        """Issue 생성/수정 요청 본문"""
+        payload = {
+            "name": issue.name,
+            "description_html": self.descriptions.render(issue.get_description_html()),
+            "priority": issue.priority,
+        }
+
+        if issue.start_date:
+            payload["start_date"] = issue.start_date
+        if issue.target_date:
+            payload["target_date"] = issue.target_date
+
+        # 이름 → UUID 변환 (메타데이터를 불러온 경우)
+        if self.metadata is not None:
+            payload.update(self.metadata.resolve_issue(issue))
+
+        return payload
+
+    def cycle_payload(self, cycle: Cycle) -> Dict:
+        """Cycle 생성/수정 요청 본문"""
+        payload = {
+            "name": cycle.name,
+            "description": cycle.description,
+            "project_id": self.project_id,
+        }
+
+        if cycle.start_date:
+            payload["start_date"] = cycle.start_date
+        if cycle.end_date:
+            payload["end_date"] = cycle.end_date
+
+        return payload
+
+    # ---- 요청 단계 ----
+    #
+    # 생성 / 수정 / 연결 로직은 요청을 yield하고 응답(또는 예외)을 돌려받는
+    # 제너레이터로 한 번만 작성하고, 동기 클라이언트는 _run()으로,
+    # AsyncPlaneAPIClient는 _arun()으로 실행한다.
+    #     response = yield ('POST', url, payload, indent)   # _request()의 인자
+
+    def _run(self, steps):
+        """요청 단계를 동기로 실행하고 결과 반환"""
+        response = error = None
+        while True:
+            try:
+                call = steps.throw(error) if error is not None else steps.send(response)
+            except StopIteration as stop:
+                return stop.value
+            response = error = None
+            try:
+                response = self._request(*call)
+            except Exception as e:
+                error = e
+
+    def _response_lost(self, error: Exception) -> bool:
+        """요청은 보냈지만 응답을 못 받은 오류인지 (서버가 이미 처리했을 수 있음)"""
+        return isinstance(error, requests.exceptions.ReadTimeout)
+
+    def create_module(self, module: Module) -> Optional[str]:
+        """모듈 생성 (Rate Limit 재시도 포함)"""
+        return self._run(self._create_module(module))
+
+    def create_issue(self, issue: Issue, module_id: Optional[str] = None) -> Optional[str]:
+        """이슈 생성 (Rate Limit 재시도 포함)"""
+        return self._run(self._create_issue(issue, module_id))
+
+    def create_issues(self, issues: List[Issue],
+                      payloads: Optional[List[Dict]] = None) -> List[Optional[str]]:
+        """
+        이슈 일괄 생성: 입력 순서대로 ID 목록 반환 (실패한 Issue는 None)
+
+        엔드포인트가 없거나 (404/405) 묶음 요청이 실패하면 Issue마다
+        create_issue()로 다시 만든다. 응답에서 ID를 찾지 못한 Issue도 마찬가지.
+        응답을 못 받은 타임아웃은 서버가 이미 만들었을 수 있어 다시 보내지 않는다.
+        """
+        return self._run(self._create_issues(issues, payloads))
+
+    def create_cycle(self, cycle: Cycle) -> Optional[str]:
+        """사이클 생성"""
+        return self._run(self._create_cycle(cycle))
+
+    def update_module(self, module_id: str, module: Module) -> Optional[bool]:
+        """모듈 수정 (PATCH). 원격에서 삭제되었으면 None"""
+        return self._run(self._update_module(module_id, module))
+
+    def update_issue(self, issue_id: str, issue: Issue) -> Optional[bool]:
+        """이슈 수정 (PATCH). 원격에서 삭제되었으면 None"""
+        return self._run(self._update_issue(issue_id, issue))
+
+    def update_cycle(self, cycle_id: str, cycle: Cycle) -> Optional[bool]:
+        """사이클 수정 (PATCH). 원격에서 삭제되었으면 None"""
+        return self._run(self._update_cycle(cycle_id, cycle))
+
+    def add_issues_to_module(self, module_id: str, issue_ids: List[str]) -> bool:
+        """모듈에 이슈들 추가 (link_chunk_size개씩 묶어서 요청)"""
+        return self._run(self._add_issues_to_module(module_id, issue_ids))
+
+    def add_issues_to_cycle(self, cycle_id: str, issue_ids: List[str]) -> bool:
+        """사이클에 이슈들 추가 (link_chunk_size개씩 묶어서 요청)"""
+        return self._run(self._add_issues_to_cycle(cycle_id, issue_ids))
+
+    def _create_module(self, module: Module):
+        url = f"{self.project_url}/modules/"
+
+        try:
+            response = yield ('POST', url, self.module_payload(module))
+        except Exception as e:
+            print(f"❌ Module 생성 오류: {module.name} - {str(e)}")
+            return None
+
+        if response.status_code == 201:
+            module_id = response.json().get('id')
+            print(f"✅ Module 생성: {module.name} (ID: {module_id})")
+            return module_id
+        elif response.status_code == 429:
+            print(f"❌ Module 생성 최종 실패 (Rate Limit 초과): {module.name}")
+            return None
+        else:
+            print(f"❌ Module 생성 실패: {module.name}")
+            print(f"   Status: {response.status_code}")
+            print(f"   Response: {response.text}")
+            return None
+
+    def _create_issue(self, issue: Issue, module_id: Optional[str] = None):
+        url = f"{self.project_url}/issues/"
+
+        try:
+            response = yield ('POST', url, self.issue_payload(issue), "  ")
+        except Exception as e:
+            print(f"  ❌ Issue 생성 오류: {issue.name} - {str(e)}")
+            return None
+
+        if response.status_code == 201:
+            issue_id = response.json().get('id')
+            print(f"  ✅ Issue 생성: {issue.name}")
+
+            # 모듈에 이슈 연결 (일괄 연결을 쓰려면 module_id 없이 호출)
+            if module_id:
+                yield from self._add_issues_to_module(module_id, [issue_id])
+
+            return issue_id
+        elif response.status_code == 429:
+            print(f"  ❌ Issue 생성 최종 실패 (Rate Limit 초과): {issue.name}")
+            return None
+        else:
+            print(f"  ❌ Issue 생성 실패: {issue.name}")
+            print(f"     Status: {response.status_code}")
+            print(f"     Response: {response.text}")
+            return None
+
+    BULK_ISSUES_PATH = 'issues/bulk-create/'
+
+    def detect_bulk_issues(self) -> bool:
+        """
+        일괄 생성 엔드포인트 확인 (실행마다 한 번)
+
+        빈 목록을 POST해 경로가 있는지만 본다: 2xx 또는 검증 오류(400/422)면
+        사용 가능, 404/405면 없음. Issue는 만들어지지 않는다.
+        """
+        if self.bulk_size <= 1:
+            self.bulk_issues = False
+            return False
+
+        try:
+            response = self._request('POST', f"{self.project_url}/{self.BULK_ISSUES_PATH}",
+                                     {"issues": []})
+            self.bulk_issues = response.status_code < 300 or response.status_code in (400, 422)
+        except Exception as e:
+            print(f"⚠️  일괄 생성 엔드포인트 확인 오류: {str(e)}")
+            self.bulk_issues = False
+
+        if self.bulk_issues:
+            print(f"📦 Issue 일괄 생성 사용 ({self.bulk_size}개씩)")
+        else:
+            print("ℹ️  서버에 Issue 일괄 생성 엔드포인트가 없어 하나씩 생성합니다.")
+        return self.bulk_issues
+
+    def _create_each(self, issues: List[Issue]):
+        issue_ids = []
+        for issue in issues:
+            issue_ids.append((yield from self._create_issue(issue)))
+        return issue_ids
+
+    def _create_issues(self, issues: List[Issue], payloads: Optional[List[Dict]] = None):
+        if not issues:
+            return []
+        if payloads is None:
+            payloads = [self.issue_payload(issue) for issue in issues]
+        if not self.bulk_issues or len(issues) == 1:
+            return (yield from self._create_each(issues))
+
+        url = f"{self.project_url}/{self.BULK_ISSUES_PATH}"
+        try:
+            response = yield ('POST', url, {"issues": payloads}, "  ")
+        except Exception as e:
+            if self._response_lost(e):
+                print(f"  ❌ Issue 일괄 생성 응답 없음 ({len(issues)}개): {str(e)}")
+                print("     서버가 이미 만들었을 수 있어 다시 보내지 않습니다 (--sync로 재실행하세요).")
+                return [None] * len(issues)
+            print(f"  ⚠️  Issue 일괄 생성 오류, 하나씩 생성합니다: {str(e)}")
+            return (yield from self._create_each(issues))
+
+        if response.status_code in (404, 405):
+            self.bulk_issues = False
+            print("  ℹ️  Issue 일괄 생성 엔드포인트가 없어 하나씩 생성합니다.")
+            return (yield from self._create_each(issues))
+        if response.status_code not in (200, 201):
+            print(f"  ⚠️  Issue 일괄 생성 실패 (Status: {response.status_code}, "
+                  f"{len(issues)}개), 하나씩 생성합니다.")
+            return (yield from self._create_each(issues))
+
+        try:
+            data = response.json()
+        except ValueError:
+            data = None
+        issue_ids = self._bulk_ids(payloads, data)
+
+        # 2xx면 서버가 이미 모두 만들었으므로 다시 보내지 않고 (중복 생성) 목록에서 찾는다
+        missing = [i for i, issue_id in enumerate(issue_ids) if not issue_id]
+        if missing:
+            print(f"  ⚠️  일괄 생성 응답에서 {len(missing)}개 Issue의 ID를 찾지 못해 "
+                  f"최근 생성 목록에서 찾습니다.")
+            found = yield from self._find_created([payloads[i]['name'] for i in missing],
+                                                  set(issue_ids), len(payloads))
+            for i, issue_id in zip(missing, found):
+                issue_ids[i] = issue_id
+
+        created = sum(1 for issue_id in issue_ids if issue_id)
+        with self._lock:
+            self.bulk_created += created
+        print(f"  ✅ Issue {created}개 일괄 생성")
+        lost = len(issue_ids) - created
+        if lost:
+            print(f"  ❌ {lost}개 Issue의 ID를 찾지 못했습니다. 서버가 이미 만들었을 수 있어 "
+                  f"다시 보내지 않습니다 (Plane에서 확인하세요).")
+        return issue_ids
+
+    def _find_created(self, names: List[str], known: Set[Optional[str]], count: int):
+        """
+        일괄 생성 응답에서 ID를 못 찾은 Issue를 최근 생성 목록에서 이름으로 찾기 (GET 1회)
+
+        같은 이름의 이전 Issue와 헷갈리지 않도록 이름마다 가장 최근 것부터 필요한 개수만
+        골라 만든 순서대로 돌려준다. 못 찾은 자리는 None.
+        """
+        url = f"{self.project_url}/issues/"
+        params = {'per_page': max(100, count), 'order_by': '-created_at'}
+        try:
+            response = yield ('GET', url, None, "  ", params)
+            data = response.json() if response.status_code == 200 else None
+        except Exception as e:
+            print(f"  ⚠️  Issue 목록 조회 오류: {str(e)}")
+            data = None
+        items = data.get('results', []) if isinstance(data, dict) else data
+        if not isinstance(items, list):
+            return [None] * len(names)
+
+        needed = collections.Counter(names)
+        recent: Dict[str, List[str]] = {}  # 이름 -> 최신순 ID
+        for item in items:
+            if not isinstance(item, dict) or not item.get('id') or item['id'] in known:
+                continue
+            ids = recent.setdefault(item.get('name'), [])
+            if len(ids) < needed.get(item.get('name'), 0):
+                ids.append(item['id'])
+        for ids in recent.values():
+            ids.reverse()  # 만든 순서 = 요청 순서
+        return [recent[name].pop(0) if recent.get(name) else None for name in names]
+
+    @staticmethod
+    def _bulk_ids(payloads: List[Dict], data) -> List[Optional[str]]:
+        """
+        일괄 생성 응답 → 요청 순서의 ID 목록
+
+        응답은 목록 또는 {"issues"|"results": 목록}. 개수와 이름이 요청과 같으면
+        순서대로, 아니면 이름으로 맞춘다 (같은 이름은 응답 순서대로).
+        """
+        items = data.get('issues', data.get('results')) if isinstance(data, dict) else data
+        if not isinstance(items, list):
+            return [None] * len(payloads)
+        items = [item for item in items if isinstance(item, dict)]
+
+        if len(items) == len(payloads) and all(
+                item.get('name', payload['name']) == payload['name']
+                for item, payload in zip(items, payloads)):
+            return [item.get('id') for item in items]
+
+        by_name: Dict[str, List[str]] = {}
+        for item in items:
+            if item.get('id'):
+                by_name.setdefault(item.get('name'), []).append(item['id'])
+        issue_ids = []
+        for payload in payloads:
+            candidates = by_name.get(payload['name'])
+            issue_ids.append(candidates.pop(0) if candidates else None)
+        return issue_ids
+
+    def _create_cycle(self, cycle: Cycle):
+        url = f"{self.project_url}/cycles/"
+
+        try:
+            response = yield ('POST', url, self.cycle_payload(cycle))
+
+            if response.status_code == 201:
+                cycle_id = response.json().get('id')
+                print(f"✅ Cycle 생성: {cycle.name} (ID: {cycle_id})")
+                return cycle_id
+            else:
+                print(f"❌ Cycle 생성 실패: {cycle.name}")
+                print(f"   Status: {response.status_code}")
+                print(f"   Response: {response.text}")
+                return None
+        except Exception as e:
+            print(f"❌ Cycle 생성 오류: {cycle.name} - {str(e)}")
+            return None
+
+    def _update_module(self, module_id: str, module: Module):
+        url = f"{self.project_url}/modules/{module_id}/"
+        return (yield from self._update('Module', module.name, url, self.module_payload(module)))
+
+    def _update_issue(self, issue_id: str, issue: Issue):
+        url = f"{self.project_url}/issues/{issue_id}/"
+        return (yield from self._update('Issue', issue.name, url, self.issue_payload(issue),
+                                        indent="  "))
+
+    def _update_cycle(self, cycle_id: str, cycle: Cycle):
+        url = f"{self.project_url}/cycles/{cycle_id}/"
+        return (yield from self._update('Cycle', cycle.name, url, self.cycle_payload(cycle)))
+
+    def _update(self, kind: str, name: str, url: str, payload: Dict, indent: str = ""):
+        """PATCH 공통 로직: 성공 True, 실패 False, 404(원격 삭제) None"""
+        try:
+            response = yield ('PATCH', url, payload, indent)
+        except Exception as e:
+            print(f"{indent}❌ {kind} 수정 오류: {name} - {str(e)}")
+            return False
+
+        if response.status_code == 200:
+            print(f"{indent}🔄 {kind} 수정: {name}")
+            return True
+        elif response.status_code == 404:
+            print(f"{indent}⚠️  {kind}가 Plane에 없음, 새로 생성합니다: {name}")
+            return None
+        else:
+            print(f"{indent}❌ {kind} 수정 실패: {name}")
+            print(f"{indent}   Status: {response.status_code}")
+            print(f"{indent}   Response: {response.text}")
+            return False
+
+    def _add_issues_to_module(self, module_id: str, issue_ids: List[str]):
+        url = f"{self.project_url}/modules/{module_id}/module-issues/"
+        return (yield from self._link_issues('Module', module_id, url, issue_ids))
+
+    def _add_issues_to_cycle(self, cycle_id: str, issue_ids: List[str]):
+        url = f"{self.project_url}/cycles/{cycle_id}/cycle-issues/"
+        return (yield from self._link_issues('Cycle', cycle_id, url, issue_ids))
+
+    def _link_issues(self, target: str, target_id: str, url: str, issue_ids: List[str]):
+        """
+        Module/Cycle 연결 공통 로직
+
+        묶음별로 성공/실패를 출력하고, 실패한 묶음은 link_failures에 기록한다.
+        모든 묶음이 성공하면 True.
+        """
+        if not issue_ids:
+            return True
+
+        chunk_size = self.link_chunk_size
+        chunks = [issue_ids[i:i + chunk_size] for i in range(0, len(issue_ids), chunk_size)]
+        ok = True
+
+        for index, chunk in enumerate(chunks, 1):
+            chunk_label = f" ({index}/{len(chunks)})" if len(chunks) > 1 else ""
+            status = None
+            error = None
+
+            try:
+                response = yield ('POST', url, {"issues": chunk}, "  ")
+                status = response.status_code
+                if status in [200, 201]:
+                    print(f"  → {target}에 {len(chunk)}개 Issue 연결됨{chunk_label}")
+                    continue
+                print(f"  ⚠️  {target} 연결 실패{chunk_label} (Status: {status}, {len(chunk)}개)")
+                if status == 400:
+                    print(f"     {response.text}")
+                error = response.text
+            except Exception as e:
+                print(f"  ⚠️  {target} 연결 오류{chunk_label}: {str(e)}")
+                error = str(e)
+
+            ok = False
+            with self._lock:
+                self.link_failures.append({
+                    'target': target.lower(),
+                    'id': target_id,
+                    'chunk': index,
+                    'chunks': len(chunks),
+                    'issue_ids': chunk,
+                    'status': status,
+                    'error': error,
+                })
+
+        return ok
+
+
+class AsyncPlaneAPIClient(PlaneAPIClient):
+    """
+    asyncio 기반 Plane API 클라이언트 (httpx 필요, --async)
+
+    생성 / 수정 / 연결 메서드(create_module, create_issue, create_issues,
+    create_cycle, update_*, add_issues_to_*)가 코루틴이다. 요청 로직은
+    PlaneAPIClient와 같은 요청 단계를 _arun()으로 실행하므로 결과와 출력도 같다.
+    목록 조회와 라벨 생성(list_all, create_label, detect_bulk_issues)은 업로드 전에
+    쓰는 동기 메서드 그대로다.
+
+    스레드 대신 이벤트 루프 하나에서 요청을 max_in_flight개까지 동시에 보내고
+    (세마포어), 연결은 pool_size개까지만 열어 재사용한다. h2 패키지가 있으면
+    HTTP/2를 제안하고, 서버가 받으면 (HTTPS ALPN) 요청들이 연결 하나에 다중화된다.
+    평문 http://는 HTTP/1.1 keep-alive로 보낸다.
+
+    연결 풀은 이벤트 루프에 묶이므로 async with 블록 안에서만 요청할 수 있다.
+
+        async with client:
+            module_id = await client.create_module(module)
+    """
+
+    def __init__(self, api_url: str, api_key: str, workspace_slug: str, project_id: str,
+                 max_in_flight: int = 32, **kwargs):
+        if httpx is None:
+            raise ImportError("AsyncPlaneAPIClient에는 httpx가 필요합니다: pip install 'httpx[http2]'")
+        super().__init__(api_url, api_key, workspace_slug, project_id, **kwargs)
+        self.max_in_flight = max(1, max_in_flight)
+        self.pool_size = max(1, kwargs.get('pool_size', 10))
+        self.connect_retries = kwargs.get('connect_retries', 3)
+        self.http2 = importlib.util.find_spec('h2') is not None
+        self.http_versions: Dict[str, int] = {}  # 응답 HTTP 버전별 요청 수
+        self._client = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._lanes: List[str] = []  # 계측 타임라인에서 동시 요청마다 쓸 줄 이름
+
+    async def __aenter__(self) -> 'AsyncPlaneAPIClient':
+        limits = httpx.Limits(max_connections=self.pool_size,
+                              max_keepalive_connections=self.pool_size)
+        transport = httpx.AsyncHTTPTransport(http2=self.http2, limits=limits,
+                                             retries=self.connect_retries)
+        connect_timeout, read_timeout = self.timeout
+        self._client = httpx.AsyncClient(transport=transport, headers=self.headers,
+                                         timeout=httpx.Timeout(read_timeout,
+                                                               connect=connect_timeout))
+        self._semaphore = asyncio.Semaphore(self.max_in_flight)
+        self._lanes = [f"async_{i}" for i in reversed(range(self.max_in_flight))]
+        return self
+
+    async def __aexit__(self, *exc):
+        await self._client.aclose()
+        self._client = None
+
+    async def _arun(self, steps):
+        """요청 단계를 이벤트 루프에서 실행하고 결과 반환"""
+        response = error = None
+        while True:
+            try:
+                call = steps.throw(error) if error is not None else steps.send(response)
+            except StopIteration as stop:
+                return stop.value
+            response = error = None
+            try:
+                response = await self._request_async(*call)
+            except Exception as e:
+                error = e
+
+    def _response_lost(self, error: Exception) -> bool:
+        return isinstance(error, httpx.ReadTimeout) or super()._response_lost(error)
+
+    async def _request_async(self, method: str, url: str, payload: Optional[Dict] = None,
+                             indent: str = "", params: Optional[Dict] = None):
+        """_request()와 같은 규칙 (Rate Limiter, 429 재시도, 계측)으로 비동기 전송"""
+        body = None
+        if payload is not None:
+            body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+        instrumentation = self.instrumentation
+        endpoint = self._endpoint(url)
+        attempt = 0
+        while True:
+            async with self._semaphore:
+                lane = self._lanes.pop()
+                try:
+                    wait = self.rate_limiter.reserve()
+                    if wait > 0:
+                        with instrumentation.span('rate limit', 'throttle', endpoint=endpoint):
+                            await asyncio.sleep(wait)
+
+                    started = time.perf_counter()
+                    try:
+                        response = await self._send_async(method, url, body, params)
+                    except Exception as e:
+                        instrumentation.request(method, endpoint, None, attempt, started,
+                                                time.perf_counter() - started, error=str(e),
+                                                thread=lane)
+                        raise
+                    sent = len(response.request.content or b'')
+                    instrumentation.request(method, endpoint, response.status_code, attempt,
+                                            started, time.perf_counter() - started,
+                                            sent, len(response.content), thread=lane)
+                finally:
+                    self._lanes.append(lane)
+
+            with self._lock:
+                self.http_versions[response.http_version] = \
+                    self.http_versions.get(response.http_version, 0) + 1
+            self.rate_limiter.observe(response.headers)
+            if self._gzip_rejected(response, body, sent):
+                continue  # 압축 없이 다시 보냄
+
+            if response.status_code != 429 or attempt >= self.max_retries:
+                return response
+
+            attempt += 1
+            self.retries += 1
+            wait_time = self.rate_limiter.backoff(response.headers, attempt)
+            print(f"{indent}⏳ Rate Limit! {wait_time:.1f}초 대기 후 재시도... "
+                  f"(시도 {attempt}/{self.max_retries})")
+            with instrumentation.span('429 backoff', 'throttle', endpoint=endpoint,
+                                      attempt=attempt):
+                await asyncio.sleep(wait_time)
+
+    async def _send_async(self, method: str, url: str, body: Optional[bytes],
+                          params: Optional[Dict]):
+        """요청 1회 전송 (_send()와 같은 gzip 규칙)"""
+        if body is None or not self._use_gzip(len(body)):
+            self._count_bytes(len(body or b''), 0)
+            return await self._client.request(method, url, content=body, params=params)
+
+        compressed = gzip.compress(body, compresslevel=6)
+        self._count_bytes(len(compressed), len(body) - len(compressed))
+        response = await self._client.request(method, url, content=compressed, params=params,
+                                              headers={'Content-Encoding': 'gzip'})
+        if response.status_code < 400 and self._gzip_accepted is None:
+            self._gzip_accepted = True
+        return response
+
+    async def create_module(self, module: Module) -> Optional[str]:
+        return await self._arun(self._create_module(module))
+
+    async def create_issue(self, issue: Issue, module_id: Optional[str] = None) -> Optional[str]:
+        return await self._arun(self._create_issue(issue, module_id))
+
+    async def create_issues(self, issues: List[Issue],
+                            payloads: Optional[List[Dict]] = None) -> List[Optional[str]]:
+        return await self._arun(self._create_issues(issues, payloads))
+
+    async def create_cycle(self, cycle: Cycle) -> Optional[str]:
+        return await self._arun(self._create_cycle(cycle))
+
+    async def update_module(self, module_id: str, module: Module) -> Optional[bool]:
+        return await self._arun(self._update_module(module_id, module))
+
+    async def update_issue(self, issue_id: str, issue: Issue) -> Optional[bool]:
+        return await self._arun(self._update_issue(issue_id, issue))
+
+    async def update_cycle(self, cycle_id: str, cycle: Cycle) -> Optional[bool]:
+        return await self._arun(self._update_cycle(cycle_id, cycle))
+
+    async def add_issues_to_module(self, module_id: str, issue_ids: List[str]) -> bool:
+        return await self._arun(self._add_issues_to_module(module_id, issue_ids))
+
+    async def add_issues_to_cycle(self, cycle_id: str, issue_ids: List[str]) -> bool:
+        return await self._arun(self._add_issues_to_cycle(cycle_id, issue_ids))
+
+
+class ProjectMetadata:
+    """
+    프로젝트 메타데이터 캐시 (States, Labels, Members, Estimate points)
+
+    Plane은 Issue의 state / labels / assignees / estimate_point를 UUID로 받는다.
+    실행마다 한 번 (또는 TTL 안이면 디스크 캐시에서) 네 목록을 불러 두고,
+    기획서의 이름("Todo", "backend", "@user", 8)을 메모리에서 UUID로 바꿔
+    Issue를 POST 한 번에 모든 필드와 함께 만든다.
+
+    없는 라벨은 업로드 전에 ensure_labels()로 한꺼번에 만든다 (파이프라인 모드는
+    Module마다). resolve_issue()는 찾기만 하고 요청을 보내지 않으므로 동기화 해시나
+    비교를 위해 payload를 만들어도 부작용이 없다.
+    찾을 수 없는 State / 라벨 / 담당자 / 추정치는 한 번만 경고하고 payload에서 뺀다.
+    """
+
+    KINDS = ('states', 'labels', 'members', 'estimates')
+    OPTIONAL_KINDS = ('estimates',)  # 추정치를 쓰지 않는 프로젝트도 있음
+
+    def __init__(self, client: PlaneAPIClient, cache_dir: Optional[str] = None, ttl: float = 3600,
+                 read_only: bool = False):
+        self.client = client
+        self.ttl = ttl
+        self.read_only = read_only  # 라벨을 만들지 않음 (--plan, --export)
+        self.cache_path = None
+        if cache_dir and ttl > 0:
+            target = f"{client.api_url}|{client.workspace_slug}|{client.project_id}"
+            digest = hashlib.sha256(target.encode('utf-8')).hexdigest()[:16]
+            self.cache_path = os.path.join(cache_dir, f"metadata-{digest}.json")
+
+        self.states: Dict[str, str] = {}           # 이름(소문자) → ID
+        self.labels: Dict[str, str] = {}           # 이름(소문자) → ID
+        self.members: Dict[str, str] = {}          # 표시 이름 / 이메일(소문자) → ID
+        self.estimate_points: Dict[str, str] = {}  # 값 → ID
+        self._raw: Dict[str, List[Dict]] = {kind: [] for kind in self.KINDS}
+        self.complete = True  # 네 목록을 모두 불러왔는지 (아니면 캐시에 쓰지 않음)
+        self._creating: Dict[str, threading.Event] = {}  # 생성 중인 라벨
+        self.missing_labels = set()  # resolve_issue()에서 찾지 못한 라벨
+        self._warned = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def default_cache_dir() -> str:
+        base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+        return os.path.join(base, 'md_to_plane')
+
+    def load(self, raw: Optional[Dict[str, List[Dict]]] = None) -> bool:
+        """
+        디스크 캐시가 TTL 안이면 사용, 아니면 네 목록을 동시에 조회
+
+        raw를 주면 조회하지 않고 그 목록을 쓴다 (--shards 워커가 조정 프로세스의 목록을 받음).
+        조회에 실패한 목록이 있으면 캐시에 쓰지 않는다. States / Labels / Members 중
+        하나라도 실패하면 False (빈 목록으로 계속하면 있는 라벨을 다시 만들고
+        State / 담당자를 조용히 빼므로 호출자가 멈춘다).
+        """
+        source = "조정 프로세스"
+        if raw is None:
+            raw = self._read_cache()
+            source = "캐시"
+        if raw is None:
+            with ThreadPoolExecutor(max_workers=len(self.KINDS)) as pool:
+                fetched = dict(zip(self.KINDS, pool.map(self.client.list_all,
+                                                        [f"{kind}/" for kind in self.KINDS])))
+            failed = [kind for kind, items in fetched.items() if items is None]
+            raw = {kind: items or [] for kind, items in fetched.items()}
+            self.complete = not failed
+            if failed:
+                print(f"⚠️  프로젝트 메타데이터를 불러오지 못함: {', '.join(failed)} "
+                      f"(캐시에 저장하지 않음)")
+                if any(kind not in self.OPTIONAL_KINDS for kind in failed):
+                    print("❌ 이름을 UUID로 바꿀 수 없어 멈춥니다. "
+                          "메타데이터 없이 올리려면 --no-metadata를 쓰세요.")
+                    return False
+            else:
+                self._write_cache(raw)
+            source = "API"
+
+        self._index(raw)
+        print(f"🗂️  프로젝트 메타데이터 ({source}): States {len(self.states)}개, "
+              f"Labels {len(self.labels)}개, Members {len(set(self.members.values()))}명, "
+              f"Estimate {len(self.estimate_points)}개")
+        return True
+
+    def ensure_labels(self, names: Iterable[str], concurrency: int = 1):
+        """없는 라벨을 업로드 전에 한꺼번에 생성"""
+        missing = sorted({str(n) for n in names if n and str(n).lower() not in self.labels})
+        if not missing:
+            return
+
+        print(f"🏷️  없는 Label {len(missing)}개 생성 중...")
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(missing)))) as pool:
+            list(pool.map(self._create_label, missing))
+        self._write_cache(None)
+        print()
+
+    def resolve_issue(self, issue: Issue) -> Dict:
+        """Issue의 이름 필드를 UUID payload 필드로 변환"""
+        payload = {}
+
+        if issue.state:
+            state_id = self.states.get(str(issue.state).lower())
+            if state_id:
+                payload["state"] = state_id
+            else:
+                self._warn(f"알 수 없는 State: {issue.state}")
+
+        if issue.labels:
+            payload["labels"] = [
+                label_id for label_id in (self._label_id(str(n)) for n in issue.labels) if label_id
+            ]
+
+        if issue.assignees:
+            assignees = []
+            for name in issue.assignees:
+                member_id = self.members.get(str(name).lstrip('@').lower())
+                if member_id:
+                    assignees.append(member_id)
+                else:
+                    self._warn(f"알 수 없는 담당자: {name}")
+            payload["assignees"] = assignees
+
+        if issue.estimate_point is not None:
+            point_id = self.estimate_points.get(str(issue.estimate_point))
+            if point_id:
+                payload["estimate_point"] = point_id
+            elif self.estimate_points:
+                self._warn(f"알 수 없는 Estimate: {issue.estimate_point}")
+
+        return payload
+
+    def _label_id(self, name: str) -> Optional[str]:
+        label_id = self.labels.get(name.lower())
+        if label_id is None:
+            with self._lock:
+                self.missing_labels.add(name)
+            if not self.read_only:  # ensure_labels()에서 만들지 못한 라벨
+                self._warn(f"알 수 없는 Label: {name}")
+        return label_id
+
+    def _create_label(self, name: str) -> Optional[str]:
+        """라벨 생성 (같은 라벨을 여러 스레드가 동시에 만들지 않도록 한 스레드만 요청)"""
+        key = name.lower()
+        with self._lock:
+            if key in self.labels:
+                return self.labels[key]
+            pending = self._creating.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._creating[key] = threading.Event()
+
+        if not owner:
+            pending.wait()
+            return self.labels.get(key)
+
+        label = self.client.create_label(name)
+        with self._lock:
+            if label and label.get('id'):
+                self.labels[key] = label['id']
+                self._raw['labels'].append(label)
+            del self._creating[key]
+        pending.set()
+        return self.labels.get(key)
+
+    def _warn(self, message: str):
+        with self._lock:
+            if message in self._warned:
+                return
+            self._warned.add(message)
+        print(f"  ⚠️  {message} (무시하고 진행)")
+
+    def _index(self, raw: Dict[str, List[Dict]]):
+        self._raw = raw
+        self.states = {s['name'].lower(): s['id'] for s in raw['states'] if s.get('name')}
+        self.labels = {l['name'].lower(): l['id'] for l in raw['labels'] if l.get('name')}
+
+        self.members = {}
+        for entry in raw['members']:
+            member = entry.get('member') if isinstance(entry.get('member'), dict) else entry
+            member_id = member.get('id')
+            for key in ('display_name', 'email', 'first_name'):
+                value = member.get(key)
+                if value and member_id:
+                    self.members.setdefault(value.lower(), member_id)
+            email = member.get('email') or ''
+            if '@' in email:
+                self.members.setdefault(email.split('@')[0].lower(), member_id)
+
+        self.estimate_points = {}
+        for estimate in raw['estimates']:
+            for point in estimate.get('points', []):
+                if point.get('value') is not None:
+                    self.estimate_points.setdefault(str(point['value']), point['id'])
+
+    def _read_cache(self) -> Optional[Dict[str, List[Dict]]]:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return None
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - data.get('fetched_at', 0) > self.ttl:
+            return None
+        return {kind: data.get(kind, []) for kind in self.KINDS}
+
+    def _write_cache(self, raw: Optional[Dict[str, List[Dict]]]):
+        """캐시 저장 (raw가 None이면 현재 상태를 저장, 조회 시각은 유지)"""
+        if not self.cache_path or not self.complete:
+            return
+        fetched_at = time.time()
+        if raw is None:
+            raw = self._raw
+            if os.path.exists(self.cache_path):
+                try:
+                    with open(self.cache_path, 'r', encoding='utf-8') as f:
+                        fetched_at = json.load(f).get('fetched_at', fetched_at)
+                except (OSError, ValueError):
+                    pass
+
+        data = {'fetched_at': fetched_at}
+        data.update(raw)
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp_path = self.cache_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"⚠️  메타데이터 캐시 저장 실패: {e}")
+
+
+def cycle_key(cycle: Cycle) -> str:
+    """동기화 상태에서 Cycle을 식별하는 키"""
+    return cycle.name
+
+
+def module_key(module: Module) -> str:
+    """동기화 상태에서 Module을 식별하는 키"""
+    return module.name
+
+
+def issue_key(module: Module, issue: Issue) -> str:
+    """동기화 상태에서 Issue를 식별하는 키 (기획서 번호, 없으면 Module/제목)"""
+    return issue.identifier or f"{module.name}/{issue.name}"
+
+
+def content_hash(payload: Dict) -> str:
+    """요청 본문의 내용 해시 (키 순서와 무관)"""
+    data = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()[:16]
+
+
+class SyncManifest:
+    """
+    기획서 항목 ↔ Plane ID 매핑 (동기화 상태 파일)
+
+    기획서 옆의 <파일명>.plane-sync.json 에 Cycle/Module/Issue 키마다
+    Plane ID와 요청 본문 해시를 저장한다. Issue는 연결된 Module/Cycle ID도
+    함께 기록해서 이미 연결된 Issue를 다시 연결하지 않는다.
+
+    {
+      "version": 1, "api_url": "...", "workspace": "...", "project": "...",
+      "cycles":  {"<키>": {"id": "...", "hash": "..."}},
+      "modules": {"<키>": {"id": "...", "hash": "..."}},
+      "issues":  {"<키>": {"id": "...", "hash": "...", "module": "...", "cycle": "..."}}
+    }
+    """
+
+    VERSION = 1
+    KINDS = ('cycles', 'modules', 'issues')
+
+    def __init__(self, path: Optional[str], api_url: str, workspace: str, project: str):
+        self.path = path  # None이면 파일로 저장하지 않음 (저널 재개 전용)
+        self.target = {'api_url': api_url.rstrip('/'), 'workspace': workspace, 'project': project}
+        self.items: Dict[str, Dict[str, Dict]] = {kind: {} for kind in self.KINDS}
+        self.journal: Optional['UploadJournal'] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def default_path(md_file: str) -> str:
+        return os.path.splitext(md_file)[0] + '.plane-sync.json'
+
+    @classmethod
+    def load(cls, path: str, api_url: str, workspace: str, project: str) -> 'SyncManifest':
+        """상태 파일 읽기 (없거나 다른 프로젝트용이면 빈 상태)"""
+        manifest = cls(path, api_url, workspace, project)
+        if not os.path.exists(path):
+            return manifest
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  동기화 상태 파일을 읽을 수 없어 새로 시작합니다: {path} - {e}")
+            return manifest
+
+        if data.get('version') != cls.VERSION:
+            print(f"⚠️  동기화 상태 파일 버전이 달라 새로 시작합니다: {path}")
+            return manifest
+        if any(data.get(k) != v for k, v in manifest.target.items()):
+            print(f"⚠️  동기화 상태 파일이 다른 프로젝트용이라 새로 시작합니다: {path}")
+            return manifest
+
+        for kind in cls.KINDS:
+            manifest.items[kind] = data.get(kind, {})
+        return manifest
+
+    def get(self, kind: str, key: str) -> Optional[Dict]:
+        with self._lock:
+            return self.items[kind].get(key)
+
+    def record(self, kind: str, key: str, item_id: str, digest: str):
+        """항목 생성 기록 (기존 연결 정보는 버림)"""
+        with self._lock:
+            self.items[kind][key] = {'id': item_id, 'hash': digest}
+        if self.journal:
+            self.journal.append({'op': 'record', 'kind': kind, 'key': key,
+                                 'id': item_id, 'hash': digest})
+
+    def update(self, kind: str, key: str, **fields):
+        """기존 항목의 필드 갱신"""
+        with self._lock:
+            if key in self.items[kind]:
+                self.items[kind][key].update(fields)
+        if self.journal:
+            self.journal.append({'op': 'update', 'kind': kind, 'key': key, 'fields': fields})
+
+    def save(self):
+        """상태 파일 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self.path:
+            return
+        with self._lock:
+            data = {'version': self.VERSION}
+            data.update(self.target)
+            data.update(self.items)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+
+
+class UploadJournal:
+    """
+    업로드 선행 기록 저널 (write-ahead log)
+
+    생성/수정/연결이 성공할 때마다 <파일명>.plane-journal.jsonl 에 한 줄씩
+    추가하고 바로 디스크에 기록(fsync)한다. 업로드가 중간에 죽어도
+    --resume으로 저널을 SyncManifest에 다시 적용하면, 이미 끝난 항목은
+    건너뛰고 처음 끝나지 않은 항목부터 이어서 업로드한다.
+
+        {"op": "start", "api_url": "...", "workspace": "...", "project": "..."}
+        {"op": "record", "kind": "issues", "key": "PROJ-001", "id": "...", "hash": "..."}
+        {"op": "update", "kind": "issues", "key": "PROJ-001", "fields": {"module": "..."}}
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def default_path(md_file: str) -> str:
+        return os.path.splitext(md_file)[0] + '.plane-journal.jsonl'
+
+    def exists(self) -> bool:
+        return os.path.exists(self.path)
+
+    def start(self, manifest: SyncManifest, resume: bool = False):
+        """저널 열기 (resume이 아니면 새로 시작) 후 manifest 변경을 기록하도록 연결"""
+        mode = 'a' if resume else 'w'
+        self._file = open(self.path, mode, encoding='utf-8')
+        if not resume:
+            entry = {'op': 'start'}
+            entry.update(manifest.target)
+            self.append(entry)
+        manifest.journal = self
+
+    def replay(self, manifest: SyncManifest) -> int:
+        """
+        저널을 manifest에 적용하고 적용한 항목 수를 반환
+
+        마지막 줄이 기록 도중 잘렸으면 무시한다. 다른 프로젝트용 저널이면 ValueError.
+        """
+        applied = 0
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break  # 기록 도중 중단된 마지막 줄
+
+                op = entry.get('op')
+                if op == 'start':
+                    target = {k: entry.get(k) for k in manifest.target}
+                    if target != manifest.target:
+                        raise ValueError(f"다른 프로젝트의 저널입니다: {target['project']}")
+                elif op == 'record':
+                    with manifest._lock:
+                        manifest.items[entry['kind']][entry['key']] = {
+                            'id': entry['id'], 'hash': entry['hash']
+                        }
+                    applied += 1
+                elif op == 'update':
+                    with manifest._lock:
+                        item = manifest.items[entry['kind']].get(entry['key'])
+                        if item is not None:
+                            item.update(entry['fields'])
+                    applied += 1
+        return applied
+
+    def append(self, entry: Dict):
+        line = json.dumps(entry, ensure_ascii=False) + '\n'
+        with self._lock:
+            if self._file is None:
+                return  # 강제 중단 뒤 늦게 끝난 요청
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def shard_path(self, shard: int) -> str:
+        """--shards 워커 shard번의 저널 경로 (<저널>.shard<N>.jsonl)"""
+        return f"{os.path.splitext(self.path)[0]}.shard{shard}.jsonl"
+
+    def shard_paths(self) -> List[str]:
+        """남아 있는 워커 저널 경로 (번호순)"""
+        pattern = f"{glob.escape(os.path.splitext(self.path)[0])}.shard*.jsonl"
+        return sorted(glob.glob(pattern), key=lambda p: int(re.search(r'(\d+)\.jsonl$', p).group(1)))
+
+    def close(self, remove: bool = False):
+        """저널 닫기 (remove=True면 업로드가 끝났으므로 워커 저널까지 파일 삭제)"""
+        if self._file:
+            self._file.close()
+            self._file = None
+        if remove:
+            for path in [self.path] + self.shard_paths():
+                if os.path.exists(path):
+                    os.remove(path)
+
+
+def parse_date(value) -> Optional[datetime.date]:
+    """기획서 날짜 → date ('YYYY-MM-DD', 날짜-시간 문자열, YAML date). 없거나 잘못되면 None"""
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    if not value:
+        return None
+    try:
+        return datetime.date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+class CycleIndex:
+    """
+    Cycle 기간 구간 색인 (날짜 → Cycle)
+
+    Cycle을 시작일 순으로 정렬하고 끝날짜의 누적 최댓값을 함께 둔다. 날짜 하나를
+    찾을 때는 bisect로 그 날 이전에 시작한 마지막 Cycle을 찾고, 누적 최댓값이
+    그 날보다 작아질 때까지만 앞으로 훑는다. 겹치지 않는 Cycle이면 O(log n).
+
+    Plane의 Issue는 Cycle 하나에만 속하므로 여러 Cycle 기간에 걸리면
+    overlap 정책으로 하나를 고른다:
+        latest: 가장 늦게 시작한 Cycle (기본값)
+        earliest: 가장 먼저 시작한 Cycle
+        skip: 연결하지 않음
+    """
+
+    OVERLAP_POLICIES = ('latest', 'earliest', 'skip')
+
+    def __init__(self, cycles: Iterable[Dict], overlap: str = 'latest'):
+        if overlap not in self.OVERLAP_POLICIES:
+            raise ValueError(f"알 수 없는 overlap 정책: {overlap}")
+        self.overlap = overlap
+        self.invalid: List[Dict] = []  # 기간을 알 수 없는 Cycle
+
+        intervals = []
+        for cycle in cycles:
+            start, end = parse_date(cycle.get('start_date')), parse_date(cycle.get('end_date'))
+            if start is None or end is None or end < start:
+                self.invalid.append(cycle)
+                continue
+            intervals.append((start, end, len(intervals), cycle))
+        intervals.sort(key=lambda interval: (interval[0], interval[2]))
+
+        self.starts = [interval[0] for interval in intervals]
+        self.ends = [interval[1] for interval in intervals]
+        self.cycles = [interval[3] for interval in intervals]
+        self.max_ends: List[datetime.date] = []
+        for end in self.ends:
+            self.max_ends.append(max(end, self.max_ends[-1]) if self.max_ends else end)
+
+    def __len__(self) -> int:
+        return len(self.cycles)
+
+    def containing(self, day: datetime.date) -> List[int]:
+        """day를 포함하는 Cycle 위치 목록 (늦게 시작한 순)"""
+        found = []
+        i = bisect.bisect_right(self.starts, day) - 1
+        while i >= 0 and self.max_ends[i] >= day:
+            if self.ends[i] >= day:
+                found.append(i)
+            i -= 1
+        return found
+
+    def assign(self, day: Optional[datetime.date]) -> Tuple[Optional[int], bool]:
+        """(고른 Cycle 위치 또는 None, 여러 Cycle에 걸렸는지)"""
+        if day is None:
+            return None, False
+        found = self.containing(day)
+        if len(found) <= 1:
+            return (found[0] if found else None), False
+        if self.overlap == 'skip':
+            return None, True
+        return (found[0] if self.overlap == 'latest' else found[-1]), True
+
+
+class TaskGraph:
+    """
+    의존 관계가 있는 업로드 작업 묶음 (DAG)
+
+    add()로 작업과 그 선행 작업들을 등록하고 run()으로 실행한다. 선행 작업이
+    모두 성공한 작업부터 최대 limit개까지 동시에 돌리고, 준비된 작업이 여럿이면
+    먼저 등록한 것부터 꺼낸다 (pool이 없으면 등록 순서대로 하나씩).
+
+    작업 함수가 None을 돌려주거나 예외를 던지면 실패로 보고, 그 작업에 (직간접으로)
+    기대는 작업만 실행하지 않고 취소한다. 다른 작업은 계속 진행한다.
+    after로 등록한 선행 작업은 끝나기만 기다리고 (실패 / 취소돼도) 취소를 옮기지 않는다.
+    예외는 모든 작업이 끝난 뒤 첫 번째 것을 다시 던진다.
+    """
+
+    def __init__(self):
+        self.tasks: Dict[str, Tuple] = {}          # 이름 → (순번, fn, args)
+        self.dependents: Dict[str, List[str]] = {}
+        self.soft: Set[Tuple[str, str]] = set()    # (선행 작업, 작업): after로 등록한 관계
+        self.waiting: Dict[str, int] = {}          # 이름 → 끝나지 않은 선행 작업 수
+        self.results: Dict[str, object] = {}
+        self.failed: List[str] = []
+        self.cancelled: List[str] = []
+        self._futures: Dict[Future, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    def add(self, name: str, fn, *args, deps: Iterable[str] = (),
+            after: Iterable[str] = ()) -> str:
+        """작업 등록 (선행 작업은 먼저 등록되어 있어야 함, after는 성공하지 않아도 됨)"""
+        if name in self.tasks:
+            raise ValueError(f"이미 등록된 작업: {name}")
+        deps = set(deps)
+        after = set(after) - deps
+        for dep in deps | after:
+            if dep not in self.tasks:
+                raise ValueError(f"등록되지 않은 선행 작업: {dep} ({name})")
+            self.dependents[dep].append(name)
+        self.soft.update((dep, name) for dep in after)
+        self.tasks[name] = (len(self.tasks), fn, args)
+        self.dependents[name] = []
+        self.waiting[name] = len(deps) + len(after)
+        return name
+
+    def run(self, pool: Optional[ThreadPoolExecutor] = None, limit: int = 1):
+        ready = [(order, name) for name, (order, _, _) in self.tasks.items()
+                 if not self.waiting[name]]
+        heapq.heapify(ready)
+        error: Optional[BaseException] = None
+
+        try:
+            while ready or self._futures:
+                # 빈 자리만큼 준비된 작업 시작
+                while ready and (pool is None or len(self._futures) < max(1, limit)):
+                    _, name = heapq.heappop(ready)
+                    _, fn, args = self.tasks[name]
+                    if pool is None:
+                        future = Future()
+                        try:
+                            future.set_result(fn(*args))
+                        except Exception as e:
+                            future.set_exception(e)
+                        self._futures[future] = name
+                        break
+                    self._futures[pool.submit(fn, *args)] = name
+
+                done, _ = wait(list(self._futures), return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: self.tasks[self._futures[f]][0]):
+                    name = self._futures.pop(future)
+                    exception = future.exception()
+                    if exception is not None:
+                        print(f"❌ 작업 실패: {name} - {exception}")
+                        error = error or exception
+                    result = None if exception is not None else future.result()
+                    if result is None:
+                        self.failed.append(name)
+                        self._cancel(name, ready)
+                        continue
+                    self.results[name] = result
+                    for dependent in self.dependents[name]:
+                        self.waiting[dependent] -= 1
+                        if not self.waiting[dependent]:
+                            heapq.heappush(ready, (self.tasks[dependent][0], dependent))
+        except KeyboardInterrupt:
+            # 대기 중인 작업은 버리고 실행 중인 요청만 끝낸 뒤 중단
+            for future in self._futures:
+                future.cancel()
+            raise
+
+        if error is not None:
+            raise error
+
+    def _cancel(self, name: str, ready: List[Tuple[int, str]]):
+        """실패한 작업에 기대는 작업 모두 취소 (after로 기다리던 작업은 끝난 것으로 셈)"""
+        stack = [name]
+        while stack:
+            current = stack.pop()
+            for dependent in self.dependents[current]:
+                if self.waiting[dependent] < 0:
+                    continue
+                if (current, dependent) in self.soft:
+                    self.waiting[dependent] -= 1
+                    if not self.waiting[dependent]:
+                        heapq.heappush(ready, (self.tasks[dependent][0], dependent))
+                    continue
+                self.waiting[dependent] = -1
+                self.cancelled.append(dependent)
+                stack.append(dependent)
+
+
+class PlanUploader:
+    """
+    파싱된 Cycles / Modules / Issues를 Plane에 업로드
+
+    upload()는 생성과 연결을 작업 그래프(TaskGraph)로 만들어 최대 concurrency개의
+    워커 스레드로 실행한다. 각 작업은 자기가 필요로 하는 Cycle / Module / Issue
+    묶음에만 기대므로 Module 1의 Issues 생성, Module 2 생성, Cycle 연결이 서로
+    겹쳐 돌고, 실패한 작업에 기대는 작업만 취소된다. concurrency가 1이면
+    기획서 순서대로 하나씩 실행한다. 파이프라인 모드는 파싱 순서대로 Module마다
+    처리하고 Cycle 연결은 맨 끝에 한다.
+    어느 경로든 module_data_list의 Issue ID 순서는 기획서 순서와 같다.
+
+    Issue → Module 연결은 Issue마다 하지 않고, Module의 Issues가 모두
+    만들어진 뒤 link_chunk_size개씩 묶어 한 번에 요청한다.
+
+    서버에 일괄 생성 엔드포인트가 있으면 (client.bulk_issues) 처음 만드는
+    Issue는 bulk_size개씩 묶어 한 요청으로 만든다. 수정/건너뛰기 대상은
+    기존처럼 Issue마다 처리한다.
+
+    manifest(SyncManifest)가 있으면 동기화 모드로 동작한다: 처음 보는 항목만
+    생성(POST)하고, 내용 해시가 바뀐 항목은 수정(PATCH)하고, 그대로인 항목은
+    요청 없이 건너뛴다. 이미 연결된 Issue는 다시 연결하지 않는다.
+    reuse_ids가 False면 manifest에 기록만 하고 (저널용) 기존 항목을 찾지 않으므로
+    이름이 같은 Module도 따로 만든다 (--sync / --resume 없는 일반 업로드).
+    verbose가 False면 변경 없는 항목과 Cycle 연결 진행은 출력하지 않는다 (--watch).
+
+    Cycle 배정은 Issue마다 자기 날짜(start_date, 없으면 target_date, 둘 다
+    없으면 Module start_date)로 CycleIndex에서 찾고, Cycle마다 한 번에 연결한다.
+    여러 Cycle 기간에 걸리면 cycle_overlap 정책을 따른다 (CycleIndex 참고).
+    """
+
+    KIND_LABELS = {'cycles': 'Cycle', 'modules': 'Module', 'issues': 'Issue'}
+
+    def __init__(self, client: PlaneAPIClient, concurrency: int = 1,
+                 manifest: Optional[SyncManifest] = None, cycle_overlap: str = 'latest',
+                 verbose: bool = True, reuse_ids: bool = True):
+        self.client = client
+        self.concurrency = max(1, concurrency)
+        self.manifest = manifest
+        self.reuse_ids = reuse_ids
+        self.cycle_overlap = cycle_overlap
+        self.verbose = verbose
+        self.cycle_list: List[Dict] = []        # Cycle 정보 저장 (Issue 연결용)
+        self.module_data_list: List[Dict] = []  # Module 정보 저장 (Cycle 연결용)
+        self.counts = {'created': 0, 'updated': 0, 'skipped': 0, 'failed': 0}
+        self._pending: List = []  # 동시 업로드 중 제출된 작업 (중단 시 취소)
+        self._lock = threading.Lock()
+
+    def upload(self, cycles: List[Cycle], modules: List[Module]):
+        """Cycles / Modules / Issues 생성과 연결을 작업 그래프로 실행 (build_graph 참고)"""
+        graph, layout = self.build_graph(cycles, modules)
+        counts = {}
+        for name in graph.tasks:
+            kind = name.split(' ', 1)[0]
+            counts[kind] = counts.get(kind, 0) + 1
+        print(f"🗺️  업로드 작업 {len(graph)}개 (" + ", ".join(
+            f"{self.TASK_LABELS[kind]} {count}개" for kind, count in counts.items()) + ")")
+        if self.concurrency > 1:
+            print(f"⚡ 동시 업로드 모드 (워커 {self.concurrency}개)")
+        print()
+
+        pool = (ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='upload')
+                if self.concurrency > 1 else None)
+        try:
+            with self.client.instrumentation.span('upload graph', 'upload', tasks=len(graph)):
+                graph.run(pool, self.concurrency)
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True)
+            self._collect_graph(graph, layout)
+            if self.manifest:
+                self.manifest.save()
+
+        print()
+        if graph.cancelled:
+            print(f"⛔ 선행 작업이 실패해 건너뛴 작업 {len(graph.cancelled)}개")
+            for name in graph.cancelled[:10]:
+                print(f"   - {name}")
+            if len(graph.cancelled) > 10:
+                print(f"   ... 외 {len(graph.cancelled) - 10}개")
+            print()
+
+    TASK_LABELS = {'cycle': 'Cycle', 'module': 'Module', 'issues': 'Issue 묶음',
+                   'link-module': 'Module 연결', 'link-cycle': 'Cycle 연결'}
+
+    def build_graph(self, cycles: List[Cycle],
+                    modules: List[Module]) -> Tuple['TaskGraph', Tuple[List, List]]:
+        """
+        업로드 작업 그래프와 (Cycle 작업 목록, Module 작업 배치) 반환
+
+        Issue 묶음은 자기 Module에, Module 연결은 그 Module과 Issue 묶음들에 기댄다.
+        Cycle 연결은 Cycle마다 하나로 (연결 요청을 Cycle마다 한 번에), 그 Cycle에 기대고
+        해당 Issue가 든 묶음들은 끝나기만 기다린다 (실패한 Module의 Issue만 빠짐).
+        Cycle 배정은 기획서 날짜만으로 정해지므로 업로드 전에 미리 계산한다.
+        """
+        graph = TaskGraph()
+        cycle_tasks = [graph.add(f"cycle {position}: {cycle.name}", self._ensure_cycle, cycle)
+                       for position, cycle in enumerate(cycles)]
+
+        layout = []
+        located: Dict[Tuple[int, int], str] = {}  # (Module 위치, Issue 위치) → 묶음 작업
+        for m, module in enumerate(modules):
+            module_task = graph.add(f"module {m}: {module.name}", self._ensure_module, module)
+            keys, batches = self._issue_batches(module)
+            batch_tasks = []
+            for b, (bulk, indexes) in enumerate(batches):
+                job = self._create_issue_batch if bulk else self._ensure_issues
+                name = graph.add(f"issues {m}.{b}: {module.name}", job,
+                                 [keys[i] for i in indexes], [module.issues[i] for i in indexes],
+                                 deps=[module_task])
+                batch_tasks.append((name, indexes))
+                located.update(((m, i), name) for i in indexes)
+            graph.add(f"link-module {m}: {module.name}", self._link_module_task,
+                      graph, module_task, keys, batch_tasks,
+                      deps=[module_task] + [name for name, _ in batch_tasks])
+            layout.append((module, module_task, keys, batch_tasks))
+
+        cycle_infos = [{'name': cycle.name, 'start_date': cycle.start_date,
+                        'end_date': cycle.end_date, 'position': position, 'task': task}
+                       for position, (cycle, task) in enumerate(zip(cycles, cycle_tasks))]
+        entries = (
+            (module.name, (m, i),
+             parse_date(issue.start_date or issue.target_date) or parse_date(module.start_date))
+            for m, module in enumerate(modules) for i, issue in enumerate(module.issues)
+        )
+        for cycle_info, items, _ in self._assign(cycle_infos, entries):
+            by_module: Dict[int, List[int]] = {}
+            for m, i in items:
+                by_module.setdefault(m, []).append(i)
+            graph.add(f"link-cycle {cycle_info['position']}: {cycle_info['name']}",
+                      self._link_cycle_task, graph, cycle_info, layout, by_module,
+                      deps=[cycle_info['task']], after={located[item] for item in items})
+
+        return graph, (list(zip(cycles, cycle_tasks)), layout)
+
+    def _link_module_task(self, graph: 'TaskGraph', module_task: str, keys: List[str],
+                          batch_tasks: List[Tuple[str, List[int]]]) -> bool:
+        issue_ids = self._batch_results(graph, len(keys), batch_tasks)
+        self._link_module(graph.results[module_task],
+                          [key for key, issue_id in zip(keys, issue_ids) if issue_id],
+                          [issue_id for issue_id in issue_ids if issue_id])
+        return True
+
+    def _link_cycle_task(self, graph: 'TaskGraph', cycle_info: Dict, layout: List,
+                         by_module: Dict[int, List[int]]) -> bool:
+        linked = []
+        lines = []
+        for m, indexes in by_module.items():
+            module, _, keys, batch_tasks = layout[m]
+            issue_ids = self._batch_results(graph, len(keys), batch_tasks)
+            found = [(keys[i], issue_ids[i]) for i in indexes if issue_ids[i]]
+            linked.extend(found)
+            lines.append(f"🔗 {module.name} → {cycle_info['name']} ({len(found)}개)")
+        if self.verbose:
+            print("\n".join(lines))
+        self._link_cycle(graph.results[cycle_info['task']],
+                         [key for key, _ in linked], [issue_id for _, issue_id in linked])
+        return True
+
+    @staticmethod
+    def _batch_results(graph: 'TaskGraph', size: int,
+                       batch_tasks: List[Tuple[str, List[int]]]) -> List[Optional[str]]:
+        """끝난 Issue 묶음 작업의 결과를 기획서 위치로 모음 (없는 묶음은 None)"""
+        issue_ids: List[Optional[str]] = [None] * size
+        for name, indexes in batch_tasks:
+            for index, issue_id in zip(indexes, graph.results.get(name) or ()):
+                issue_ids[index] = issue_id
+        return issue_ids
+
+    def _collect_graph(self, graph: 'TaskGraph', layout: Tuple[List, List]):
+        """작업 결과로 cycle_list / module_data_list를 기획서 순서로 채움"""
+        cycle_tasks, modules = layout
+        for cycle, task in cycle_tasks:
+            cycle_id = graph.results.get(task)
+            if cycle_id:
+                self._add_cycle_data(cycle, cycle_id)
+        for module, module_task, keys, batch_tasks in modules:
+            module_id = graph.results.get(module_task)
+            if not module_id:
+                continue
+            issue_ids = self._batch_results(graph, len(keys), batch_tasks)
+            self._add_module_data(module, module_id,
+                                  [key for key, issue_id in zip(keys, issue_ids) if issue_id],
+                                  [issue_id for issue_id in issue_ids if issue_id])
+
+    def _upload_cycle(self, cycle: Cycle):
+        """Cycle 생성 후 정보 저장"""
+        cycle_id = self._ensure_cycle(cycle)
+        if cycle_id:
+            self._add_cycle_data(cycle, cycle_id)
+
+    def _add_cycle_data(self, cycle: Cycle, cycle_id: str):
+        """Cycle 정보 저장"""
+        self.cycle_list.append({
+            'id': cycle_id,
+            'name': cycle.name,
+            'start_date': cycle.start_date,
+            'end_date': cycle.end_date
+        })
+
+    def _upload_module(self, module: Module, pool: Optional[ThreadPoolExecutor] = None):
+        """Module 하나와 그 Issues 생성 후 일괄 연결 (pool이 있으면 Issues를 동시에)"""
+        # Module 생성
+        module_id = self._ensure_module(module)
+        if not module_id:
+            return
+
+        # Issues 생성
+        issue_keys, issue_ids = self._collect_issues(*self._submit_issues(pool, module))
+
+        # Module에 Issues 일괄 연결
+        self._link_module(module_id, issue_keys, issue_ids)
+
+        self._add_module_data(module, module_id, issue_keys, issue_ids)
+
+    def upload_pipelined(self, items: Iterable[Union[Module, Cycle]], queue_size: int = 4):
+        """
+        파싱과 업로드를 겹쳐서 실행
+
+        items(YAMLMarkdownParser.iter_parse())는 별도 스레드에서 돌면서 완성된
+        Module / Cycle을 크기 queue_size의 큐에 넣고, 이 스레드는 큐에서 꺼내는
+        대로 바로 생성한다. 큐가 차면 파서가 기다리므로 메모리에 쌓이는 양이
+        제한된다. Cycle 연결은 모든 Module을 만든 뒤 한 번에 한다.
+        """
+        print(f"🧵 파이프라인 모드 (큐 크기 {queue_size})\n")
+
+        work = self._start_parser(items, queue_size)
+        instrumentation = self.client.instrumentation
+        pool = (ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='upload')
+                if self.concurrency > 1 else None)
+
+        try:
+            while True:
+                item = work.get()
+                if item is self._FINISHED:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+
+                if isinstance(item, Cycle):
+                    self._upload_cycle(item)
+                else:
+                    self._ensure_labels(item)
+                    self._upload_module(item, pool)
+                print()
+
+            with instrumentation.span('link cycles', 'upload'):
+                self.link_cycles()
+        except KeyboardInterrupt:
+            for f in self._pending:
+                f.cancel()
+            raise
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True)
+            if self.manifest:
+                self.manifest.save()
+
+    _FINISHED = object()  # 파이프라인 큐의 끝 표시
+
+    def _ensure_labels(self, module: Module):
+        """파이프라인 모드: Module의 Issues가 쓰는 라벨 중 없는 것을 만들기 전에 생성"""
+        if self.client.metadata is not None:
+            self.client.metadata.ensure_labels(
+                (label for issue in module.issues for label in issue.labels),
+                concurrency=self.concurrency)
+
+    def _start_parser(self, items: Iterable[Union[Module, Cycle]], queue_size: int) -> queue.Queue:
+        """파서 스레드 시작: 완성된 항목, 파싱 오류, 끝 표시(_FINISHED)를 차례로 큐에 넣음"""
+        work: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        instrumentation = self.client.instrumentation
+
+        def produce():
+            # 큐에서 기다린 시간은 빼고 항목 하나를 파싱한 시간만 기록
+            iterator = iter(items)
+            try:
+                while True:
+                    with instrumentation.span('parse item', 'parse'):
+                        item = next(iterator, self._FINISHED)
+                    if item is self._FINISHED:
+                        break
+                    work.put(item)
+            except BaseException as e:  # 파싱 오류는 업로드 스레드에서 다시 발생
+                work.put(e)
+                return
+            work.put(self._FINISHED)
+
+        threading.Thread(target=produce, name='plan-parser', daemon=True).start()
+        return work
+
+    def _submit(self, pool: Optional[ThreadPoolExecutor], fn, *args) -> Future:
+        """작업 제출 후 (중단 시 취소할 수 있도록) 대기 목록에 보관 (pool이 없으면 바로 실행)"""
+        if pool is None:
+            future = Future()
+            future.set_result(fn(*args))
+            return future
+        future = pool.submit(fn, *args)
+        self._pending.append(future)
+        return future
+
+    def _submit_issues(self, pool: Optional[ThreadPoolExecutor],
+                       module: Module) -> Tuple[List[str], List[Tuple[List[int], Future]]]:
+        """
+        Module의 Issues 생성 작업 제출: (keys, [(Issue 위치 목록, future)])
+
+        future는 위치 순서대로 Issue ID 목록을 돌려준다. 일괄 생성을 쓸 수 있으면
+        처음 만드는 Issue는 bulk_size개씩 한 작업으로, 나머지는 Issue마다 한 작업으로.
+        """
+        keys, batches = self._issue_batches(module)
+        jobs = []
+        for bulk, indexes in batches:
+            job = self._create_issue_batch if bulk else self._ensure_issues
+            jobs.append((indexes, self._submit(pool, job, [keys[i] for i in indexes],
+                                               [module.issues[i] for i in indexes])))
+        return keys, jobs
+
+    def _issue_batches(self, module: Module) -> Tuple[List[str], List[Tuple[bool, List[int]]]]:
+        """
+        Module의 Issues를 작업 단위로 나눔: (keys, [(일괄 생성 여부, Issue 위치 목록)])
+
+        일괄 생성을 쓸 수 있으면 처음 만드는 Issue는 bulk_size개씩 한 묶음,
+        나머지(수정/건너뛰기 대상)는 Issue마다 하나.
+        """
+        keys = [issue_key(module, issue) for issue in module.issues]
+        bulk = bool(self.client.bulk_issues) and self.client.bulk_size > 1
+        batches = []
+        new = []
+        for index, key in enumerate(keys):
+            if bulk and not self._entry('issues', key):
+                new.append(index)
+            else:
+                batches.append((False, [index]))
+
+        size = max(1, self.client.bulk_size)
+        batches.extend((True, new[start:start + size]) for start in range(0, len(new), size))
+        return keys, batches
+
+    @staticmethod
+    def _collect_issues(keys: List[str],
+                        jobs: List[Tuple[List[int], Future]]) -> Tuple[List[str], List[str]]:
+        """작업 결과를 기획서 순서로 모아 (성공한 keys, Issue IDs) 반환"""
+        results: List[Optional[str]] = [None] * len(keys)
+        for indexes, future in jobs:
+            for index, issue_id in zip(indexes, future.result()):
+                results[index] = issue_id
+        issue_keys = [key for key, issue_id in zip(keys, results) if issue_id]
+        issue_ids = [issue_id for issue_id in results if issue_id]
+        return issue_keys, issue_ids
+
+    def _add_module_data(self, module: Module, module_id: str,
+                         issue_keys: List[str], issue_ids: List[str]):
+        """Module 정보 저장 (Cycle 배정용 Issue 날짜 포함)"""
+        issues = {issue_key(module, issue): issue for issue in module.issues}
+        self.module_data_list.append({
+            'id': module_id,
+            'name': module.name,
+            'start_date': module.start_date,
+            'issue_keys': issue_keys,
+            'issue_ids': issue_ids,
+            'issue_dates': [issues[key].start_date or issues[key].target_date
+                            for key in issue_keys],
+        })
+
+    def assign_cycles(self) -> List[Tuple[Dict, List[str], List[str], Dict[str, int]]]:
+        """
+        Issue마다 날짜로 Cycle을 골라 Cycle별로 묶음
+
+        [(cycle_info, issue_keys, issue_ids, {Module 이름: Issue 수})]를 Cycle 시작일
+        순으로 반환한다. 배정된 Issue가 없는 Cycle은 빠진다.
+        """
+        entries = (
+            (module_data['name'], (key, issue_id),
+             parse_date(issue_date) or parse_date(module_data['start_date']))
+            for module_data in self.module_data_list
+            for key, issue_id, issue_date in zip(module_data['issue_keys'],
+                                                 module_data['issue_ids'],
+                                                 module_data['issue_dates'])
+        )
+        return [(cycle_info, [key for key, _ in items], [issue_id for _, issue_id in items],
+                 modules)
+                for cycle_info, items, modules in self._assign(self.cycle_list, entries)]
+
+    def _assign(self, cycle_infos: List[Dict], entries: Iterable[Tuple[str, object,
+                                                                       Optional[datetime.date]]]
+                ) -> List[Tuple[Dict, List, Dict[str, int]]]:
+        """
+        (Module 이름, 항목, 날짜)마다 Cycle을 골라 묶음
+
+        [(cycle_info, 항목 목록, {Module 이름: Issue 수})]를 Cycle 시작일 순으로
+        반환한다. 배정된 항목이 없는 Cycle은 빠진다.
+        """
+        index = CycleIndex(cycle_infos, self.cycle_overlap)
+        for cycle_info in index.invalid:
+            print(f"  ⚠️  기간을 알 수 없는 Cycle은 건너뜀: {cycle_info['name']}")
+
+        assigned = [([], {}) for _ in range(len(index))]
+        overlapping = 0
+        for module_name, item, day in entries:
+            position, overlaps = index.assign(day)
+            overlapping += overlaps
+            if position is None:
+                continue
+            items, modules = assigned[position]
+            items.append(item)
+            modules[module_name] = modules.get(module_name, 0) + 1
+
+        if overlapping:
+            policy = {'latest': '가장 늦게 시작한 Cycle에 연결',
+                      'earliest': '가장 먼저 시작한 Cycle에 연결',
+                      'skip': '연결하지 않음'}[self.cycle_overlap]
+            print(f"  ⚠️  여러 Cycle 기간에 걸친 Issue {overlapping}개: {policy}\n")
+
+        return [(index.cycles[i], items, modules)
+                for i, (items, modules) in enumerate(assigned) if items]
+
+    def link_cycles(self):
+        """Issue 날짜에 해당하는 Cycle에 Issues 연결 (Cycle마다 한 번)"""
+        if not (self.cycle_list and self.module_data_list):
+            return
+
+        print("🔗 Cycles에 Issues 연결 중...\n")
+
+        for cycle_info, cycle_keys, cycle_issues, modules in self.assign_cycles():
+            for name, count in modules.items():
+                print(f"  {name} → {cycle_info['name']} ({count}개)")
+
+            # Cycle에 Issues 추가
+            self._link_cycle(cycle_info['id'], cycle_keys, cycle_issues)
+
+            print()
+
+    # ---- 동기화 ----
+
+    def _ensure_cycle(self, cycle: Cycle) -> Optional[str]:
+        return self._ensure(
+            'cycles', cycle_key(cycle), cycle.name, self.client.cycle_payload(cycle),
+            lambda: self.client.create_cycle(cycle),
+            lambda cycle_id: self.client.update_cycle(cycle_id, cycle)
+        )
+
+    def _ensure_module(self, module: Module) -> Optional[str]:
+        return self._ensure(
+            'modules', module_key(module), module.name, self.client.module_payload(module),
+            lambda: self.client.create_module(module),
+            lambda module_id: self.client.update_module(module_id, module)
+        )
+
+    def _ensure_issue(self, key: str, issue: Issue) -> Optional[str]:
+        return self._ensure(
+            'issues', key, issue.name, self.client.issue_payload(issue),
+            lambda: self.client.create_issue(issue),
+            lambda issue_id: self.client.update_issue(issue_id, issue),
+            indent="  "
+        )
+
+    def _ensure_issues(self, keys: List[str], issues: List[Issue]) -> List[Optional[str]]:
+        return [self._ensure_issue(key, issue) for key, issue in zip(keys, issues)]
+
+    def _create_issue_batch(self, keys: List[str], issues: List[Issue]) -> List[Optional[str]]:
+        """처음 만드는 Issues를 한 번에 생성하고 동기화 상태에 기록"""
+        payloads = [self.client.issue_payload(issue) for issue in issues]
+        issue_ids = self.client.create_issues(issues, payloads)
+        for key, payload, issue_id in zip(keys, payloads, issue_ids):
+            self._finish_create('issues', key, content_hash(payload), issue_id)
+        return issue_ids
+
+    def _ensure(self, kind: str, key: str, name: str, payload: Dict, create, update,
+                indent: str = "") -> Optional[str]:
+        """
+        동기화 상태에 따라 생성 / 수정 / 건너뛰기 후 Plane ID 반환
+
+        수정이 실패하면 기존 ID를 그대로 쓰고 해시는 갱신하지 않는다
+        (다음 실행에서 다시 수정). 원격에서 삭제된 항목은 새로 만든다.
+        """
+        action, item_id, digest = self._sync_action(kind, key, name, payload, indent)
+        if action == 'skip':
+            return item_id
+        if action == 'update' and self._finish_update(kind, key, digest, update(item_id)):
+            return item_id
+        return self._finish_create(kind, key, digest, create())
+
+    def _sync_action(self, kind: str, key: str, name: str, payload: Dict,
+                     indent: str = "") -> Tuple[str, Optional[str], Optional[str]]:
+        """동기화 상태로 할 일 결정: ('create' | 'update' | 'skip', 기존 ID, 내용 해시)"""
+        if self.manifest is None:
+            return 'create', None, None
+
+        digest = content_hash(payload)
+        entry = self._entry(kind, key)
+        if not entry:
+            return 'create', None, digest
+
+        if entry.get('hash') == digest:
+            if self.verbose:
+                print(f"{indent}⏭️  {self.KIND_LABELS[kind]} 변경 없음: {name}")
+            self._count('skipped')
+            return 'skip', entry['id'], digest
+        return 'update', entry['id'], digest
+
+    def _entry(self, kind: str, key: str) -> Optional[Dict]:
+        """동기화 상태의 기존 항목 (reuse_ids가 False면 기록만 하므로 항상 None)"""
+        if self.manifest is None or not self.reuse_ids:
+            return None
+        return self.manifest.get(kind, key)
+
+    def _finish_update(self, kind: str, key: str, digest: str, result: Optional[bool]) -> bool:
+        """수정 결과 기록. 원격에서 삭제되어(None) 새로 만들어야 하면 False"""
+        if result:
+            self.manifest.update(kind, key, hash=digest)
+            self._count('updated')
+            return True
+        if result is False:
+            self._count('failed')
+            return True
+        return False
+
+    def _finish_create(self, kind: str, key: str, digest: Optional[str],
+                       item_id: Optional[str]) -> Optional[str]:
+        """생성 결과 기록"""
+        if item_id:
+            if self.manifest is not None:
+                self.manifest.record(kind, key, item_id, digest)
+            self._count('created')
+        else:
+            self._count('failed')
+        return item_id
+
+    def _link_module(self, module_id: str, issue_keys: List[str], issue_ids: List[str]):
+        """아직 이 Module에 연결되지 않은 Issues만 연결"""
+        self._link('module', module_id, issue_keys, issue_ids, self.client.add_issues_to_module)
+
+    def _link_cycle(self, cycle_id: str, issue_keys: List[str], issue_ids: List[str]):
+        """아직 이 Cycle에 연결되지 않은 Issues만 연결"""
+        self._link('cycle', cycle_id, issue_keys, issue_ids, self.client.add_issues_to_cycle)
+
+    def _link(self, target: str, target_id: str, issue_keys: List[str],
+              issue_ids: List[str], add_issues):
+        pending = self._pending_links(target, target_id, issue_keys, issue_ids)
+        if pending:
+            add_issues(target_id, [issue_id for _, issue_id in pending])
+            self._record_links(target, target_id, pending)
+
+    def _pending_links(self, target: str, target_id: str, issue_keys: List[str],
+                       issue_ids: List[str]) -> List[Tuple[str, str]]:
+        """연결할 (key, Issue ID) 목록 (동기화 모드면 이미 연결된 Issue는 뺌)"""
+        return [
+            (key, issue_id) for key, issue_id in zip(issue_keys, issue_ids)
+            if (self._entry('issues', key) or {}).get(target) != target_id
+        ]
+
+    def _record_links(self, target: str, target_id: str, pending: List[Tuple[str, str]]):
+        """연결 결과를 동기화 상태에 기록"""
+        if self.manifest is None:
+            return
+
+        # 실패한 묶음에 든 Issue는 기록하지 않아 다음 실행에서 다시 연결
+        failed = {
+            issue_id
+            for failure in list(self.client.link_failures) if failure['id'] == target_id
+            for issue_id in failure['issue_ids']
+        }
+        for key, issue_id in pending:
+            if issue_id not in failed:
+                self.manifest.update('issues', key, **{target: target_id})
+
+    def _count(self, name: str):
+        with self._lock:
+            self.counts[name] += 1
+
+
+class AsyncPlanUploader(PlanUploader):
+    """
+    AsyncPlaneAPIClient로 업로드 (--async, 워커 스레드 없음)
+
+    Cycles → 모든 Modules → 모든 Issues → Module 연결 → Cycle 연결 순서로,
+    단계마다 요청을 한꺼번에 코루틴으로 띄운다. 동시에 나가는 요청 수는
+    클라이언트의 max_in_flight 세마포어가 제한한다. 일괄 생성, 동기화 상태,
+    결과 순서는 PlanUploader와 같다.
+
+    파이프라인 모드에서는 파서 스레드가 채우는 큐를 이벤트 루프에서 읽으며
+    Module마다 그 Issues를 동시에 만든다.
+    """
+
+    client: AsyncPlaneAPIClient
+
+    def upload(self, cycles: List[Cycle], modules: List[Module]):
+        """Cycles 생성 → Modules/Issues 생성 → Cycle에 Issues 연결"""
+        asyncio.run(self._upload(cycles, modules))
+
+    def upload_pipelined(self, items: Iterable[Union[Module, Cycle]], queue_size: int = 4):
+        """파싱과 업로드를 겹쳐서 실행 (PlanUploader.upload_pipelined 참고)"""
+        print(f"🧵 파이프라인 모드 (큐 크기 {queue_size})\n")
+        asyncio.run(self._upload_pipelined(self._start_parser(items, queue_size)))
+
+    async def _upload(self, cycles: List[Cycle], modules: List[Module]):
+        instrumentation = self.client.instrumentation
+        try:
+            async with self.client:
+                with instrumentation.span('cycles', 'upload', count=len(cycles)):
+                    if cycles:
+                        print("📅 Cycles 생성 중...\n")
+                        await self._upload_cycles(cycles)
+                        print()
+                with instrumentation.span('modules', 'upload', count=len(modules)):
+                    print("📦 Modules 및 Issues 생성 중...\n")
+                    print(f"⚡ 비동기 업로드 모드 (동시 요청 최대 {self.client.max_in_flight}개)\n")
+                    await self._upload_modules(modules)
+                    print()
+                with instrumentation.span('link cycles', 'upload'):
+                    await self._link_cycles()
+        finally:
+            if self.manifest:
+                self.manifest.save()
+
+    async def _upload_pipelined(self, work: queue.Queue):
+        instrumentation = self.client.instrumentation
+        loop = asyncio.get_running_loop()
+        try:
+            async with self.client:
+                while True:
+                    item = await loop.run_in_executor(None, work.get)
+                    if item is self._FINISHED:
+                        break
+                    if isinstance(item, BaseException):
+                        raise item
+
+                    if isinstance(item, Cycle):
+                        await self._upload_cycles([item])
+                    else:
+                        # 라벨 생성은 동기 요청이라 이벤트 루프 밖에서
+                        await loop.run_in_executor(None, self._ensure_labels, item)
+                        await self._upload_modules([item])
+                    print()
+
+                with instrumentation.span('link cycles', 'upload'):
+                    await self._link_cycles()
+        finally:
+            if self.manifest:
+                self.manifest.save()
+
+    async def _upload_cycles(self, cycles: List[Cycle]):
+        cycle_ids = await asyncio.gather(*(self._ensure_cycle_async(c) for c in cycles))
+        for cycle, cycle_id in zip(cycles, cycle_ids):
+            if cycle_id:
+                self._add_cycle_data(cycle, cycle_id)
+
+    async def _upload_modules(self, modules: List[Module]):
+        """Modules를 동시에 만든 뒤 모든 Issues를 동시에 만들고 Module마다 일괄 연결"""
+        module_ids = await asyncio.gather(*(self._ensure_module_async(m) for m in modules))
+        uploaded = [(module, module_id) for module, module_id in zip(modules, module_ids)
+                    if module_id]
+
+        results = await asyncio.gather(*(self._upload_issues(module) for module, _ in uploaded))
+        links = []
+        for (module, module_id), (issue_keys, issue_ids) in zip(uploaded, results):
+            self._add_module_data(module, module_id, issue_keys, issue_ids)
+            links.append(self._link_async('module', module_id, issue_keys, issue_ids,
+                                          self.client.add_issues_to_module))
+        await asyncio.gather(*links)
+
+    async def _upload_issues(self, module: Module) -> Tuple[List[str], List[str]]:
+        """Module의 Issues 생성 후 기획서 순서로 (성공한 keys, Issue IDs) 반환"""
+        keys, batches = self._issue_batches(module)
+        jobs = []
+        for bulk, indexes in batches:
+            job = self._create_issue_batch_async if bulk else self._ensure_issues_async
+            jobs.append(job([keys[i] for i in indexes], [module.issues[i] for i in indexes]))
+
+        results: List[Optional[str]] = [None] * len(keys)
+        for (_, indexes), issue_ids in zip(batches, await asyncio.gather(*jobs)):
+            for index, issue_id in zip(indexes, issue_ids):
+                results[index] = issue_id
+        issue_keys = [key for key, issue_id in zip(keys, results) if issue_id]
+        return issue_keys, [issue_id for issue_id in results if issue_id]
+
+    async def _link_cycles(self):
+        """Issue 날짜에 해당하는 Cycle에 Issues 연결 (Cycle들을 동시에)"""
+        if not (self.cycle_list and self.module_data_list):
+            return
+
+        print("🔗 Cycles에 Issues 연결 중...\n")
+        links = []
+        for cycle_info, cycle_keys, cycle_issues, modules in self.assign_cycles():
+            for name, count in modules.items():
+                print(f"  {name} → {cycle_info['name']} ({count}개)")
+            links.append(self._link_async('cycle', cycle_info['id'], cycle_keys, cycle_issues,
+                                          self.client.add_issues_to_cycle))
+        await asyncio.gather(*links)
+        print()
+
+    # ---- 동기화 ----
+
+    async def _ensure_cycle_async(self, cycle: Cycle) -> Optional[str]:
+        return await self._ensure_async(
+            'cycles', cycle_key(cycle), cycle.name, self.client.cycle_payload(cycle),
+            lambda: self.client.create_cycle(cycle),
+            lambda cycle_id: self.client.update_cycle(cycle_id, cycle)
+        )
+
+    async def _ensure_module_async(self, module: Module) -> Optional[str]:
+        return await self._ensure_async(
+            'modules', module_key(module), module.name, self.client.module_payload(module),
+            lambda: self.client.create_module(module),
+            lambda module_id: self.client.update_module(module_id, module)
+        )
+
+    async def _ensure_issues_async(self, keys: List[str],
+                                   issues: List[Issue]) -> List[Optional[str]]:
+        return [await self._ensure_async(
+            'issues', key, issue.name, self.client.issue_payload(issue),
+            lambda: self.client.create_issue(issue),
+            lambda issue_id: self.client.update_issue(issue_id, issue),
+            indent="  "
+        ) for key, issue in zip(keys, issues)]
+
+    async def _create_issue_batch_async(self, keys: List[str],
+                                        issues: List[Issue]) -> List[Optional[str]]:
+        payloads = [self.client.issue_payload(issue) for issue in issues]
+        issue_ids = await self.client.create_issues(issues, payloads)
+        for key, payload, issue_id in zip(keys, payloads, issue_ids):
+            self._finish_create('issues', key, content_hash(payload), issue_id)
+        return issue_ids
+
+    async def _ensure_async(self, kind: str, key: str, name: str, payload: Dict, create, update,
+                            indent: str = "") -> Optional[str]:
+        """_ensure()와 같은 규칙, create / update는 코루틴을 돌려주는 함수"""
+        action, item_id, digest = self._sync_action(kind, key, name, payload, indent)
+        if action == 'skip':
+            return item_id
+        if action == 'update' and self._finish_update(kind, key, digest, await update(item_id)):
+            return item_id
+        return self._finish_create(kind, key, digest, await create())
+
+    async def _link_async(self, target: str, target_id: str, issue_keys: List[str],
+                          issue_ids: List[str], add_issues):
+        pending = self._pending_links(target, target_id, issue_keys, issue_ids)
+        if pending:
+            await add_issues(target_id, [issue_id for _, issue_id in pending])
+            self._record_links(target, target_id, pending)
+
+
+class PlanDiff:
+    """
+    기획서 ↔ Plane 현재 상태 비교 (--plan, 아무것도 만들거나 고치지 않음)
+
+    프로젝트의 Cycles / Modules / Issues 목록을 (페이지까지 동시에) 받아
+    종류별로 ID 색인과 이름 색인(dict)을 만든 뒤, 기획서 항목마다 동기화 상태
+    파일의 ID → 이름 순으로 한 번씩만 찾아 생성 / 수정 / 유지로 나눈다.
+    어느 기획서 항목과도 맞지 않은 원격 항목은 삭제 후보로 보고만 한다.
+
+    수정 여부는 요청 본문 필드 중 원격 응답에 있는 필드만 비교한다
+    (날짜는 YYYY-MM-DD까지, 목록은 순서 무관). 업로드도 본문에 없는 필드는
+    건드리지 않으므로 같은 기준이다.
+    """
+
+    ACTIONS = ('create', 'update', 'skip', 'delete')
+    ACTION_LABELS = {'create': '생성', 'update': '수정', 'skip': '유지', 'delete': 'Plane에만 있음'}
+    ACTION_MARKS = {'create': '+', 'update': '~', 'delete': '-'}
+    _DATETIME = re.compile(r'^\d{4}-\d{2}-\d{2}T')
+
+    def __init__(self, client: PlaneAPIClient, concurrency: int = 4):
+        self.client = client
+        self.concurrency = max(1, concurrency)
+        self.remote: Dict[str, List[Dict]] = {}
+        # 종류 → 동작 → [(이름, 바뀐 필드)]
+        self.changes: Dict[str, Dict[str, List[Tuple[str, List[str]]]]] = {
+            kind: {action: [] for action in self.ACTIONS} for kind in SyncManifest.KINDS
+        }
+
+    def fetch(self) -> bool:
+        """원격 Cycles / Modules / Issues 목록을 동시에 조회 (하나라도 실패하면 False)"""
+        kinds = SyncManifest.KINDS
+        with ThreadPoolExecutor(max_workers=len(kinds), thread_name_prefix='plan') as pool:
+            fetched = list(pool.map(
+                lambda kind: self.client.list_all(f"{kind}/", concurrency=self.concurrency), kinds))
+        if any(items is None for items in fetched):
+            return False
+        self.remote = dict(zip(kinds, fetched))
+        return True
+
+    def compare(self, plans: Iterable[Tuple[List[Cycle], List[Module], Optional[SyncManifest]]]):
+        """기획서들(Cycles, Modules, 동기화 상태)을 원격 목록과 비교"""
+        indexes = {kind: self._index(items) for kind, items in self.remote.items()}
+        claimed = {kind: set() for kind in SyncManifest.KINDS}
+
+        def match(kind: str, key: str, name: str, payload: Dict, manifest: Optional[SyncManifest]):
+            by_id, by_name = indexes[kind]
+            remote = None
+            entry = manifest.get(kind, key) if manifest else None
+            if entry and entry.get('id') in by_id and entry['id'] not in claimed[kind]:
+                remote = by_id[entry['id']]
+            else:
+                candidates = by_name.get(name, [])
+                while candidates and remote is None:
+                    item = candidates.pop(0)
+                    if item['id'] not in claimed[kind]:
+                        remote = item
+
+            if remote is None:
+                self.changes[kind]['create'].append((name, []))
+                return
+            claimed[kind].add(remote['id'])
+            changed = self._changed_fields(payload, remote)
+            self.changes[kind]['update' if changed else 'skip'].append((name, changed))
+
+        client = self.client
+        for cycles, modules, manifest in plans:
+            for cycle in cycles:
+                match('cycles', cycle_key(cycle), cycle.name, client.cycle_payload(cycle), manifest)
+            for module in modules:
+                match('modules', module_key(module), module.name, client.module_payload(module),
+                      manifest)
+                for issue in module.issues:
+                    match('issues', issue_key(module, issue), issue.name,
+                          client.issue_payload(issue), manifest)
+
+        for kind, items in self.remote.items():
+            self.changes[kind]['delete'].extend(
+                (item.get('name') or item['id'], []) for item in items
+                if item['id'] not in claimed[kind]
+            )
+
+    @staticmethod
+    def _index(items: List[Dict]) -> Tuple[Dict[str, Dict], Dict[str, List[Dict]]]:
+        """ID → 항목, 이름 → 항목 목록 (같은 이름은 목록 순서대로 짝지음)"""
+        by_id: Dict[str, Dict] = {}
+        by_name: Dict[str, List[Dict]] = {}
+        for item in items:
+            if not item.get('id'):
+                continue
+            by_id[item['id']] = item
+            by_name.setdefault(item.get('name'), []).append(item)
+        return by_id, by_name
+
+    @classmethod
+    def _changed_fields(cls, payload: Dict, remote: Dict) -> List[str]:
+        return [name for name, value in payload.items()
+                if name in remote and cls._normalize(value) != cls._normalize(remote[name])]
+
+    @classmethod
+    def _normalize(cls, value):
+        """비교용 값: 펼친 객체는 ID로, 목록은 정렬, 날짜-시간은 날짜만, 빈 문자열은 None"""
+        if isinstance(value, dict):
+            return value.get('id')
+        if isinstance(value, (list, tuple)):
+            return sorted(str(v.get('id') if isinstance(v, dict) else v) for v in value)
+        if isinstance(value, str):
+            if cls._DATETIME.match(value):
+                return value[:10]
+            return value or None
+        return value
+
+    def summary(self) -> Dict:
+        """보고서용 요약 (종류별 동작 수와 항목 이름)"""
+        return {
+            kind: {action: {'count': len(items),
+                            'items': [dict(name=name, fields=changed) if changed else name
+                                      for name, changed in items]}
+                   for action, items in actions.items()}
+            for kind, actions in self.changes.items()
+        }
+
+    def print_summary(self, limit: int = 100):
+        """종류별 개수와 생성 / 수정 / 삭제 후보 항목 출력 (종류·동작마다 최대 limit개)"""
+        print("🧮 변경 계획 (Plane 현재 상태 기준)\n")
+        for kind in SyncManifest.KINDS:
+            label = PlanUploader.KIND_LABELS[kind]
+            counts = ", ".join(f"{self.ACTION_LABELS[action]} {len(self.changes[kind][action])}개"
+                               for action in self.ACTIONS)
+            print(f"   {label + 's:':<9}{counts}")
+        print()
+
+        for kind in SyncManifest.KINDS:
+            label = PlanUploader.KIND_LABELS[kind]
+            for action, mark in self.ACTION_MARKS.items():
+                items = self.changes[kind][action]
+                for name, changed in items[:limit]:
+                    detail = f" ({', '.join(changed)})" if changed else ""
+                    print(f"  {mark} {label}: {name}{detail}")
+                if len(items) > limit:
+                    print(f"  {mark} {label}: ... 외 {len(items) - limit}개")
+
+        if any(self.changes[kind]['delete'] for kind in SyncManifest.KINDS):
+            print("\n  ('-' 항목은 Plane에만 있는 항목입니다. 업로드는 삭제하지 않습니다.)")
+
+
+class PlanExporter:
+    """
+    Plane 프로젝트 → PLANE_PROJECT_TEMPLATE.md (--export, 업로드의 반대 방향)
+
+    Cycles / Modules 목록은 페이지까지 동시에 받아 시작일 순으로 쓰고, Module마다 소속 Issues
+    (modules/{id}/module-issues/)는 최대 concurrency개를 미리 받아 두면서
+    Module 순서대로 바로 파일에 쓴다. 다 쓴 Module의 Issues는 버리므로 문서 전체를
+    메모리에 만들지 않는다. 어느 Module에도 없는 Issue는 마지막에 'Module 없음'
+    Module로 모은다.
+
+    State / Label / 담당자 / 추정치 UUID는 ProjectMetadata로 이름으로 되돌린다.
+    Issue의 Cycle은 기획서 형식에 없으므로 쓰지 않는다 (업로드 때 날짜로 다시 배정).
+    write_manifest()는 내보낸 파일을 다시 파싱해 동기화 상태 파일을 만든다
+    (이어서 --sync로 고친 항목만 올릴 수 있도록). 동기화 상태에서 이름이 키이므로
+    이름이 같은 Cycle / Module은 ' (2)'처럼 번호를 붙여 내보낸다.
+    """
+
+    UNASSIGNED = "Module 없음"
+    PLACEHOLDER_DESCRIPTION = DescriptionRenderer.PLACEHOLDER  # issue_payload()가 빈 설명 대신 보내는 값
+
+    def __init__(self, client: PlaneAPIClient, metadata: ProjectMetadata,
+                 concurrency: int = 4, per_page: int = 100):
+        self.client = client
+        self.concurrency = max(1, concurrency)
+        self.per_page = per_page
+        self.identifier = "PROJ"
+        self.counts = {'cycles': 0, 'modules': 0, 'issues': 0}
+        self.ids: Dict[str, Dict[str, Dict]] = {kind: {} for kind in SyncManifest.KINDS}
+        self._sequence = 0  # sequence_id가 없는 Issue 번호
+        self._names: Dict[str, set] = {'cycles': set(), 'modules': set()}  # 이미 쓴 이름
+
+        raw = metadata._raw
+        self.state_names = {s['id']: s['name'] for s in raw['states'] if s.get('name')}
+        self.label_names = {l['id']: l['name'] for l in raw['labels'] if l.get('name')}
+        self.member_names = {}
+        for entry in raw['members']:
+            member = entry.get('member') if isinstance(entry.get('member'), dict) else entry
+            name = member.get('display_name') or (member.get('email') or '').split('@')[0]
+            if member.get('id') and name:
+                self.member_names[member['id']] = name
+        self.point_values = {point['id']: point['value']
+                             for estimate in raw['estimates']
+                             for point in estimate.get('points', []) if point.get('id')}
+
+    def export(self, path: str) -> bool:
+        """프로젝트를 path에 기획서로 저장 (임시 파일에 쓴 뒤 교체). 조회가 실패하면 False"""
+        project = self._get_project()
+        lists = {}
+        for kind in ('cycles', 'modules'):
+            lists[kind] = self.client.list_all(f"{kind}/", self.per_page, self.concurrency)
+            if lists[kind] is None:
+                return False
+            # 시작일 순 (없으면 뒤로), 같으면 Plane 목록 순서
+            lists[kind].sort(key=lambda item: str(parse_date(item.get('start_date')) or '~'))
+
+        identifier = str(project.get('identifier') or '')
+        if re.fullmatch(r'[A-Z]{3,7}', identifier):
+            self.identifier = identifier
+        else:
+            print(f"⚠️  기획서 형식에 맞지 않는 프로젝트 식별자라 {self.identifier}를 씁니다: "
+                  f"{identifier or '(없음)'}")
+
+        tmp_path = path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as out:
+                out.write(f"# {project.get('name') or self.client.project_id}\n\n"
+                          f"## 1. 프로젝트 개요\n\n"
+                          f"**프로젝트 식별자**: `{self.identifier}`\n\n"
+                          f"> Plane에서 내보냄: {self.client.project_url} "
+                          f"({time.strftime('%Y-%m-%d %H:%M')})\n\n")
+                if not self._write_modules(out, lists['modules']):
+                    return False
+                self._write_cycles(out, lists['cycles'])
+            if not self._collect_cycle_links(lists['cycles']):
+                return False
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return True
+
+    def _get_project(self) -> Dict:
+        """프로젝트 정보 (이름, 식별자). 조회할 수 없으면 빈 dict"""
+        try:
+            response = self.client._request('GET', f"{self.client.project_url}/")
+        except Exception as e:
+            print(f"⚠️  프로젝트 정보 조회 오류: {str(e)}")
+            return {}
+        if response.status_code != 200:
+            print(f"⚠️  프로젝트 정보 조회 실패 (Status: {response.status_code})")
+            return {}
+        return response.json()
+
+    def _write_modules(self, out, modules: List[Dict]) -> bool:
+        out.write("## 7. Modules 계획\n\n")
+        seen = set()
+        number = 0
+        for module, issues in self._prefetch(self._module_issues, modules):
+            if issues is None:
+                return False
+            number += 1
+            seen.update(issue['id'] for issue in issues)
+            self._write_module(out, number, module, issues)
+
+        # 어느 Module에도 없는 Issue
+        issues = self.client.list_all('issues/', self.per_page, self.concurrency)
+        if issues is None:
+            return False
+        unassigned = [issue for issue in issues if issue.get('id') not in seen]
+        del issues
+        if unassigned:
+            print(f"  ⚠️  Module에 없는 Issue {len(unassigned)}개는 "
+                  f"'{self.UNASSIGNED}' Module로 내보냅니다.")
+            self._write_module(out, number + 1, {'name': self.UNASSIGNED}, unassigned)
+        return True
+
+    def _module_issues(self, module: Dict) -> Tuple[Dict, Optional[List[Dict]]]:
+        return module, self.client.list_all(f"modules/{module['id']}/module-issues/",
+                                            self.per_page)
+
+    def _prefetch(self, fn, items: List):
+        """items 순서대로 fn 결과를 yield (앞으로 최대 concurrency개를 미리 조회)"""
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='export') as pool:
+            window = collections.deque()
+            for item in items:
+                window.append(pool.submit(fn, item))
+                if len(window) > self.concurrency:
+                    yield window.popleft().result()
+            while window:
+                yield window.popleft().result()
+
+    def _write_module(self, out, number: int, module: Dict, issues: List[Dict]):
+        issues = sorted(issues, key=lambda issue: (not isinstance(issue.get('sequence_id'), int),
+                                                   issue.get('sequence_id') or 0))
+        data = {'name': module['name'], 'description': module.get('description') or ''}
+        for field_name in ('start_date', 'target_date'):
+            day = parse_date(module.get(field_name))
+            if day:
+                data[field_name] = day.isoformat()
+        if module.get('lead') in self.member_names:
+            data['lead'] = '@' + self.member_names[module['lead']]
+        members = [f"@{self.member_names[m]}" for m in module.get('members') or []
+                   if m in self.member_names]
+        if members:
+            data['members'] = members
+        if module.get('status'):
+            data['status'] = module['status']
+
+        name = data['name'] = self._unique_name('modules', module['name'])
+        rendered = [self._render_issue(issue) for issue in issues]
+        points = sum(point for _, _, point in rendered if point)
+        out.write(f"### Module {number}: {name}\n{self._yaml_block(data)}\n"
+                  f"**Issues** ({len(issues)}개, {points}pt):\n\n")
+        for issue, (key, text, _) in zip(issues, rendered):
+            out.write(text)
+            entry = {'id': issue['id']}
+            if module.get('id'):
+                entry['module'] = module['id']
+            self.ids['issues'][key] = entry
+
+        if module.get('id'):
+            self.ids['modules'][name] = {'id': module['id']}
+            self.counts['modules'] += 1
+        self.counts['issues'] += len(issues)
+
+    def _render_issue(self, issue: Dict) -> Tuple[str, str, Optional[int]]:
+        """(기획서 번호, #### 제목 + YAML 블록, 추정치(정수면))"""
+        sequence = issue.get('sequence_id')
+        if not isinstance(sequence, int):
+            self._sequence += 1
+            sequence = self._sequence
+
+        data = {}
+        description = issue.get('description_html') or ''
+        if description and description != self.PLACEHOLDER_DESCRIPTION:
+            data['description_html'] = description
+        assignees = [f"@{self.member_names[m]}" for m in issue.get('assignees') or []
+                     if m in self.member_names]
+        if assignees:
+            data['assignees'] = assignees
+        labels = [self.label_names[l] for l in issue.get('labels') or [] if l in self.label_names]
+        if labels:
+            data['labels'] = labels
+        priority = issue.get('priority') or 'none'
+        data['priority'] = priority
+        point = self.point_values.get(issue.get('estimate_point'))
+        if point is not None:
+            data['estimate_point'] = int(point) if str(point).isdigit() else point
+        if issue.get('state') in self.state_names:
+            data['state'] = self.state_names[issue['state']]
+        for field_name in ('start_date', 'target_date'):
+            day = parse_date(issue.get(field_name))
+            if day:
+                data[field_name] = day.isoformat()
+
+        points = data.get('estimate_point') if isinstance(data.get('estimate_point'), int) else None
+        key = f"{self.identifier}-{sequence:03d}"
+        title = " ".join(str(issue.get('name') or '').split())
+        suffix = f" ({points}pt, {priority.capitalize()})" if points is not None else ""
+        return key, f"#### {key}: {title}{suffix}\n{self._yaml_block(data)}\n", points
+
+    def _write_cycles(self, out, cycles: List[Dict]):
+        if not cycles:
             return
+        out.write("## 8. Cycles 계획\n\n")
+        for number, cycle in enumerate(cycles, 1):
+            name = self._unique_name('cycles', cycle['name'])
+            data = {'name': name, 'description': cycle.get('description') or ''}
+            for field_name in ('start_date', 'end_date'):
+                day = parse_date(cycle.get(field_name))
+                if day:
+                    data[field_name] = day.isoformat()
+            if cycle.get('owned_by') in self.member_names:
+                data['owned_by'] = '@' + self.member_names[cycle['owned_by']]
+            out.write(f"### Cycle {number}: {name}\n{self._yaml_block(data)}\n")
+            self.ids['cycles'][name] = {'id': cycle['id']}
+            self.counts['cycles'] += 1
+
+    def _unique_name(self, kind: str, name: str) -> str:
+        """이번 내보내기에서 아직 안 쓴 이름 (같은 이름이 있으면 ' (2)', ' (3)' ... 을 붙임)"""
+        used = self._names[kind]
+        unique, number = name, 1
+        while unique in used:
+            number += 1
+            unique = f"{name} ({number})"
+        used.add(unique)
+        if unique != name:
+            label = 'Cycle' if kind == 'cycles' else 'Module'
+            print(f"  ⚠️  이름이 같은 {label}이 있어 '{unique}'(으)로 내보냅니다: {name}")
+        return unique
+
+    def _collect_cycle_links(self, cycles: List[Dict]) -> bool:
+        """Cycle마다 소속 Issue를 조회해 동기화 상태의 cycle 필드로 기록"""
+        keys = {entry['id']: key for key, entry in self.ids['issues'].items()}
+        for cycle, issues in self._prefetch(self._cycle_issues, cycles):
+            if issues is None:
+                return False
+            for issue in issues:
+                key = keys.get(issue.get('id') if isinstance(issue, dict) else issue)
+                if key:
+                    self.ids['issues'][key]['cycle'] = cycle['id']
+        return True
+
+    def _cycle_issues(self, cycle: Dict) -> Tuple[Dict, Optional[List]]:
+        return cycle, self.client.list_all(f"cycles/{cycle['id']}/cycle-issues/", self.per_page)
+
+    @staticmethod
+    def _yaml_block(data: Dict) -> str:
+        return "```yaml\n" + _yaml_dump(data) + "```\n"
+
+    def write_manifest(self, md_path: str, manifest_path: str) -> int:
+        """
+        내보낸 기획서를 다시 파싱해 동기화 상태 파일 저장, 기록한 항목 수 반환
+
+        해시는 업로드와 같은 요청 본문으로 계산하므로 바로 --sync하면 모두 '변경 없음'이다.
+        """
+        manifest = SyncManifest(manifest_path, self.client.api_url, self.client.workspace_slug,
+                                self.client.project_id)
+        parser = YAMLMarkdownParser.from_file(md_path)
+
+        def record(kind: str, key: str, payload: Dict):
+            entry = self.ids[kind].get(key)
+            if entry:
+                manifest.items[kind][key] = dict(entry, hash=content_hash(payload))
+
+        for item in parser.iter_parse():
+            if isinstance(item, Cycle):
+                record('cycles', cycle_key(item), self.client.cycle_payload(item))
+                continue
+            record('modules', module_key(item), self.client.module_payload(item))
+            for issue in item.issues:
+                record('issues', issue_key(item, issue), self.client.issue_payload(issue))
+
+        manifest.save()
+        return sum(len(items) for items in manifest.items.values())
+
+
+class PlanValidator:
+    """
+    파싱된 기획서 검증 (업로드 전에, API 요청 없이)
+
+    SCHEMA의 필드 규칙을 처음 한 번 검사 함수 목록으로 컴파일해 두고 Cycle / Module /
+    Issue마다 차례로 돌린다. 필드 규칙 밖에서 기간 순서(시작일 ≤ 종료일)와
+    동기화 상태 키 중복(같은 이름의 Cycle / Module, 같은 번호의 Issue)도 본다.
+    결과는 (줄 번호, 'error' | 'warning', 메시지) 목록이다.
+
+    오류는 Plane이 400으로 거부하거나 업로드 결과가 기획서와 달라지는 내용이라
+    하나라도 있으면 업로드하지 않는다 (--allow-invalid로 무시).
+    parse_plan_file()에서 파싱 워커 프로세스마다 돌므로 여러 기획서는 동시에 검증된다.
+    """
+
+    ISSUE_PRIORITIES = ('urgent', 'high', 'medium', 'low', 'none')
+    MODULE_STATUSES = ('backlog', 'planned', 'in-progress', 'paused', 'completed', 'cancelled')
+
+    # 필드 → 규칙 ('name': 빈 문자열이 아닌 문자열, 'text', 'date', 'member', 'names',
+    # 'points', 'html', 또는 허용 값 튜플)
+    SCHEMA = {
+        'Cycle': {'name': 'name', 'description': 'text', 'start_date': 'date',
+                  'end_date': 'date', 'owned_by': 'member'},
+        'Module': {'name': 'name', 'description': 'text', 'start_date': 'date',
+                   'target_date': 'date', 'lead': 'member', 'members': 'names',
+                   'status': MODULE_STATUSES},
+        'Issue': {'name': 'name', 'description_html': 'html', 'priority': ISSUE_PRIORITIES,
+                  'assignees': 'names', 'labels': 'names', 'start_date': 'date',
+                  'target_date': 'date', 'estimate_point': 'points', 'state': 'text'},
+    }
+    DATE_RANGES = {'Cycle': ('start_date', 'end_date'), 'Module': ('start_date', 'target_date'),
+                   'Issue': ('start_date', 'target_date')}
+
+    _compiled: Optional[Dict[str, List[Tuple[str, object]]]] = None
+
+    def __init__(self):
+        self.seen: Dict[Tuple[str, str], int] = {}  # (종류, 동기화 키) → 처음 나온 줄
+
+    @classmethod
+    def rules(cls) -> Dict[str, List[Tuple[str, object]]]:
+        """SCHEMA → {종류: [(필드, 검사 함수)]} (검사 함수는 문제가 없으면 None)"""
+        if cls._compiled is None:
+            cls._compiled = {kind: [(name, cls._rule(rule)) for name, rule in schema.items()]
+                             for kind, schema in cls.SCHEMA.items()}
+        return cls._compiled
+
+    @staticmethod
+    def _rule(rule):
+        if isinstance(rule, tuple):
+            return lambda value: (None if value in rule
+                                  else f"{value!r}는 허용되지 않음 ({', '.join(rule)} 중 하나)")
+        return {
+            'name': lambda value: (None if isinstance(value, str) and value.strip()
+                                   else "비어 있음"),
+            'text': lambda value: (None if value is None or isinstance(value, str)
+                                   else f"문자열이 아님: {value!r}"),
+            'member': lambda value: (None if value is None or isinstance(value, str)
+                                     else f"문자열이 아님: {value!r}"),
+            'date': lambda value: (None if value is None or parse_date(value) is not None
+                                   else f"YYYY-MM-DD 날짜가 아님: {value!r}"),
+            'names': lambda value: (None if all(isinstance(v, str) and v.strip() for v in value)
+                                    else f"문자열 목록이 아님: {list(value)!r}"),
+            'points': lambda value: (
+                None if value is None
+                or (isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0)
+                or (isinstance(value, str) and value.strip().isdigit())
+                else f"0 이상의 숫자가 아님: {value!r}"),
+            'html': lambda value: (None if isinstance(value, (str, DescriptionRef))
+                                   else f"문자열이 아님: {value!r}"),
+        }[rule]
+
+    def validate(self, cycles: List[Cycle], modules: List[Module]) -> List[Tuple[int, str, str]]:
+        """검증 결과 목록 (같은 인스턴스로 나눠 부르면 중복 검사는 이어서 함)"""
+        problems: List[Tuple[int, str, str]] = []
+        rules = self.rules()
+
+        def check(kind: str, item, label: str):
+            for name, rule in rules[kind]:
+                message = rule(getattr(item, name))
+                if message:
+                    problems.append((item.line, 'error', f"{label}: {name} {message}"))
+            start_field, end_field = self.DATE_RANGES[kind]
+            start, end = parse_date(getattr(item, start_field)), parse_date(getattr(item, end_field))
+            if start and end and end < start:
+                problems.append((item.line, 'error',
+                                 f"{label}: {end_field}({end})가 {start_field}({start})보다 빠름"))
+
+        def unique(kind: str, key: str, line: int, label: str):
+            first = self.seen.setdefault((kind, key), line)
+            if first != line:
+                problems.append((line, 'error', f"{label}: {first}번째 줄과 중복 "
+                                                f"(동기화 상태에서 같은 항목으로 취급됨)"))
+
+        for cycle in cycles:
+            label = f"Cycle {cycle.name}"
+            check('Cycle', cycle, label)
+            unique('cycles', cycle_key(cycle), cycle.line, label)
+            if bool(cycle.start_date) != bool(cycle.end_date):
+                problems.append((cycle.line, 'error',
+                                 f"{label}: start_date와 end_date는 함께 있어야 함"))
+
+        for module in modules:
+            label = f"Module {module.name}"
+            check('Module', module, label)
+            unique('modules', module_key(module), module.line, label)
+            for issue in module.issues:
+                label = f"Issue {issue.identifier or issue.name}"
+                check('Issue', issue, label)
+                unique('issues', issue_key(module, issue), issue.line, label)
+
+        return problems
+
+
+class PlanValidationError(ValueError):
+    """검증 오류가 있는 기획서 (파이프라인 모드에서 업로드를 멈출 때)"""
+
+
+def validated_items(parser_obj: YAMLMarkdownParser, path: str,
+                    allow_invalid: bool = False) -> Iterator[Union[Module, Cycle]]:
+    """
+    iter_parse()를 항목마다 검증하며 그대로 넘김 (파이프라인 모드)
+
+    오류가 있는 항목은 넘기지 않고 PlanValidationError를 던지므로 그 앞 항목까지만
+    업로드된다. allow_invalid면 출력만 하고 계속한다.
+    """
+    validator = PlanValidator()
+    reported = 0
+    for item in parser_obj.iter_parse():
+        problems = parser_obj.problems[reported:]
+        reported = len(parser_obj.problems)
+        if isinstance(item, Cycle):
+            problems += validator.validate([item], [])
+        else:
+            problems += validator.validate([], [item])
+        if print_problems(path, problems) and not allow_invalid:
+            raise PlanValidationError(f"{path}:{item.line}: {item.name}")
+        yield item
+
+
+def print_problems(path: str, problems: List[Tuple[int, str, str]], limit: int = 50) -> int:
+    """검증 결과를 줄 번호 순으로 출력하고 오류 수 반환"""
+    if not problems:
+        return 0
+    errors = sum(1 for _, level, _ in problems if level == 'error')
+    warnings = len(problems) - errors
+    mark = "❌" if errors else "⚠️ "
+    print(f"\n{mark} 기획서 검증: 오류 {errors}개, 경고 {warnings}개 ({path})")
+    for line, level, message in sorted(problems)[:limit]:
+        print(f"   {path}:{line}: {'오류' if level == 'error' else '경고'}: {message}")
+    if len(problems) > limit:
+        print(f"   ... 외 {len(problems) - limit}개")
+    return errors
+
+
+@dataclass
+class ParsedPlan:
+    """기획서 하나의 파싱 결과"""
+    path: str
+    project_identifier: str
+    modules: List[Module]
+    cycles: List[Cycle]
+    log: str = ""  # 파싱 중 출력된 경고 (워커 프로세스에서 모아 옴)
+    problems: List[Tuple[int, str, str]] = field(default_factory=list)  # 파싱 문제 + 검증 결과
+    parse_started: float = 0.0  # 파싱 시작 시각 (time.time(), 계측용)
+    parse_seconds: float = 0.0
+    cache: str = ""  # 파싱 캐시 사용 결과 (ParseCache)
+
+
+def _fields_of(obj) -> tuple:
+    return tuple(getattr(obj, f.name) for f in fields(obj))
+
+
+def _pack_plan(modules: List[Module], cycles: List[Cycle]) -> tuple:
+    """Module / Cycle / Issue를 기본 타입 튜플로 (클래스 경로와 무관하게 pickle 가능)"""
+    return ([(_fields_of(m)[:-1], [_fields_of(i) for i in m.issues]) for m in modules],
+            [_fields_of(c)[:-1] for c in cycles])
+
+
+def _unpack_plan(data: tuple) -> Tuple[List[Module], List[Cycle]]:
+    module_rows, cycle_rows = data
+    modules = [Module(*row, issues=[Issue(*i) for i in issues]) for row, issues in module_rows]
+    return modules, [Cycle(*row) for row in cycle_rows]
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """
+    파싱 결과 디스크 캐시
+
+    기획서마다 <cache_dir>/parse-<경로 해시>.bin 파일 하나에 파일 내용 해시와
+    파싱 결과, YAML 블록별 로드 결과를 pickle로 저장한다 (gzip 압축).
+      - 내용 해시와 파서 버전이 같으면 파싱하지 않고 결과를 쓴다 (yaml도 import 하지 않음).
+      - 내용이 바뀌었으면 다시 파싱하되, 내용이 같은 YAML 블록은 저장된
+        로드 결과를 재사용한다 (YAML 로드가 파싱 시간의 대부분).
+    캐시 파일이 없거나 읽을 수 없거나 버전이 다르면 처음부터 파싱한다.
+    lazy_descriptions 모드의 결과는 설명 대신 파일 위치를 담으므로 따로 취급한다.
+    """
+
+    def __init__(self, cache_dir: str, lazy_descriptions: bool = False):
+        self.cache_dir = cache_dir
+        self.lazy_descriptions = lazy_descriptions
+        self.version = f"{YAMLMarkdownParser.VERSION}:{'lazy' if lazy_descriptions else 'eager'}"
+
+    def cache_path(self, path: str) -> str:
+        digest = hashlib.sha256(os.path.abspath(path).encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"parse-{digest}.bin")
+
+    def parse(self, path: str) -> ParsedPlan:
+        """캐시를 거쳐 기획서 하나를 파싱"""
+        digest = _file_digest(path)
+        cache_path = self.cache_path(path)
+
+        header = self._read(cache_path, blocks=False)
+        if header and header['hash'] == digest:
+            modules, cycles = _unpack_plan(header['plan'])
+            return ParsedPlan(path, header['identifier'], modules, cycles, header['log'],
+                              list(header['problems']), cache="파일 변경 없음, 파싱 생략")
 
-    # 5. Plane API 클라이언트 생성
-    client = PlaneAPIClient(args.api_url, args.api_key, args.workspace, args.project)
+        blocks = (self._read(cache_path, blocks=True) or {}) if header else {}
+        plan, parser_obj = _parse_plan(path, blocks, self.lazy_descriptions)
+        if parser_obj.blocks_reused:
+            plan.cache = (f"YAML 블록 {parser_obj.blocks_reused}/"
+                          f"{len(parser_obj.yaml_blocks)}개 재사용")
+        self._write(cache_path, {
+            'version': self.version, 'hash': digest, 'identifier': plan.project_identifier,
+            'log': plan.log, 'problems': plan.problems,
+            'plan': _pack_plan(plan.modules, plan.cycles),
+        }, parser_obj.yaml_blocks)
+        return plan
 
-    # 6. Cycles 생성 (있으면)
-    print(f"\n" + "=" * 70)
-    print("🚀 Plane으로 업로드 중...")
-    print("=" * 70 + "\n")
+    def _read(self, cache_path: str, blocks: bool):
+        """헤더(파싱 결과) 또는 YAML 블록 표 읽기 (실패하면 None)"""
+        try:
+            with gzip.open(cache_path, 'rb') as f:
+                header = pickle.load(f)
+                if header.get('version') != self.version:
+                    return None
+                return pickle.load(f) if blocks else header
+        except Exception:  # 없거나 깨진 캐시 파일은 없는 것으로 취급
+            return None
+
+    def _write(self, cache_path: str, header: Dict, blocks: Dict[bytes, object]):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with gzip.open(tmp_path, 'wb', compresslevel=1) as f:
+                pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(blocks, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except (OSError, pickle.PicklingError) as e:
+            print(f"⚠️  파싱 캐시 저장 실패: {cache_path} - {e}")
+
+
+class PlanWatcher:
+    """
+    기획서 파일 변경 감시 (--watch)
+
+    리눅스에서는 inotify(ctypes)로 기획서가 있는 디렉터리를 감시한다. 편집기는
+    임시 파일에 쓴 뒤 이름을 바꿔 저장하는 경우가 많아 파일 대신 디렉터리를 본다.
+    inotify를 쓸 수 없으면 poll_interval초마다 mtime / 크기를 비교한다.
+    저장 한 번에 이벤트가 여러 개 생기므로 마지막 이벤트 뒤 debounce초 동안
+    조용해지면 바뀐 경로를 한 번에 돌려준다.
+    """
+
+    IN_CLOSE_WRITE = 0x08
+    IN_MOVED_TO = 0x80
+    EVENT = struct.Struct('iIII')  # wd, mask, cookie, len (뒤에 이름 len바이트)
+
+    def __init__(self, paths: List[str], debounce: float = 0.3, poll_interval: float = 0.5):
+        self.paths = {os.path.abspath(path): path for path in paths}
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self._watches: Dict[int, str] = {}
+        self._stamps = {path: self._stamp(path) for path in self.paths}
+        self._fd = self._inotify()
+        self.backend = 'inotify' if self._fd is not None else f"폴링 {poll_interval:g}초"
+
+    def _inotify(self) -> Optional[int]:
+        """inotify 디스크립터 (리눅스가 아니거나 쓸 수 없으면 None)"""
+        if not sys.platform.startswith('linux'):
+            return None
+        try:
+            import ctypes
+            import ctypes.util
+            libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+            fd = libc.inotify_init1(os.O_CLOEXEC | os.O_NONBLOCK)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+        for directory in sorted({os.path.dirname(path) for path in self.paths}):
+            wd = libc.inotify_add_watch(fd, os.fsencode(directory),
+                                        self.IN_CLOSE_WRITE | self.IN_MOVED_TO)
+            if wd < 0:  # 감시 개수 제한 등 → 폴링으로
+                os.close(fd)
+                return None
+            self._watches[wd] = directory
+        return fd
+
+    @staticmethod
+    def _stamp(path: str) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read(self, timeout: Optional[float]) -> set:
+        """inotify 이벤트를 기다려 바뀐 기획서 경로 집합 반환 (timeout이 지나면 빈 집합)"""
+        if not select.select([self._fd], [], [], timeout)[0]:
+            return set()
+        data = os.read(self._fd, 64 * 1024)
+        changed, offset = set(), 0
+        while offset < len(data):
+            wd, _, _, length = self.EVENT.unpack_from(data, offset)
+            offset += self.EVENT.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+            path = os.path.join(self._watches.get(wd, ''), name)
+            if path in self.paths:
+                changed.add(path)
+        return changed
+
+    def _poll(self, timeout: Optional[float]) -> set:
+        """timeout(없으면 poll_interval)초 뒤 mtime / 크기가 바뀐 기획서 경로 집합 반환"""
+        time.sleep(self.poll_interval if timeout is None else timeout)
+        changed = set()
+        for path, stamp in self._stamps.items():
+            current = self._stamp(path)
+            if current != stamp:
+                self._stamps[path] = current
+                changed.add(path)
+        return changed
+
+    def changes(self) -> Iterator[List[str]]:
+        """저장이 끝날 때마다 바뀐 기획서 경로 목록 (입력 순서)"""
+        wait = self._read if self._fd is not None else self._poll
+        while True:
+            changed = wait(None)
+            if not changed:
+                continue
+            while True:  # debounce: 이벤트가 멈출 때까지 모음
+                more = wait(self.debounce)
+                if not more:
+                    break
+                changed |= more
+            yield [path for abspath, path in self.paths.items() if abspath in changed]
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
 
-    cycle_list = []  # Cycle 객체와 ID 저장
-    if parser_obj.cycles:
-        print("📅 Cycles 생성 중...\n")
-        for cycle in parser_obj.cycles:
-            cycle_id = client.create_cycle(cycle)
-            if cycle_id:
-                cycle_list.append({
-                    'id': cycle_id,
-                    'name': cycle.name,
-                    'start_date': cycle.start_date,
-                    'end_date': cycle.end_date
-                })
-        print()
 
-    # 7. Modules와 Issues 생성
-    print("📦 Modules 및 Issues 생성 중...\n")
+def expand_plan_paths(patterns: List[str]) -> List[str]:
+    """
+    파일 / 디렉터리 / glob 패턴을 기획서 경로 목록으로 펼침
+
+    디렉터리는 바로 아래의 *.md 파일, glob 패턴은 일치하는 파일을 이름순으로.
+    같은 파일은 한 번만 포함한다. 찾을 수 없는 항목은 그대로 남겨 호출자가 보고한다.
+    """
+    paths = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            matches = sorted(glob.glob(os.path.join(pattern, '*.md')))
+        elif glob.has_magic(pattern):
+            matches = sorted(p for p in glob.glob(pattern) if os.path.isfile(p))
+        else:
+            matches = [pattern]
+
+        for path in matches:
+            if path not in paths:
+                paths.append(path)
+    return paths
+
+
+def _parse_plan(path: str, block_cache: Optional[Dict[bytes, object]] = None,
+                lazy_descriptions: bool = False) -> Tuple[ParsedPlan, YAMLMarkdownParser]:
+    """기획서 하나를 파싱 (출력은 log로 모음)"""
+    output = io.StringIO()
+    parser_obj = YAMLMarkdownParser.from_file(path, block_cache, lazy_descriptions)
+    with contextlib.redirect_stdout(output):
+        modules = parser_obj.parse()
+    plan = ParsedPlan(path, parser_obj.project_identifier, modules, parser_obj.cycles,
+                      output.getvalue(), list(parser_obj.problems))
+    return plan, parser_obj
+
+
+def parse_plan_file(path: str, cache_dir: Optional[str] = None,
+                    lazy_descriptions: bool = False) -> ParsedPlan:
+    """
+    기획서 하나를 파싱하고 검증 (프로세스 풀 워커에서도 호출됨)
+
+    cache_dir이 있으면 ParseCache를 쓴다. 검증은 캐시를 썼어도 매번 한다.
+    """
+    started_wall, started = time.time(), time.perf_counter()
+    if cache_dir:
+        plan = ParseCache(cache_dir, lazy_descriptions).parse(path)
+    else:
+        plan, _ = _parse_plan(path, lazy_descriptions=lazy_descriptions)
+    plan.problems += PlanValidator().validate(plan.cycles, plan.modules)
+    plan.parse_started = started_wall
+    plan.parse_seconds = time.perf_counter() - started
+    return plan
+
+
+def parse_plans(paths: List[str], workers: int = 0, cache_dir: Optional[str] = None,
+                lazy_descriptions: bool = False) -> List[ParsedPlan]:
+    """
+    여러 기획서를 프로세스 풀로 동시에 파싱 (결과는 입력 순서대로)
+
+    YAML 로드가 CPU를 쓰는 순수 Python 코드라 스레드 대신 프로세스를 쓴다.
+    파일이 하나이거나 workers가 1이면 현재 프로세스에서 파싱한다.
+    """
+    workers = workers or min(len(paths), os.cpu_count() or 1)
+    if len(paths) <= 1 or workers <= 1:
+        return [parse_plan_file(path, cache_dir, lazy_descriptions) for path in paths]
 
-    module_data_list = []  # Module 정보 저장 (Cycle 연결용)
+    from concurrent.futures import ProcessPoolExecutor  # multiprocessing은 여기서만 로드
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(parse_plan_file, paths, [cache_dir] * len(paths),
+                             [lazy_descriptions] * len(paths)))
+
+
+def print_parse_summary(modules: List[Module]) -> Tuple[int, int]:
+    """파싱 결과 출력 후 (Issue 수, Story Points 합계) 반환"""
+    print("=" * 70)
+    print("📊 파싱 결과")
+    print("=" * 70)
+
+    total_issues = 0
+    total_story_points = 0
 
     for module in modules:
-        # Module 생성
-        module_id = client.create_module(module)
+        issue_count = len(module.issues)
+        total_issues += issue_count
+
+        # Story Points 합계
+        module_points = sum(
+            issue.estimate_point for issue in module.issues
+            if issue.estimate_point is not None
+        )
+        total_story_points += module_points
 
-        if module_id:
-            issue_ids = []
+        print(f"\n📦 Module: {module.name}")
+        print(f"   기간: {module.start_date or 'N/A'} ~ {module.target_date or 'N/A'}")
+        print(f"   Issues: {issue_count}개, Story Points: {module_points}pt")
 
-            # Issues 생성
-            for issue in module.issues:
-                issue_id = client.create_issue(issue, module_id)
-                if issue_id:
-                    issue_ids.append(issue_id)
+        for issue in module.issues:
+            priority_emoji = {
+                'urgent': '🔥',
+                'high': '⚡',
+                'medium': '📌',
+                'low': '💤',
+                'none': '⚪'
+            }.get(issue.priority, '📌')
+
+            points_str = f"{issue.estimate_point}pt" if issue.estimate_point else "?pt"
+            labels_str = f" [{', '.join(map(str, issue.labels))}]" if issue.labels else ""
+
+            print(f"    {priority_emoji} {issue.name} ({points_str}){labels_str}")
+
+    print("\n" + "=" * 70)
+    print(f"총 {len(modules)}개 Module, {total_issues}개 Issue, {total_story_points}pt")
+    print("=" * 70)
 
-            # Module 정보 저장
-            module_data_list.append({
-                'name': module.name,
-                'start_date': module.start_date,
-                'issue_ids': issue_ids
-            })
+    return total_issues, total_story_points
 
-        print()  # Module 간 공백
 
-    # 8. Cycle에 Issues 연결
-    if cycle_list and module_data_list:
-        print("🔗 Cycles에 Issues 연결 중...\n")
+def shard_modules(modules: List[Module], shards: int) -> List[List[int]]:
+    """
+    Module 번호를 shards개 묶음으로 나눔 (--shards)
 
-        for cycle_info in cycle_list:
-            cycle_id = cycle_info['id']
-            cycle_start = cycle_info['start_date']
-            cycle_end = cycle_info['end_date']
+    Issue가 많은 Module부터 지금까지 Issue가 가장 적은 묶음에 넣는다 (같으면 번호가
+    작은 묶음). 같은 기획서면 항상 같은 결과이고, 묶음 안은 기획서 순서다.
+    """
+    loads = [(0, shard) for shard in range(shards)]
+    assigned: List[List[int]] = [[] for _ in range(shards)]
+    for index in sorted(range(len(modules)), key=lambda i: (-len(modules[i].issues), i)):
+        load, shard = heapq.heappop(loads)
+        assigned[shard].append(index)
+        heapq.heappush(loads, (load + max(1, len(modules[index].issues)), shard))
+    return [sorted(indexes) for indexes in assigned]
 
-            # 이 Cycle 기간에 해당하는 Module의 Issues 수집
-            cycle_issues = []
-            for module_data in module_data_list:
-                module_start = module_data['start_date']
 
-                # Module start_date가 Cycle 기간 내에 있으면 연결
-                if module_start and cycle_start and cycle_end:
-                    if cycle_start <= module_start <= cycle_end:
-                        cycle_issues.extend(module_data['issue_ids'])
-                        print(f"  {module_data['name']} → {cycle_info['name']}")
+def _upload_shard(args, shard: int, packed: tuple, items: Dict[str, Dict[str, Dict]],
+                  metadata_raw: Optional[Dict], journal_path: str) -> Dict:
+    """
+    --shards 워커 프로세스: Module 묶음 하나를 자기 API 키와 클라이언트로 업로드
 
-            # Cycle에 Issues 추가
-            if cycle_issues:
-                client.add_issues_to_cycle(cycle_id, cycle_issues)
+    Cycle은 만들지도 연결하지도 않는다 (조정 프로세스가 한 번에). 생성 / 수정 / 연결은
+    워커 저널에 기록하고, 조정 프로세스가 그 저널을 동기화 상태에 적용해 ID를 합친다.
+    """
+    output = io.StringIO()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        client = build_client(args, Instrumentation())
+        if metadata_raw is not None:
+            client.metadata = ProjectMetadata(client)
+            client.metadata.load(metadata_raw)
+        if args.bulk_size > 1:
+            client.detect_bulk_issues()
 
-            print()
+        manifest = SyncManifest(None, args.api_url, args.workspace, args.project)
+        manifest.items = items
+        journal = UploadJournal(journal_path)
+        journal.start(manifest, resume=journal.exists())
+        modules, _ = _unpack_plan(packed)
+        uploader_class = (AsyncPlanUploader if isinstance(client, AsyncPlaneAPIClient)
+                          else PlanUploader)
+        uploader = uploader_class(client, concurrency=args.concurrency, manifest=manifest,
+                                  verbose=False, reuse_ids=args.sync or args.resume)
+        try:
+            uploader.upload([], modules)
+        finally:
+            journal.close()
+
+    stats = client.rate_limiter.stats()
+    return {
+        'shard': shard, 'log': output.getvalue(), 'counts': uploader.counts,
+        'modules': len(modules), 'issues': sum(len(module.issues) for module in modules),
+        'requests': stats['requests'], 'rate_limited': stats['rate_limited'],
+        'retries': client.retries, 'bytes_sent': client.bytes_sent,
+        'seconds': time.perf_counter() - started,
+    }
+
+
+def upload_shards(client: PlaneAPIClient, args, path: str, journal: 'UploadJournal',
+                  manifest: SyncManifest, plan: ParsedPlan) -> Dict[str, int]:
+    """
+    --shards: Module을 워커 프로세스들에 나눠 업로드하고 결과를 manifest에 합침
+
+    워커 i는 --shard-api-keys의 (i % 키 개수)번째 키를 쓰고, 같은 키를 쓰는 워커끼리
+    --rate-limit을 나눠 갖는다 (Rate Limit은 키마다 걸리므로 키가 많을수록 빨라짐).
+    워커가 끝나면 워커 저널을 manifest에 적용한다. 저널은 업로드가 모두 끝나야
+    지워지므로 중간에 멈춰도 --resume이 워커 저널까지 이어 받는다.
+    워커들의 생성 / 수정 개수 합계를 반환한다.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    if not args.resume:
+        for stale in journal.shard_paths():  # 지운 저널에 딸려 있던 이전 워커 기록
+            os.remove(stale)
+
+    groups = [indexes for indexes in shard_modules(plan.modules, args.shards) if indexes]
+    keys = args.shard_api_keys or [args.api_key]
+    users = collections.Counter(keys[i % len(keys)] for i in range(len(groups)))
+    metadata_raw = client.metadata._raw if client.metadata is not None else None
+
+    print(f"🧩 샤드 업로드: Module {len(plan.modules)}개를 워커 {len(groups)}개로 "
+          f"(API 키 {len(set(keys))}개)\n")
+    worked = {'created': 0, 'updated': 0, 'failed': 0}
+    results = []
+    # spawn: 조정 프로세스의 HTTP 연결 / 스레드를 물려받지 않도록 새 인터프리터로 시작
+    with ProcessPoolExecutor(max_workers=len(groups),
+                             mp_context=multiprocessing.get_context('spawn')) as pool:
+        futures = {}
+        for shard, indexes in enumerate(groups):
+            key = keys[shard % len(keys)]
+            shard_args = argparse.Namespace(**dict(vars(args), api_key=key,
+                                                   rate_limit=args.rate_limit / users[key]))
+            packed = _pack_plan([plan.modules[i] for i in indexes], [])
+            futures[pool.submit(_upload_shard, shard_args, shard, packed, manifest.items,
+                                metadata_raw, journal.shard_path(shard))] = shard
+        for future in as_completed(futures):
+            shard = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:  # 워커가 죽어도 기록된 항목은 합치고 나머지는 조정 프로세스가 재시도
+                print(f"❌ 샤드 {shard + 1}/{len(groups)} 실패: {e}\n")
+                continue
+            print(result['log'], end='')
+            counts = result['counts']
+            print(f"✅ 샤드 {shard + 1}/{len(groups)}: Module {result['modules']}개, "
+                  f"Issue {result['issues']}개 (생성 {counts['created']}, 수정 {counts['updated']}, "
+                  f"실패 {counts['failed']}), 요청 {result['requests']}회, "
+                  f"429 {result['rate_limited']}회, {result['seconds']:.1f}초\n")
+            for name in worked:
+                worked[name] += counts[name]
+            results.append({k: v for k, v in result.items() if k != 'log'})
+
+    for shard in range(len(groups)):
+        shard_journal = UploadJournal(journal.shard_path(shard))
+        if shard_journal.exists():
+            shard_journal.replay(manifest)
+    client.instrumentation.info.setdefault('shards', []).extend(
+        sorted(results, key=lambda result: result['shard']))
+    print(f"🧩 샤드 합계: 요청 {sum(r['requests'] for r in results)}회, "
+          f"생성 {worked['created']}개, 수정 {worked['updated']}개, 실패 {worked['failed']}개\n")
+    print("🔗 Cycle 생성과 연결 (조정 프로세스)\n")
+    return worked
+
+
+def upload_plan(client: PlaneAPIClient, args, path: str, journal: 'UploadJournal',
+                plan: Optional[ParsedPlan] = None,
+                verbose: bool = True) -> Tuple['PlanUploader', List[Module]]:
+    """
+    기획서 하나를 업로드하고 (uploader, modules) 반환
+
+    plan이 없으면 파이프라인 모드로 파싱하면서 업로드한다.
+    동기화 상태 파일과 저널은 기획서마다 따로 쓴다.
+    """
+    if args.sync:
+        manifest_path = args.manifest or SyncManifest.default_path(path)
+        manifest = SyncManifest.load(manifest_path, args.api_url, args.workspace, args.project)
+        print(f"🔁 동기화 모드: {manifest_path}\n")
+    else:
+        # 상태 파일 없이 이번 실행의 저널만 기록
+        manifest = SyncManifest(None, args.api_url, args.workspace, args.project)
+
+    if args.resume and journal.exists():
+        try:
+            applied = journal.replay(manifest)
+            for shard_path in journal.shard_paths():  # --shards 워커가 남긴 기록
+                applied += UploadJournal(shard_path).replay(manifest)
+        except ValueError as e:
+            print(f"❌ 저널을 적용할 수 없습니다: {journal.path} - {e}")
+            sys.exit(1)
+        print(f"♻️  저널에서 이어서 업로드: {applied}개 기록 적용 ({journal.path})\n")
+        journal.start(manifest, resume=True)
+    else:
+        journal.start(manifest)
+
+    sharded = plan is not None and args.shards > 1
+    uploader_class = AsyncPlanUploader if isinstance(client, AsyncPlaneAPIClient) else PlanUploader
+    # 기존 ID는 동기화 / 이어 올리기와, 워커가 끝낸 항목을 건너뛰는 샤드 조정 단계에서만 쓴다
+    uploader = uploader_class(client, concurrency=args.concurrency, manifest=manifest,
+                              cycle_overlap=args.cycle_overlap, verbose=verbose and not sharded,
+                              reuse_ids=args.sync or args.resume or sharded)
+    try:
+        if plan is None:
+            # 파싱하면서 바로 업로드 (파싱 결과 요약은 생략)
+            print(f"📖 기획서 읽으며 업로드: {path}\n")
+            parser_obj = YAMLMarkdownParser.from_file(
+                path, lazy_descriptions=args.lazy_descriptions)
+            uploader.upload_pipelined(validated_items(parser_obj, path, args.allow_invalid),
+                                      queue_size=args.queue_size)
+            modules = parser_obj.modules
+        elif sharded:
+            # 워커가 Module / Issue를 나눠 올린 뒤, 합친 상태로 Cycle 생성과 연결을 한 번에
+            # (워커가 끝낸 항목은 건너뛰고, 워커가 실패한 항목은 여기서 다시 시도)
+            worked = upload_shards(client, args, path, journal, manifest, plan)
+            uploader.upload(plan.cycles, plan.modules)
+            counts = uploader.counts
+            counts['skipped'] = max(0, counts['skipped'] - worked['created'] - worked['updated'])
+            counts['created'] += worked['created']
+            counts['updated'] += worked['updated']
+            modules = plan.modules
+        else:
+            uploader.upload(plan.cycles, plan.modules)
+            modules = plan.modules
+    except (OSError, UnicodeDecodeError) as e:
+        journal.close()
+        print(f"❌ 파일 읽기 오류: {str(e)}")
+        sys.exit(1)
+    except PlanValidationError as e:
+        journal.close()
+        print(f"\n❌ 검증 오류로 업로드를 멈췄습니다: {e}")
+        print("   그 앞 항목은 이미 업로드되었습니다. 고친 뒤 --resume 으로 이어서 업로드하세요.")
+        print(f"   저널: {journal.path}")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        journal.close()
+        print("\n\n⛔ 업로드가 중단되었습니다. --resume 으로 이어서 업로드할 수 있습니다.")
+        print(f"   저널: {journal.path}")
+        sys.exit(130)
+
+    return uploader, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='PLANE_PROJECT_TEMPLATE.md 기반 기획서를 Plane으로 업로드',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+사용 예시:
+  python md_to_plane.py plans/my-service.md \\
+      --workspace pluck \\
+      --project abc123-def456 \\
+      --api-key your-api-key \\
+      --api-url http://localhost:8090
+
+  # 여러 기획서를 한 번에 (파일, 디렉터리, glob 패턴)
+  python md_to_plane.py plans/ "other/*.md" -w pluck -p abc123-def456 -k your-api-key
+
+  # asyncio 클라이언트로 업로드 (pip install 'httpx[http2]', 동시 요청 64개)
+  python md_to_plane.py plans/my-service.md -w pluck -p abc123-def456 -k your-api-key \\
+      --async --max-in-flight 64
+
+  # 파싱과 검증만 (접속 정보 불필요, pre-commit 훅 등). -m으로 실행하면 바이트코드
+  # 캐시(__pycache__)를 써서 스크립트로 실행할 때보다 빨리 시작한다.
+  python -m md_to_plane plans/ --dry-run
+
+  # 편집하는 동안 저장할 때마다 바뀐 항목만 동기화 (Ctrl+C로 종료)
+  python md_to_plane.py plans/my-service.md -w pluck -p abc123-def456 -k your-api-key --watch
+
+  # Issue 설명 전처리: {{ 이름 }} 템플릿 펼치기, Markdown → HTML, 공백 줄이기
+  python md_to_plane.py plans/my-service.md -w pluck -p abc123-def456 -k your-api-key \\
+      --templates plans/templates.yaml --markdown --minify-html
+
+  # 큰 기획서를 워커 4개로 나눠 업로드 (Rate Limit은 키마다 걸리므로 키를 여러 개 주면 빨라짐)
+  python md_to_plane.py plans/big-service.md -w pluck -p abc123-def456 -k your-api-key \\
+      --sync --shards 4 --shard-api-keys key-a,key-b,key-c,key-d
+
+  # 업로드 전에 바뀔 항목 확인 (아무것도 만들지 않음)
+  python md_to_plane.py plans/my-service.md -w pluck -p abc123-def456 -k your-api-key --plan
+
+  # Plane 프로젝트를 기획서로 내보내기 (동기화 상태 파일도 함께 → 고친 뒤 --sync)
+  python md_to_plane.py -w pluck -p abc123-def456 -k your-api-key --export plans/exported.md
+
+  # 실행 보고서와 타임라인 저장 (느린 업로드 원인 분석용)
+  python md_to_plane.py plans/my-service.md -w pluck -p abc123-def456 -k your-api-key \\
+      --report run.json --trace trace.json
+        """
+    )
+
+    parser.add_argument('md_files', nargs='*', metavar='md_file',
+                       help='기획서 마크다운 파일 경로 (여러 개, 디렉터리, glob 패턴 가능)')
+    parser.add_argument('--workspace', '-w', help='Plane workspace slug (--dry-run이 아니면 필수)')
+    parser.add_argument('--project', '-p', help='Plane project ID (UUID) (--dry-run이 아니면 필수)')
+    parser.add_argument('--api-key', '-k', help='Plane API key (--dry-run이 아니면 필수)')
+    parser.add_argument('--api-url', default='http://localhost:8090',
+                       help='Plane API URL (기본값: http://localhost:8090)')
+    parser.add_argument('--dry-run', action='store_true',
+                       help='실제 생성 없이 파싱 결과만 출력')
+    parser.add_argument('--plan', action='store_true',
+                       help='업로드 없이 Plane 현재 상태와 비교해 생성/수정/유지/삭제 후보 출력')
+    parser.add_argument('--export', metavar='PATH',
+                       help='업로드 대신 Plane 프로젝트를 기획서 형식으로 PATH에 저장 '
+                            '(동기화 상태 파일도 함께 저장)')
+    parser.add_argument('--yes', '-y', action='store_true',
+                       help='확인 프롬프트 건너뛰기')
+    parser.add_argument('--sync', action='store_true',
+                       help='동기화 모드: 상태 파일을 보고 새 항목만 생성, 바뀐 항목만 수정')
+    parser.add_argument('--manifest', metavar='PATH',
+                       help='동기화 상태 파일 경로 (기본값: <기획서>.plane-sync.json)')
+    parser.add_argument('--resume', action='store_true',
+                       help='중단된 업로드를 저널에서 이어서 진행')
+    parser.add_argument('--journal', metavar='PATH',
+                       help='업로드 저널 경로 (기본값: <기획서>.plane-journal.jsonl)')
+    parser.add_argument('--allow-invalid', action='store_true',
+                       help='기획서 검증 오류(잘못된 날짜, priority 등)가 있어도 업로드')
+    parser.add_argument('--pipeline', action='store_true',
+                       help='파싱과 업로드를 겹쳐 실행 (Module이 파싱되는 즉시 업로드)')
+    parser.add_argument('--shards', type=int, default=1, metavar='N',
+                       help='Module을 N개 워커 프로세스로 나눠 업로드하고 Cycle 연결은 한 번에 '
+                            '(아주 큰 기획서용, 기본값: 1 = 사용 안 함)')
+    parser.add_argument('--shard-api-keys', metavar='KEYS', type=lambda value: [
+                            key.strip() for key in value.split(',') if key.strip()],
+                       help='--shards 워커가 나눠 쓸 API 키 (쉼표로 구분, 기본값: --api-key)')
+    parser.add_argument('--watch', action='store_true',
+                       help='업로드 후 기획서를 감시하며 저장할 때마다 바뀐 항목만 동기화 '
+                            '(--sync 포함, --dry-run과 함께면 검증만, Ctrl+C로 종료)')
+    parser.add_argument('--debounce', type=float, default=0.3, metavar='SEC',
+                       help='--watch에서 저장 후 이만큼 변경이 없으면 동기화 (기본값: 0.3)')
+    parser.add_argument('--queue-size', type=int, default=4, metavar='N',
+                       help='파이프라인 모드에서 업로드를 기다리는 최대 Module 수 (기본값: 4)')
+    parser.add_argument('--concurrency', '-c', type=int, default=1, metavar='N',
+                       help='동시 요청 수 (기본값: 1 = 순차 업로드)')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                       help='asyncio 클라이언트로 업로드 (httpx 필요, h2가 있으면 HTTP/2): '
+                            '스레드 없이 적은 연결로 많은 요청을 동시에 보냄')
+    parser.add_argument('--max-in-flight', type=int, default=32, metavar='N',
+                       help='--async에서 동시에 보낼 최대 요청 수 (기본값: 32)')
+    parser.add_argument('--rate-limit', type=float, default=60, metavar='N',
+                       help='서버 헤더를 받기 전 분당 최대 요청 수 (기본값: 60, 0 = 제한 없음)')
+    parser.add_argument('--cycle-overlap', choices=CycleIndex.OVERLAP_POLICIES, default='latest',
+                       help='Issue 날짜가 여러 Cycle 기간에 걸릴 때: latest(늦게 시작한 Cycle), '
+                            'earliest(먼저 시작한 Cycle), skip(연결 안 함) (기본값: latest)')
+    parser.add_argument('--link-chunk-size', type=int, default=100, metavar='N',
+                       help='Module/Cycle 연결 요청 하나에 담을 Issue 수 (기본값: 100)')
+    parser.add_argument('--bulk-size', type=int, default=50, metavar='N',
+                       help='새 Issue를 일괄 생성 요청 하나에 담을 수 (기본값: 50, 0 = 사용 안 함). '
+                            '서버에 엔드포인트가 없으면 자동으로 하나씩 생성')
+    parser.add_argument('--max-retries', type=int, default=5, metavar='N',
+                       help='429 응답 시 최대 재시도 횟수 (기본값: 5)')
+    parser.add_argument('--pool-size', type=int, default=0, metavar='N',
+                       help='유지할 HTTP keep-alive 연결 수 (기본값: max(10, --concurrency))')
+    parser.add_argument('--connect-timeout', type=float, default=5.0, metavar='SEC',
+                       help='연결 타임아웃 (기본값: 5초)')
+    parser.add_argument('--read-timeout', type=float, default=30.0, metavar='SEC',
+                       help='응답 타임아웃 (기본값: 30초)')
+    parser.add_argument('--connect-retries', type=int, default=3, metavar='N',
+                       help='연결 실패 / 끊긴 연결 재시도 횟수 (기본값: 3)')
+    parser.add_argument('--gzip', action='store_true',
+                       help='큰 요청 본문을 gzip으로 압축 (서버가 거부하면 자동으로 끔)')
+    parser.add_argument('--gzip-min-bytes', type=int, default=1024, metavar='N',
+                       help='--gzip 사용 시 압축할 최소 본문 크기 (기본값: 1024)')
+    parser.add_argument('--metadata-ttl', type=float, default=3600, metavar='SEC',
+                       help='States/Labels/Members/Estimates 디스크 캐시 유효 시간 (기본값: 3600, 0 = 캐시 안 함)')
+    parser.add_argument('--no-metadata', action='store_true',
+                       help='State/Label/담당자/추정치를 보내지 않음 (메타데이터 조회 생략)')
+    parser.add_argument('--parse-workers', type=int, default=0, metavar='N',
+                       help='여러 기획서를 파싱할 프로세스 수 (기본값: CPU 수)')
+    parser.add_argument('--no-parse-cache', action='store_true',
+                       help='파싱 결과 캐시를 쓰지 않고 항상 처음부터 파싱')
+    parser.add_argument('--lazy-descriptions', action='store_true',
+                       help='Issue 설명을 메모리에 두지 않고 요청할 때 기획서에서 읽음 (아주 큰 기획서용)')
+    parser.add_argument('--templates', metavar='PATH',
+                       help='Issue 설명의 {{ 이름 }}을 펼칠 템플릿 파일 (YAML: 이름 → 내용)')
+    parser.add_argument('--markdown', action='store_true',
+                       help="Issue 설명을 Markdown으로 보고 HTML로 변환 (pip install markdown)")
+    parser.add_argument('--minify-html', action='store_true',
+                       help='Issue 설명 HTML의 태그 사이 줄바꿈과 연속 공백을 줄여 전송량 절약')
+    parser.add_argument('--report', metavar='PATH',
+                       help='실행 보고서 저장 (.json: 요약 + 이벤트, .ndjson/.jsonl: 한 줄에 이벤트 하나)')
+    parser.add_argument('--trace', metavar='PATH',
+                       help='Chrome trace 형식 타임라인 저장 (chrome://tracing, Perfetto에서 열기)')
+
+    args = parser.parse_args()
+
+    if args.concurrency < 1:
+        parser.error('--concurrency는 1 이상이어야 합니다.')
+    if args.queue_size < 1:
+        parser.error('--queue-size는 1 이상이어야 합니다.')
+    if args.bulk_size < 0:
+        parser.error('--bulk-size는 0 이상이어야 합니다.')
+    if args.max_in_flight < 1:
+        parser.error('--max-in-flight는 1 이상이어야 합니다.')
+    if args.shards < 1:
+        parser.error('--shards는 1 이상이어야 합니다.')
+    if args.shards > 1 and (args.pipeline or args.watch):
+        parser.error('--shards는 --pipeline / --watch와 함께 쓸 수 없습니다.')
+    if args.use_async and httpx is None:
+        parser.error("--async에는 httpx가 필요합니다: pip install 'httpx[http2]'")
+    if args.markdown and markdown is None:
+        parser.error("--markdown에는 markdown 패키지가 필요합니다: pip install markdown")
+    args.templates_data = None
+    if args.templates:
+        try:
+            args.templates_data = DescriptionRenderer.load_templates(args.templates)
+        except (OSError, ValueError, yaml.YAMLError) as e:
+            parser.error(f"템플릿 파일을 읽을 수 없습니다: {args.templates} - {e}")
+
+    # --dry-run은 Plane에 접속하지 않으므로 접속 정보 없이도 실행 (pre-commit 검사 등)
+    if not args.dry_run or args.export:
+        missing = [flag for flag, value in (('--workspace/-w', args.workspace),
+                                            ('--project/-p', args.project),
+                                            ('--api-key/-k', args.api_key)) if not value]
+        if missing:
+            parser.error(f"다음 인자가 필요합니다: {', '.join(missing)}")
+
+    if args.watch:
+        if args.export or args.plan or args.pipeline:
+            parser.error('--watch는 --export / --plan / --pipeline과 함께 쓸 수 없습니다.')
+        args.sync = True  # 저장마다 바뀐 항목만 보내려면 동기화 상태 파일이 필요
+
+    if args.export:
+        if args.md_files:
+            parser.error('--export에는 기획서 경로를 함께 줄 수 없습니다.')
+    elif not args.md_files:
+        parser.error('기획서 경로가 필요합니다 (또는 --export PATH).')
+
+    instrumentation = Instrumentation(record=bool(args.report or args.trace))
+    instrumentation.info.update({
+        'started_at': time.strftime('%Y-%m-%dT%H:%M:%S%z', time.localtime()),
+        'options': {k: v for k, v in vars(args).items()
+                    if k not in ('api_key', 'shard_api_keys', 'md_files', 'templates_data')},
+        'status': 'aborted',
+    })
+
+    if args.export:
+        try:
+            export_project(args, instrumentation)
+        finally:
+            write_reports(args, instrumentation)
+        return
+
+    paths = expand_plan_paths(args.md_files)
+    if not paths:
+        print(f"❌ 기획서를 찾을 수 없습니다: {' '.join(args.md_files)}")
+        sys.exit(1)
+    for path in paths:
+        if not os.path.isfile(path):
+            print(f"❌ 파일을 찾을 수 없습니다: {path}")
+            sys.exit(1)
+    if len(paths) > 1 and (args.manifest or args.journal):
+        parser.error('기획서가 여러 개일 때는 --manifest / --journal을 쓸 수 없습니다 (기획서별 기본 경로 사용).')
+
+    instrumentation.info['plans'] = paths
+    try:
+        client = run(args, paths, instrumentation)
+        if args.watch and instrumentation.info['status'] in ('completed', 'incomplete', 'dry-run'):
+            watch_plans(args, paths, client, instrumentation)
+    finally:
+        write_reports(args, instrumentation)
+
+
+def write_reports(args, instrumentation: Instrumentation):
+    """--report / --trace 파일 저장 (업로드가 중간에 끝나도 그때까지의 기록을 남김)"""
+    for path, write in ((args.report, instrumentation.write_report),
+                        (args.trace, instrumentation.write_trace)):
+        if not path:
+            continue
+        try:
+            write(path)
+            print(f"🧾 저장: {path}")
+        except OSError as e:
+            print(f"⚠️  저장 실패: {path} - {e}")
+
+
+def build_client(args, instrumentation: Instrumentation) -> PlaneAPIClient:
+    """명령행 옵션으로 Plane API 클라이언트 생성 (--async면 AsyncPlaneAPIClient)"""
+    options = dict(rate_limiter=RateLimiter(rate_per_minute=args.rate_limit),
+                   max_retries=args.max_retries,
+                   link_chunk_size=args.link_chunk_size,
+                   pool_size=args.pool_size or max(10, args.concurrency),
+                   timeout=(args.connect_timeout, args.read_timeout),
+                   connect_retries=args.connect_retries,
+                   gzip_min_bytes=args.gzip_min_bytes if args.gzip else None,
+                   bulk_size=args.bulk_size, instrumentation=instrumentation,
+                   descriptions=DescriptionRenderer(args.templates_data, args.markdown,
+                                                    args.minify_html))
+    if args.use_async:
+        return AsyncPlaneAPIClient(args.api_url, args.api_key, args.workspace, args.project,
+                                   max_in_flight=args.max_in_flight, **options)
+    return PlaneAPIClient(args.api_url, args.api_key, args.workspace, args.project, **options)
+
+
+def export_project(args, instrumentation: Instrumentation):
+    """--export: Plane 프로젝트를 기획서와 동기화 상태 파일로 저장"""
+    client = build_client(args, instrumentation)
+
+    print("\n" + "=" * 70)
+    print(f"📤 Plane 프로젝트 내보내는 중... ({args.api_url})")
+    print("=" * 70 + "\n")
+
+    # UUID → 이름 (내보내기는 라벨을 만들지 않음)
+    metadata = ProjectMetadata(client, ProjectMetadata.default_cache_dir(),
+                               ttl=args.metadata_ttl, read_only=True)
+    with instrumentation.span('metadata', 'metadata'):
+        loaded = metadata.load()
+    if not loaded:
+        instrumentation.info['status'] = 'failed'
+        sys.exit(1)
+    if not args.no_metadata:
+        client.metadata = metadata
+
+    exporter = PlanExporter(client, metadata, concurrency=max(4, args.concurrency))
+    started = time.perf_counter()
+    with instrumentation.span('export', 'export'):
+        exported = exporter.export(args.export)
+    if not exported:
+        print("❌ Plane 프로젝트의 항목 목록을 불러올 수 없습니다.")
+        instrumentation.info['status'] = 'failed'
+        sys.exit(1)
+    elapsed = time.perf_counter() - started
+
+    manifest_path = args.manifest or SyncManifest.default_path(args.export)
+    with instrumentation.span('manifest', 'export'):
+        recorded = exporter.write_manifest(args.export, manifest_path)
+
+    counts = exporter.counts
+    instrumentation.info.update(status='completed', export=dict(counts, path=args.export))
+    print(f"\n✅ 내보내기 완료: {args.export} ({os.path.getsize(args.export) / 1024:.1f}KB, "
+          f"{elapsed:.2f}초)")
+    print(f"   - Cycles {counts['cycles']}개, Modules {counts['modules']}개, "
+          f"Issues {counts['issues']}개")
+    print(f"   - API 요청: {client.rate_limiter.stats()['requests']}회")
+    print(f"🔁 동기화 상태 파일: {manifest_path} ({recorded}개 항목)")
+    print(f"   고친 뒤 업로드: python md_to_plane.py {args.export} ... --sync")
+
+
+def plan_changes(args, paths: List[str], plans: Dict[str, ParsedPlan],
+                 instrumentation: Instrumentation):
+    """--plan: 업로드하지 않고 Plane 현재 상태와 비교한 변경 계획 출력"""
+    client = build_client(args, instrumentation)
+
+    print("\n" + "=" * 70)
+    print(f"🧮 Plane 현재 상태와 비교 중... ({args.api_url})")
+    print("=" * 70 + "\n")
+
+    # 이름 → UUID 변환은 업로드와 같게 (없는 라벨은 만들지 않고 세기만 함)
+    metadata = None
+    if not args.no_metadata:
+        metadata = ProjectMetadata(client, ProjectMetadata.default_cache_dir(),
+                                   ttl=args.metadata_ttl, read_only=True)
+        with instrumentation.span('metadata', 'metadata'):
+            loaded = metadata.load()
+        if not loaded:
+            instrumentation.info['status'] = 'failed'
+            sys.exit(1)
+        client.metadata = metadata
+
+    diff = PlanDiff(client, concurrency=max(4, args.concurrency))
+    with instrumentation.span('fetch', 'plan'):
+        fetched = diff.fetch()
+    if not fetched:
+        print("❌ Plane 프로젝트의 항목 목록을 불러올 수 없습니다.")
+        instrumentation.info['status'] = 'failed'
+        sys.exit(1)
+    print(f"📥 Plane: Cycles {len(diff.remote['cycles'])}개, "
+          f"Modules {len(diff.remote['modules'])}개, Issues {len(diff.remote['issues'])}개\n")
+
+    # 동기화 상태 파일이 있으면 이름보다 기록된 ID로 먼저 짝지음
+    compared = []
+    for path in paths:
+        manifest_path = args.manifest or SyncManifest.default_path(path)
+        manifest = None
+        if os.path.exists(manifest_path):
+            manifest = SyncManifest.load(manifest_path, args.api_url, args.workspace, args.project)
+        compared.append((plans[path].cycles, plans[path].modules, manifest))
+    with instrumentation.span('compare', 'plan'):
+        diff.compare(compared)
+
+    diff.print_summary()
+    if metadata is not None and metadata.missing_labels:
+        print(f"\n🏷️  업로드 시 새로 만들 Label {len(metadata.missing_labels)}개: "
+              f"{', '.join(sorted(metadata.missing_labels))}")
+    print("\n✅ Plan 모드: 실제로 생성/수정하지 않고 종료합니다.")
+    instrumentation.info.update({'status': 'planned', 'plan': diff.summary()})
+
+
+def run(args, paths: List[str], instrumentation: Instrumentation) -> Optional[PlaneAPIClient]:
+    """
+    기획서 파싱 → 사용자 확인 → 업로드 → 통계 출력
+
+    업로드에 쓴 클라이언트를 반환한다 (--watch가 같은 세션으로 이어서 동기화).
+    """
+    info = instrumentation.info
+    multiple = len(paths) > 1
+    pipeline = args.pipeline and not (args.dry_run or args.plan)
+    plans: Dict[str, ParsedPlan] = {}
+
+    if not pipeline:
+        # 1~2. MD 파일을 줄 단위로 읽으며 파싱 (여러 개면 프로세스 풀로 동시에)
+        for path in paths:
+            print(f"\n📖 기획서 읽는 중: {path}")
+        print("🔍 YAML 구조 분석 중...\n")
+        cache_dir = None
+        if not args.no_parse_cache:
+            cache_dir = os.path.join(ProjectMetadata.default_cache_dir(), 'parse')
+        try:
+            parsed = parse_plans(paths, args.parse_workers, cache_dir, args.lazy_descriptions)
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"❌ 파일 읽기 오류: {str(e)}")
+            sys.exit(1)
+
+        # 검증 오류가 있으면 결과 출력과 API 요청 전에 중단
+        errors = sum(print_problems(plan.path, plan.problems) for plan in parsed)
+        info['validation'] = {plan.path: len(plan.problems) for plan in parsed}
+        if errors and not args.allow_invalid:
+            print(f"\n❌ 기획서 검증 오류 {errors}개: 고친 뒤 다시 실행하세요 "
+                  f"(무시하고 진행하려면 --allow-invalid).")
+            info['status'] = 'invalid'
+            sys.exit(1)
+
+        # 3. 파싱 결과 출력
+        grand_modules = grand_issues = grand_points = 0
+        for plan in parsed:
+            plans[plan.path] = plan
+            instrumentation.add_span('parse', 'parse', plan.parse_started, plan.parse_seconds,
+                                     f"parse: {plan.path}", path=plan.path,
+                                     modules=len(plan.modules), cache=plan.cache)
+            if multiple:
+                print(f"\n📄 {plan.path}")
+            print(plan.log, end='')
+            if plan.cache:
+                print(f"⚡ 파싱 캐시: {plan.cache}")
+            issues, points = print_parse_summary(plan.modules)
+            grand_modules += len(plan.modules)
+            grand_issues += issues
+            grand_points += points
+
+        if multiple:
+            print(f"\n📚 전체: {len(paths)}개 기획서, {grand_modules}개 Module, "
+                  f"{grand_issues}개 Issue, {grand_points}pt")
+
+
+        # --plan이면 Plane과 비교만 하고 종료
+        if args.plan:
+            plan_changes(args, paths, plans, instrumentation)
+            return
+
+        # Dry run이면 종료
+        if args.dry_run:
+            print("\n✅ Dry-run 모드: 실제 생성하지 않고 "
+                  + ("저장할 때마다 검증만 합니다.\n" if args.watch else "종료합니다."))
+            info['status'] = 'dry-run'
+            return
+
+    # 중단된 업로드 저널 확인
+    journals = {}
+    for path in paths:
+        journal = UploadJournal(args.journal or UploadJournal.default_path(path))
+        if args.resume and not journal.exists():
+            if not args.sync:
+                # 저널 없이 이어 올리면 모든 항목을 다시 만들게 됨 (중복)
+                print(f"\n❌ 이어서 진행할 저널이 없습니다: {journal.path}")
+                print("   이미 끝난 업로드입니다. 바뀐 항목만 올리려면 --sync, "
+                      "처음부터 다시 올리려면 --resume 없이 실행하세요.")
+                sys.exit(1)
+            print(f"\n⚠️  이어서 진행할 저널이 없어 동기화 상태 파일로 진행합니다: {journal.path}")
+        elif journal.exists() and not args.resume:
+            print(f"\n❌ 완료되지 않은 이전 업로드 저널이 있습니다: {journal.path}")
+            print("   이어서 업로드하려면 --resume, 처음부터 다시 올리려면 저널 파일을 삭제하세요.")
+            sys.exit(1)
+        journals[path] = journal
+
+    # 4. 사용자 확인
+    print(f"\n🎯 업로드 대상:")
+    print(f"   API URL: {args.api_url}")
+    print(f"   Workspace: {args.workspace}")
+    print(f"   Project: {args.project}")
+    if multiple:
+        print(f"   기획서: {len(paths)}개")
+
+    if not args.yes:
+        confirm = input("\n🚀 Plane에 업로드하시겠습니까? (y/n): ")
+        if confirm.lower() != 'y':
+            print("❌ 취소되었습니다.")
+            info['status'] = 'cancelled'
+            return
+
+    # 5. Plane API 클라이언트 생성 (모든 기획서가 세션 하나를 공유)
+    client = build_client(args, instrumentation)
+    rate_limiter = client.rate_limiter
+
+    # 6~8. Cycles, Modules, Issues 생성 및 연결
+    print(f"\n" + "=" * 70)
+    print("🚀 Plane으로 업로드 중...")
+    print("=" * 70 + "\n")
+
+    # 이름 → UUID 변환용 프로젝트 메타데이터 (없는 라벨은 미리 생성)
+    if not args.no_metadata:
+        metadata = ProjectMetadata(client, ProjectMetadata.default_cache_dir(), ttl=args.metadata_ttl)
+        with instrumentation.span('metadata', 'metadata'):
+            if not metadata.load():
+                instrumentation.info['status'] = 'failed'
+                sys.exit(1)
+            metadata.ensure_labels(
+                (label for plan in plans.values() for module in plan.modules
+                 for issue in module.issues for label in issue.labels),
+                concurrency=args.concurrency
+            )
+        client.metadata = metadata
+        print()
+
+    if args.bulk_size > 1:
+        client.detect_bulk_issues()
+        print()
+
+    results = []
+    incomplete = []
+    for path in paths:
+        if multiple:
+            print(f"📄 {path}\n")
+        journal = journals[path]
+        link_failures_before = len(client.link_failures)
+        with instrumentation.span('upload', 'plan', path=path):
+            uploader, modules = upload_plan(client, args, path, journal, plans.get(path))
+
+        # 실패한 항목이 없으면 저널 삭제, 있으면 --resume으로 재시도할 수 있게 남김
+        complete = (uploader.counts['failed'] == 0
+                    and len(client.link_failures) == link_failures_before)
+        journal.close(remove=complete)
+        if not complete:
+            incomplete.append(journal.path)
+        results.append((path, uploader, modules))
 
     # 9. 완료
     print("=" * 70)
@@ -631,14 +4895,197 @@ def main():
 
     # 통계 출력
     print("📊 업로드 통계:")
-    print(f"   - Cycles: {len(cycle_list)}개")
-    print(f"   - Modules: {len(modules)}개")
-    total_issues = sum(len(data['issue_ids']) for data in module_data_list)
-    print(f"   - Issues: {total_issues}개")
+    totals = {'cycles': 0, 'modules': 0, 'issues': 0}
+    counts = {'created': 0, 'updated': 0, 'skipped': 0}
+    for path, uploader, modules in results:
+        plan_issues = sum(len(data['issue_ids']) for data in uploader.module_data_list)
+        totals['cycles'] += len(uploader.cycle_list)
+        totals['modules'] += len(modules)
+        totals['issues'] += plan_issues
+        for name in counts:
+            counts[name] += uploader.counts[name]
+        if multiple:
+            print(f"   📄 {path}: Cycles {len(uploader.cycle_list)}개, "
+                  f"Modules {len(modules)}개, Issues {plan_issues}개")
+
+    print(f"   - Cycles: {totals['cycles']}개")
+    print(f"   - Modules: {totals['modules']}개")
+    print(f"   - Issues: {totals['issues']}개")
+    if args.sync:
+        print(f"   - 동기화: 생성 {counts['created']}개, "
+              f"수정 {counts['updated']}개, 변경 없음 {counts['skipped']}개")
+    limiter_stats = rate_limiter.stats()
+    # 샤드 워커의 요청은 워커 프로세스의 limiter / client에 잡히므로 따로 더한다
+    shards = client.instrumentation.info.get('shards', [])
+    requests_sent = limiter_stats['requests'] + sum(r['requests'] for r in shards)
+    rate_limited = limiter_stats['rate_limited'] + sum(r['rate_limited'] for r in shards)
+    retries = client.retries + sum(r['retries'] for r in shards)
+    bytes_sent = client.bytes_sent + sum(r['bytes_sent'] for r in shards)
+    print(f"   - API 요청: {requests_sent}회 "
+          f"(429 응답 {rate_limited}회, 재시도 {retries}회)")
+    print(f"   - Rate Limit 대기: {limiter_stats['throttled_seconds']:.1f}초 "
+          f"({limiter_stats['throttle_events']}회, 워커 합산)")
+    saved = f", gzip으로 {client.bytes_saved / 1024:.1f}KB 절약" if client.bytes_saved else ""
+    print(f"   - 요청 본문: {bytes_sent / 1024:.1f}KB{saved}")
+    if shards:
+        print(f"   - 샤드: 워커 {len(shards)}개, 가장 느린 워커 "
+              f"{max(r['seconds'] for r in shards):.1f}초")
+    if client.bulk_created:
+        print(f"   - 일괄 생성: Issue {client.bulk_created}개")
+    described = client.descriptions.summary()
+    if described:
+        print(f"   - 설명 전처리: {described}")
+    if client.descriptions.missing_templates:
+        print(f"   ⚠️  템플릿 파일에 없는 이름: "
+              f"{', '.join(sorted(client.descriptions.missing_templates))}")
+    if isinstance(client, AsyncPlaneAPIClient):
+        versions = ", ".join(f"{version} {count}회"
+                             for version, count in sorted(client.http_versions.items()))
+        print(f"   - 비동기 요청: 최대 {client.max_in_flight}개 동시, "
+              f"연결 최대 {client.pool_size}개 ({versions or '요청 없음'})")
+    if instrumentation.record:
+        summary = instrumentation.summary()
+        requests_summary = summary['requests']
+        if requests_summary['count']:
+            latency = requests_summary['latency_ms']
+            print(f"   - 요청 시간: {requests_summary['seconds']:.1f}초 (워커 합산, "
+                  f"p50 {latency['p50']:.0f}ms, p95 {latency['p95']:.0f}ms, "
+                  f"최대 {latency['max']:.0f}ms)")
+        print(f"   - 파싱: {summary['phases'].get('parse', 0.0):.2f}초, "
+              f"메타데이터: {summary['phases'].get('metadata', 0.0):.2f}초")
+
+    info.update({
+        'status': 'incomplete' if incomplete else 'completed',
+        'totals': totals,
+        'sync': counts,
+        'retries': client.retries,
+        'rate_limiter': limiter_stats,
+        'bytes_sent': client.bytes_sent,
+        'bytes_saved': client.bytes_saved,
+        'bulk_created': client.bulk_created,
+        'descriptions': client.descriptions.stats,
+        'link_failures': client.link_failures,
+        'incomplete_journals': incomplete,
+    })
+    if client.link_failures:
+        failed_issues = sum(len(f['issue_ids']) for f in client.link_failures)
+        print(f"\n⚠️  연결 실패: {len(client.link_failures)}개 묶음, Issue {failed_issues}개")
+        for failure in client.link_failures:
+            print(f"   - {failure['target']} {failure['id']} "
+                  f"묶음 {failure['chunk']}/{failure['chunks']}: "
+                  f"{len(failure['issue_ids'])}개 (Status: {failure['status']})")
+    if incomplete:
+        print("\n⚠️  실패한 항목이 있습니다. --resume 으로 실패한 항목만 다시 시도할 수 있습니다.")
+        for journal_path in incomplete:
+            print(f"   저널: {journal_path}")
+        print()
+        return client
+
     print(f"\n✨ 모든 연결 완료:")
     print(f"   - Issue → Module 연결 ✅")
     print(f"   - Issue → Cycle 연결 ✅")
     print(f"   - Gantt 차트 준비 완료 ✅\n")
+    return client
+
+
+def watch_plans(args, paths: List[str], client: Optional[PlaneAPIClient],
+                instrumentation: Instrumentation):
+    """
+    --watch: 기획서를 저장할 때마다 다시 파싱 / 검증하고 바뀐 항목만 동기화
+
+    client(run()이 만든 세션, 메타데이터 포함)를 계속 쓰고, 기획서마다 YAML 블록
+    로드 결과를 메모리에 두어 내용이 바뀐 블록만 다시 로드한다. 업로드는 --sync와
+    같아서 동기화 상태 파일과 해시가 같은 항목은 요청을 보내지 않는다.
+    client가 None이면(--dry-run) 검증 결과만 출력한다.
+    """
+    blocks: Dict[str, Dict[bytes, object]] = {}
+    digests: Dict[str, str] = {}
+    for path in paths:
+        _, parser_obj = _parse_plan(path, {}, args.lazy_descriptions)
+        blocks[path] = parser_obj.yaml_blocks
+        digests[path] = _file_digest(path)
+    args.resume = True  # 실패한 항목이 남은 저널은 다음 저장 때 이어서 적용
+    saves = instrumentation.info['watch'] = {'saves': 0, 'synced': 0, 'requests': 0}
+
+    watcher = PlanWatcher(paths, debounce=args.debounce)
+    print(f"👀 변경 감시 중 ({watcher.backend}): 기획서 {len(paths)}개 - Ctrl+C로 종료\n")
+    try:
+        for changed in watcher.changes():
+            for path in changed:
+                try:
+                    digest = _file_digest(path)
+                except OSError:
+                    continue  # 저장 도중 잠시 없어진 파일
+                if digest == digests[path]:
+                    continue
+                digests[path] = digest
+                saves['saves'] += 1
+                with instrumentation.span('watch', 'plan', path=path):
+                    _watch_sync(args, path, client, blocks, saves)
+    except KeyboardInterrupt:
+        print("\n👋 감시를 종료합니다.")
+    finally:
+        watcher.close()
+
+
+def _watch_sync(args, path: str, client: Optional[PlaneAPIClient],
+                blocks: Dict[str, Dict[bytes, object]], saves: Dict[str, int]):
+    """--watch에서 저장된 기획서 하나를 다시 파싱 / 검증 / 동기화"""
+    stamp = time.strftime('%H:%M:%S')
+    started = time.perf_counter()
+    try:
+        plan, parser_obj = _parse_plan(path, blocks[path], args.lazy_descriptions)
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"❌ {stamp} {path}: 파일 읽기 오류 - {e}")
+        return
+    plan.problems += PlanValidator().validate(plan.cycles, plan.modules)
+    parse_ms = (time.perf_counter() - started) * 1000
+    loaded = sum(1 for key in parser_obj.yaml_blocks if key not in blocks[path])
+    blocks[path] = parser_obj.yaml_blocks
+    parsed = f"파싱 {parse_ms:.1f}ms (YAML 블록 {loaded}/{len(parser_obj.yaml_blocks)}개 로드)"
+
+    errors = print_problems(path, plan.problems)
+    if errors and not args.allow_invalid:
+        print(f"⏸️  {stamp} {path}: {parsed}, 검증 오류 {errors}개 - 고칠 때까지 업로드하지 않습니다\n")
+        return
+    if client is None:
+        issues = sum(len(module.issues) for module in plan.modules)
+        print(f"✅ {stamp} {path}: {parsed}, Module {len(plan.modules)}개, Issue {issues}개\n")
+        return
+
+    requests_before = client.rate_limiter.stats()['requests']
+    link_failures_before = len(client.link_failures)
+    journal = UploadJournal(args.journal or UploadJournal.default_path(path))
+    # 저장 하나가 실패해도 감시는 계속 (저널이 남으므로 다음 저장 때 이어서 적용)
+    try:
+        if client.metadata is not None:
+            client.metadata.ensure_labels((label for module in plan.modules
+                                           for issue in module.issues for label in issue.labels),
+                                          concurrency=args.concurrency)
+        uploader, _ = upload_plan(client, args, path, journal, plan, verbose=False)
+    except Exception as e:
+        journal.close()
+        print(f"❌ {stamp} {path}: {parsed}, 동기화 오류 - {e}\n"
+              f"   다음 저장 때 다시 시도합니다 ({journal.path})\n")
+        return
+    except SystemExit as e:
+        if e.code == 130:  # 업로드 중 Ctrl+C
+            raise
+        print(f"❌ {stamp} {path}: {parsed}, 동기화를 멈췄습니다 - 다음 저장 때 다시 시도합니다\n")
+        return
+    complete = (uploader.counts['failed'] == 0
+                and len(client.link_failures) == link_failures_before)
+    journal.close(remove=complete)
+
+    sent = client.rate_limiter.stats()['requests'] - requests_before
+    saves['synced'] += 1
+    saves['requests'] += sent
+    counts = uploader.counts
+    print(f"{'🔄' if complete else '⚠️ '} {stamp} {path}: {parsed}, 생성 {counts['created']}개, "
+          f"수정 {counts['updated']}개, 변경 없음 {counts['skipped']}개, 요청 {sent}회, "
+          f"{time.perf_counter() - started:.2f}초"
+          + ("" if complete else f" - 실패 항목은 다음 저장 때 다시 시도 ({journal.path})"))
+    print()
 
 
 if __name__ == '__main__':
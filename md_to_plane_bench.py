@@ -0,0 +1,882 @@
+#!/usr/bin/env python3
+"""
+md_to_plane.py 성능 벤치마크
+
+사용법:
+    # 파서 비교: 정규식 파서 vs 한 번 훑는 스트리밍 파서
+    python md_to_plane_bench.py parse
+    python md_to_plane_bench.py parse plans/driving-zone-mission-v2.md --sizes 100 1000 --repeat 5
+
+    # 업로드 처리량: 로컬 Mock Plane 서버(plane_mock_server.py)에 업로드
+    python md_to_plane_bench.py upload
+    python md_to_plane_bench.py upload --sizes 1000 -c 1 8 16 --latency 20 --throttle-rate 0.02
+    python md_to_plane_bench.py upload --sizes 1000 -c 1 8 --bulk-size 0 50   # 일괄 생성 비교
+
+    # 왕복: 업로드 → 내보내기(--export) → 다시 파싱해 원본과 비교
+    python md_to_plane_bench.py roundtrip --sizes 1000 10000 -c 8
+
+    # 시작 시간: -X importtime 분석과 --dry-run 시작 비용 예산 (넘으면 종료 코드 1)
+    python md_to_plane_bench.py startup --budget-ms 100
+
+    # 메모리: 파싱 결과가 차지하는 메모리와 최대 RSS (설명을 메모리에 둘 때 / 안 둘 때)
+    python md_to_plane_bench.py memory --sizes 10000 50000
+
+요구사항:
+    - Python 3.7+
+    - pip install requests pyyaml
+"""
+
+import os
+import re
+import sys
+import glob
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import yaml
+
+import md_to_plane
+from md_to_plane import (Cycle, Instrumentation, Issue, Module, PlaneAPIClient, PlanExporter,
+                         PlanUploader, ProjectMetadata, RateLimiter, YAMLMarkdownParser,
+                         parse_plan_file, percentile)
+
+
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+PLANS_GLOB = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'plans', '*.md')
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+MOCK_SERVER = os.path.join(REPO_DIR, 'plane_mock_server.py')
+
+
+class RegexMarkdownParser:
+    """
+    이전 정규식 기반 파서 (md_to_plane 2.0.0) - 파싱 벤치마크 비교용
+
+    섹션마다 문서 전체에 re.search를 돌리고, Module / Issue마다 lazy DOTALL
+    패턴으로 다시 스캔한다. 새 파서와 결과를 비교하기 위해 그대로 남겨 둔다.
+    """
+
+    def __init__(self, md_content: str):
+        self.content = md_content
+        self.cycles: List[Cycle] = []
+        self.modules: List[Module] = []
+        self.project_identifier = "PROJ"
+
+    def parse(self) -> List[Module]:
+        """메인 파싱 로직"""
+        # 1. 프로젝트 식별자 추출
+        self._extract_project_identifier()
+
+        # 2. Cycles 섹션 파싱 (있으면)
+        self._parse_cycles_section()
+
+        # 3. Modules 섹션 파싱
+        self._parse_modules_section()
+
+        return self.modules
+
+    def _extract_project_identifier(self):
+        """프로젝트 식별자 추출: **프로젝트 식별자**: `[PROJ]`"""
+        match = re.search(r'\*\*프로젝트 식별자\*\*:\s*`([A-Z]{3,7})`', self.content)
+        if match:
+            self.project_identifier = match.group(1)
+
+    def _parse_cycles_section(self):
+        """## 8. Cycles 계획 섹션 파싱"""
+        # Cycles 섹션 찾기
+        cycles_match = re.search(
+            r'## 8\. Cycles 계획(.+?)(?=##|\Z)',
+            self.content,
+            re.DOTALL
+        )
+
+        if not cycles_match:
+            return
+
+        cycles_section = cycles_match.group(1)
+
+        # Cycle별 파싱: ### Cycle N: 이름
+        cycle_blocks = re.finditer(
+            r'###\s+Cycle\s+\d+:\s+(.+?)\n```yaml\n(.+?)\n```',
+            cycles_section,
+            re.DOTALL
+        )
+
+        for match in cycle_blocks:
+            cycle_name = match.group(1).strip()
+            yaml_content = match.group(2)
+
+            try:
+                cycle_data = yaml.safe_load(yaml_content)
+                cycle = Cycle(
+                    name=cycle_data.get('name', cycle_name),
+                    description=cycle_data.get('description', ''),
+                    start_date=cycle_data.get('start_date'),
+                    end_date=cycle_data.get('end_date'),
+                    owned_by=cycle_data.get('owned_by')
+                )
+                self.cycles.append(cycle)
+            except yaml.YAMLError as e:
+                print(f"⚠️  Cycle YAML 파싱 오류: {cycle_name} - {e}")
+
+    def _parse_modules_section(self):
+        """## 7. Modules 계획 섹션 파싱"""
+        # Modules 섹션 찾기
+        modules_match = re.search(
+            r'## 7\. Modules 계획(.+?)(?=## \d+\.)',
+            self.content,
+            re.DOTALL
+        )
+
+        if not modules_match:
+            print("⚠️  Modules 섹션을 찾을 수 없습니다.")
+            return
+
+        modules_section = modules_match.group(1)
+
+        # Module별 파싱: ### Module N: 이름
+        module_pattern = r'###\s+Module\s+\d+:\s+(.+?)(?=###\s+Module|\Z)'
+        module_blocks = re.finditer(module_pattern, modules_section, re.DOTALL)
+
+        for module_match in module_blocks:
+            module_text = module_match.group(0)
+            module_name = module_match.group(1).strip()
+
+            # Module YAML 파싱
+            yaml_match = re.search(r'```yaml\n(.+?)\n```', module_text, re.DOTALL)
+
+            if not yaml_match:
+                print(f"⚠️  Module YAML을 찾을 수 없음: {module_name}")
+                continue
+
+            try:
+                module_data = yaml.safe_load(yaml_match.group(1))
+                module = Module(
+                    name=module_data.get('name', module_name),
+                    description=module_data.get('description', ''),
+                    start_date=module_data.get('start_date'),
+                    target_date=module_data.get('target_date'),
+                    lead=module_data.get('lead'),
+                    members=tuple(module_data.get('members', [])),
+                    status=module_data.get('status', 'planned')
+                )
+
+                # 이 Module의 Issues 파싱
+                module.issues = self._parse_issues_in_module(module_text)
+
+                self.modules.append(module)
+
+            except yaml.YAMLError as e:
+                print(f"⚠️  Module YAML 파싱 오류: {module_name} - {e}")
+
+    def _parse_issues_in_module(self, module_text: str) -> List[Issue]:
+        """Module 내의 Issues 파싱"""
+        issues = []
+
+        # Issue 패턴: #### PROJ-XXX: 제목 (Xpt, Priority)
+        issue_pattern = r'####\s+' + self.project_identifier + r'-(\d+):\s+(.+?)(?=####|###|\Z)'
+        issue_blocks = re.finditer(issue_pattern, module_text, re.DOTALL)
+
+        for issue_match in issue_blocks:
+            issue_number = issue_match.group(1)
+            issue_text = issue_match.group(0)
+
+            identifier = f"{self.project_identifier}-{issue_number}"
+
+            # 제목 파싱: "제목 (8pt, High)" 형식
+            title_line = issue_match.group(2).split('\n')[0].strip()
+
+            # (Xpt, Priority) 제거하여 순수 제목 추출
+            clean_title = re.sub(r'\s*\(\d+pt,\s*\w+\)', '', title_line).strip()
+
+            # YAML 블록 파싱
+            yaml_match = re.search(r'```yaml\n(.+?)\n```', issue_text, re.DOTALL)
+
+            if not yaml_match:
+                # YAML 없으면 기본값으로 생성
+                issue = Issue(name=clean_title, identifier=identifier)
+                issues.append(issue)
+                continue
+
+            try:
+                issue_data = yaml.safe_load(yaml_match.group(1))
+
+                issue = Issue(
+                    name=clean_title,
+                    description_html=issue_data.get('description_html', ''),
+                    priority=self._normalize_priority(issue_data.get('priority', 'medium')),
+                    assignees=tuple(issue_data.get('assignees', [])),
+                    labels=tuple(issue_data.get('labels', [])),
+                    start_date=issue_data.get('start_date'),
+                    target_date=issue_data.get('target_date'),
+                    estimate_point=issue_data.get('estimate_point'),
+                    state=issue_data.get('state'),
+                    identifier=identifier
+                )
+
+                issues.append(issue)
+
+            except yaml.YAMLError as e:
+                print(f"⚠️  Issue YAML 파싱 오류: {clean_title} - {e}")
+                # 에러 발생 시에도 기본 Issue 생성
+                issues.append(Issue(name=clean_title, identifier=identifier))
+
+        return issues
+
+    def _normalize_priority(self, priority: str) -> str:
+        """우선순위 정규화"""
+        priority_map = {
+            'urgent': 'urgent',
+            'high': 'high',
+            'medium': 'medium',
+            'low': 'low',
+            'none': 'none'
+        }
+        return priority_map.get(priority.lower(), 'medium')
+
+
+def generate_plan(issue_count: int, issues_per_module: int = 25, cycle_count: int = 0,
+                  identifier: str = "SYN") -> str:
+    """
+    PLANE_PROJECT_TEMPLATE.md 형식의 합성 기획서 생성
+
+    issue_count개의 Issue를 issues_per_module개씩 Module로 나누고, Module마다
+    2주 간격의 시작일을 준다. cycle_count가 0이면 Module 4개당 Cycle 1개.
+    """
+    module_count = max(1, -(-issue_count // issues_per_module))
+    if not cycle_count:
+        cycle_count = max(1, -(-module_count // 4))
+
+    lines = [
+        "# 합성 기획서",
+        "",
+        "## 1. 프로젝트 개요",
+        "",
+        f"**프로젝트 식별자**: `{identifier}`",
+        "",
+        "## 7. Modules 계획",
+        "",
+    ]
+
+    number = 0
+    for m in range(module_count):
+        start = _sprint_date(m)
+        lines += [
+            f"### Module {m + 1}: 합성 모듈 {m + 1}",
+            "```yaml",
+            f'name: "합성 모듈 {m + 1}"',
+            f'description: "벤치마크용 모듈 {m + 1}"',
+            f'start_date: "{start}"',
+            f'target_date: "{_sprint_date(m, days=13)}"',
+            'lead: "@lead"',
+            'members: ["@dev1", "@dev2"]',
+            'status: "planned"',
+            "```",
+            "",
+            f"**Issues** ({issues_per_module}개):",
+            "",
+        ]
+        for _ in range(issues_per_module):
+            if number >= issue_count:
+                break
+            number += 1
+            lines += [
+                f"#### {identifier}-{number:03d}: 합성 이슈 {number} (3pt, High)",
+                "```yaml",
+                "description_html: |",
+                "  <h2>개요</h2>",
+                f"  <p>합성 이슈 {number} 설명입니다.</p>",
+                "  <h2>완료 조건</h2>",
+                "  <ul>",
+                "    <li>기능 동작</li>",
+                "    <li>테스트 작성</li>",
+                "  </ul>",
+                'assignees: ["@dev1"]',
+                'labels: ["backend", "feature"]',
+                'priority: "high"',
+                "estimate_point: 3",
+                'state: "Todo"',
+                "```",
+                "",
+            ]
+
+    lines += ["## 8. Cycles 계획", ""]
+    sprint_modules = max(1, -(-module_count // cycle_count))
+    for c in range(cycle_count):
+        first = c * sprint_modules
+        lines += [
+            f"### Cycle {c + 1}: Sprint {c + 1}",
+            "```yaml",
+            f'name: "Sprint {c + 1}"',
+            f'start_date: "{_sprint_date(first)}"',
+            f'end_date: "{_sprint_date(first + sprint_modules - 1, days=13)}"',
+            'owned_by: "@lead"',
+            f'description: "합성 스프린트 {c + 1}"',
+            "```",
+            "",
+        ]
+
+    lines += ["## 9. 기타", ""]
+    return "\n".join(lines)
+
+
+def _sprint_date(index: int, days: int = 0) -> str:
+    """2025-01-06부터 2주 간격 날짜"""
+    import datetime
+    base = datetime.date(2025, 1, 6) + datetime.timedelta(days=14 * index + days)
+    return base.isoformat()
+
+
+def write_synthetic_plans(sizes: List[int], directory: str) -> List[Tuple[str, str]]:
+    """크기별 합성 기획서를 directory에 쓰고 (이름, 경로) 목록 반환"""
+    plans = []
+    for size in sizes:
+        path = os.path.join(directory, f"synthetic-{size}.md")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(generate_plan(size))
+        plans.append((f"synthetic-{size}", path))
+    return plans
+
+
+def _best_of(repeat: int, fn) -> Tuple[float, object]:
+    """repeat번 실행한 최소 시간(초)과 마지막 결과"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def _quiet(fn):
+    """파서 경고 출력 억제"""
+    def run():
+        stdout = sys.stdout
+        sys.stdout = open(os.devnull, 'w')
+        try:
+            return fn()
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+    return run
+
+
+class _NoYAML:
+    """YAML 로드를 빈 dict로 바꿔 문서 스캔 비용만 측정"""
+
+    def __enter__(self):
+        self._safe_load = yaml.safe_load
+        self._yaml_load = md_to_plane._yaml_load
+        yaml.safe_load = md_to_plane._yaml_load = lambda text: {}
+
+    def __exit__(self, *exc):
+        yaml.safe_load = self._safe_load
+        md_to_plane._yaml_load = self._yaml_load
+
+
+def bench_parse(plans: List[Tuple[str, str]], repeat: int):
+    """
+    정규식 파서와 스트리밍 파서의 파싱 시간 비교
+
+    전체: YAML 로드 포함 / 스캔: YAML 로드를 빼고 제목·펜스 탐색만
+    캐시: 파일이 바뀌지 않았을 때 ParseCache에서 읽는 시간
+    """
+    print("=" * 110)
+    print(f"{'기획서':<30}{'크기':>8}{'Issues':>8}"
+          f"{'전체 정규식':>12}{'스트리밍':>10}{'배속':>7}"
+          f"{'스캔 정규식':>12}{'스트리밍':>10}{'배속':>7}{'캐시':>10}  (ms)")
+    print("=" * 110)
+    cache_dir = tempfile.mkdtemp(prefix='md_to_plane-bench-')
+
+    for name, path in plans:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+
+        def run_regex():
+            parser = RegexMarkdownParser(content)
+            return parser.parse()
+
+        def run_stream():
+            parser = YAMLMarkdownParser.from_file(path)
+            return parser.parse()
+
+        regex_time, regex_modules = _best_of(repeat, _quiet(run_regex))
+        stream_time, stream_modules = _best_of(repeat, _quiet(run_stream))
+        with _NoYAML():
+            regex_scan, _ = _best_of(repeat, _quiet(run_regex))
+            stream_scan, _ = _best_of(repeat, _quiet(run_stream))
+        parse_plan_file(path, cache_dir)  # 캐시 채우기
+        cached_time, _ = _best_of(repeat, lambda: parse_plan_file(path, cache_dir))
+
+        issues = sum(len(m.issues) for m in stream_modules)
+        same = "" if regex_modules == stream_modules else "  ⚠️ 결과 다름"
+        print(f"{name[:29]:<30}{len(content) // 1024:>6}KB{issues:>8}"
+              f"{regex_time * 1000:>12.1f}{stream_time * 1000:>10.1f}"
+              f"{regex_time / stream_time:>6.1f}x"
+              f"{regex_scan * 1000:>12.1f}{stream_scan * 1000:>10.1f}"
+              f"{regex_scan / stream_scan:>6.1f}x{cached_time * 1000:>10.1f}{same}")
+
+    print("=" * 110)
+    shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+class MockServerProcess:
+    """
+    plane_mock_server.py를 별도 프로세스로 실행 (클라이언트와 GIL을 나누지 않도록)
+
+    빈 포트로 띄우고 첫 줄에 출력되는 주소를 읽는다.
+    """
+
+    def __init__(self, options: List[str]):
+        self.options = options
+        self.process: Optional[subprocess.Popen] = None
+        self.url = ''
+
+    def __enter__(self) -> 'MockServerProcess':
+        self.process = subprocess.Popen(
+            [sys.executable, MOCK_SERVER, '--port', '0'] + self.options,
+            stdout=subprocess.PIPE, text=True, encoding='utf-8'
+        )
+        line = self.process.stdout.readline()
+        match = re.search(r'(http://\S+)', line)
+        if not match:
+            self.process.kill()
+            raise RuntimeError(f"Mock 서버를 시작할 수 없습니다: {line.strip()!r}")
+        self.url = match.group(1)
+        return self
+
+    def __exit__(self, *exc):
+        self.process.terminate()
+        self.process.wait()
+        self.process.stdout.close()
+
+
+def _server_options(args) -> List[str]:
+    options = ['--latency', str(args.latency), '--jitter', str(args.jitter),
+               '--rate-limit', str(args.server_rate_limit),
+               '--throttle-rate', str(args.throttle_rate),
+               '--failure-rate', str(args.failure_rate), '--bulk-endpoint']
+    if args.seed is not None:
+        options += ['--seed', str(args.seed)]
+    return options
+
+
+def run_upload(api_url: str, path: str, concurrency: int, args,
+               bulk_size: int = 0) -> Dict[str, float]:
+    """
+    기획서 하나를 업로드하고 측정값 반환
+
+    요청 지연은 Instrumentation 훅으로 받은 요청별 시간 (요청 전송 ~ 응답 본문 수신).
+    """
+    parser = YAMLMarkdownParser.from_file(path)
+    modules = _quiet(parser.parse)()
+
+    latencies: List[float] = []
+    instrumentation = Instrumentation()
+    instrumentation.add_hook(
+        lambda event: latencies.append(event['dur']) if event['type'] == 'request' else None
+    )
+    client = PlaneAPIClient(api_url, 'bench-key', 'bench', 'bench',
+                            rate_limiter=RateLimiter(rate_per_minute=args.rate_limit),
+                            max_retries=args.max_retries,
+                            pool_size=max(10, concurrency),
+                            gzip_min_bytes=args.gzip_min_bytes if args.gzip else None,
+                            bulk_size=bulk_size, instrumentation=instrumentation)
+    uploader = PlanUploader(client, concurrency=concurrency)
+
+    def upload():
+        if bulk_size > 1:
+            client.detect_bulk_issues()
+        if args.metadata:
+            metadata = ProjectMetadata(client)
+            metadata.load()
+            metadata.ensure_labels((label for module in modules for issue in module.issues
+                                    for label in issue.labels), concurrency=concurrency)
+            client.metadata = metadata
+        uploader.upload(parser.cycles, modules)
+
+    started = time.perf_counter()
+    _quiet(upload)()
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    limiter = client.rate_limiter.stats()
+    return {
+        'issues': sum(len(m.issues) for m in modules),
+        'requests': len(latencies),
+        'wall': wall,
+        'rps': len(latencies) / wall if wall > 0 else 0.0,
+        'p50': percentile(latencies, 50),
+        'p95': percentile(latencies, 95),
+        'p99': percentile(latencies, 99),
+        'retries': client.retries,
+        'rate_limited': limiter['rate_limited'],
+        'failed': uploader.counts['failed'],
+    }
+
+
+def bench_upload(plans: List[Tuple[str, str]], args):
+    """
+    Mock Plane 서버에 업로드하며 처리량 / 지연 측정
+
+    --api-url이 없으면 기획서 × 동시성 조합마다 새 Mock 서버를 띄운다 (빈 저장소에서 시작).
+    """
+    print(f"서버 지연 {args.latency:g}±{args.jitter:g}ms, 무작위 429 {args.throttle_rate:g}, "
+          f"무작위 500 {args.failure_rate:g}, 서버 분당 제한 {args.server_rate_limit or '없음'}, "
+          f"클라이언트 분당 제한 {args.rate_limit or '없음'}")
+    print("=" * 114)
+    print(f"{'기획서':<26}{'동시성':>6}{'일괄':>6}{'Issues':>8}{'요청':>8}{'시간(s)':>9}{'req/s':>9}"
+          f"{'p50':>8}{'p95':>8}{'p99':>8}  (ms){'재시도':>7}{'429':>6}{'실패':>6}")
+    print("=" * 114)
+
+    for name, path in plans:
+        for concurrency in args.concurrency:
+            for bulk_size in args.bulk_size:
+                if args.api_url:
+                    result = run_upload(args.api_url, path, concurrency, args, bulk_size)
+                else:
+                    with MockServerProcess(_server_options(args)) as server:
+                        result = run_upload(server.url, path, concurrency, args, bulk_size)
+
+                print(f"{name[:25]:<26}{concurrency:>6}{bulk_size or '-':>6}{result['issues']:>8}"
+                      f"{result['requests']:>8}{result['wall']:>9.2f}{result['rps']:>9.1f}"
+                      f"{result['p50'] * 1000:>8.1f}{result['p95'] * 1000:>8.1f}"
+                      f"{result['p99'] * 1000:>8.1f}      {result['retries']:>7}"
+                      f"{result['rate_limited']:>6}{result['failed']:>6}")
+
+    print("=" * 114)
+
+
+def _plan_items(parser: YAMLMarkdownParser) -> set:
+    """기획서 내용 비교용 집합 (순서, Issue 번호, 빈 설명 대체값 무시)"""
+    def description(issue):
+        html = issue.get_description_html()
+        return '' if html == PlanExporter.PLACEHOLDER_DESCRIPTION else html
+
+    items = {('cycle', c.name, c.description, str(c.start_date), str(c.end_date))
+             for c in parser.cycles}
+    for module in parser.modules:
+        items.add(('module', module.name, module.description, str(module.start_date),
+                   str(module.target_date), module.status))
+        items.update(('issue', module.name, i.name, description(i), i.priority, i.assignees,
+                      i.labels, str(i.start_date), str(i.target_date), str(i.estimate_point),
+                      i.state) for i in module.issues)
+    return items
+
+
+def bench_roundtrip(plans: List[Tuple[str, str]], args):
+    """
+    업로드 → 내보내기 → 다시 파싱 왕복
+
+    기획서마다 새 Mock 서버에 업로드하고 PlanExporter로 내보낸 뒤 다시 파싱해
+    원본과 내용(순서 무관)이 같은지 본다. 내보내기 시간은 조회 요청과 파일 쓰기를 합친 값.
+    """
+    print(f"서버 지연 {args.latency:g}ms, 동시성 {args.concurrency}")
+    print("=" * 92)
+    print(f"{'기획서':<26}{'Issues':>8}{'업로드(s)':>10}{'내보내기(s)':>12}{'요청':>7}"
+          f"{'크기(KB)':>10}{'파싱(ms)':>10}{'일치':>7}")
+    print("=" * 92)
+
+    for name, path in plans:
+        original = YAMLMarkdownParser.from_file(path)
+        _quiet(original.parse)()
+        options = ['--latency', str(args.latency), '--bulk-endpoint',
+                   '--identifier', original.project_identifier]
+
+        with MockServerProcess(options) as server, tempfile.TemporaryDirectory() as tmpdir:
+            client = PlaneAPIClient(server.url, 'bench-key', 'bench', 'bench',
+                                    rate_limiter=RateLimiter(0),
+                                    pool_size=max(10, args.concurrency), bulk_size=50)
+
+            def upload():
+                client.detect_bulk_issues()
+                metadata = ProjectMetadata(client)
+                metadata.load()
+                metadata.ensure_labels((label for module in original.modules
+                                        for issue in module.issues for label in issue.labels),
+                                       concurrency=args.concurrency)
+                client.metadata = metadata
+                PlanUploader(client, concurrency=args.concurrency).upload(original.cycles,
+                                                                         original.modules)
+
+            started = time.perf_counter()
+            _quiet(upload)()
+            upload_wall = time.perf_counter() - started
+
+            out = os.path.join(tmpdir, 'exported.md')
+            reader = PlaneAPIClient(server.url, 'bench-key', 'bench', 'bench',
+                                    rate_limiter=RateLimiter(0), pool_size=max(10, args.concurrency))
+            metadata = ProjectMetadata(reader, read_only=True)
+            _quiet(metadata.load)()
+            exporter = PlanExporter(reader, metadata, concurrency=args.concurrency)
+            started = time.perf_counter()
+            exported = _quiet(lambda: exporter.export(out))()
+            export_wall = time.perf_counter() - started
+            if not exported:
+                print(f"{name[:25]:<26}  내보내기 실패")
+                continue
+
+            started = time.perf_counter()
+            reparsed = YAMLMarkdownParser.from_file(out)
+            _quiet(reparsed.parse)()
+            parse_time = time.perf_counter() - started
+            same = _plan_items(original) == _plan_items(reparsed)
+
+            print(f"{name[:25]:<26}{sum(len(m.issues) for m in original.modules):>8}"
+                  f"{upload_wall:>10.2f}{export_wall:>12.2f}"
+                  f"{reader.rate_limiter.stats()['requests']:>7}"
+                  f"{os.path.getsize(out) / 1024:>10.1f}{parse_time * 1000:>10.1f}"
+                  f"{'예' if same else '아니오':>7}")
+
+    print("=" * 92)
+
+
+def _peak_rss() -> int:
+    """
+    프로세스 최대 RSS (바이트)
+
+    리눅스는 /proc의 VmHWM을 쓴다 (ru_maxrss는 exec 전 부모 프로세스의 값을 물려받음).
+    """
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    import resource
+    scale = 1 if sys.platform == 'darwin' else 1024  # ru_maxrss: macOS는 바이트, 그 밖에는 KB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def _measure_memory(path: str, lazy: bool, traced: bool) -> Dict[str, float]:
+    """
+    (새 프로세스에서) 기획서를 파싱하고 메모리 측정
+
+    traced면 tracemalloc으로 파싱 결과가 붙잡고 있는 Python 힙 크기를,
+    아니면 파싱 시간과 최대 RSS(파싱 전 대비 증가분 포함)를 잰다.
+    """
+    import gc
+    import tracemalloc
+
+    before = _peak_rss()
+    if traced:
+        tracemalloc.start()
+
+    started = time.perf_counter()
+    parser = YAMLMarkdownParser.from_file(path, lazy_descriptions=lazy)
+    modules = _quiet(parser.parse)()
+    elapsed = time.perf_counter() - started
+
+    gc.collect()
+    result = {'issues': sum(len(m.issues) for m in modules), 'parse': elapsed}
+    if traced:
+        result['retained'] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    else:
+        peak = _peak_rss()
+        result.update(peak_rss=peak, rss_growth=peak - before)
+    return result
+
+
+def _in_fresh_process(fn, *args):
+    """fn을 새로 띄운(spawn) 프로세스에서 실행 (부모 프로세스의 메모리가 섞이지 않도록)"""
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as pool:
+        return pool.submit(fn, *args).result()
+
+
+def bench_memory(plans: List[Tuple[str, str]]):
+    """
+    파싱 결과의 메모리 사용량 비교
+
+    eager: description_html을 문자열로 보관 / lazy: 파일 위치만 보관 (--lazy-descriptions)
+    유지: 파싱이 끝난 뒤 결과가 붙잡고 있는 Python 힙, RSS: 프로세스 최대 RSS와 파싱 중 증가분
+    """
+    print("=" * 92)
+    print(f"{'기획서':<30}{'크기':>8}{'Issues':>8}{'모드':>7}{'파싱(ms)':>10}"
+          f"{'유지(MB)':>10}{'최대 RSS':>10}{'RSS 증가':>10}")
+    print("=" * 92)
+
+    mb = 1024 * 1024
+    for name, path in plans:
+        size = os.path.getsize(path)
+        for mode in ('eager', 'lazy'):
+            lazy = mode == 'lazy'
+            measured = _in_fresh_process(_measure_memory, path, lazy, False)
+            traced = _in_fresh_process(_measure_memory, path, lazy, True)
+            print(f"{name[:29]:<30}{size // 1024:>6}KB{measured['issues']:>8}{mode:>7}"
+                  f"{measured['parse'] * 1000:>10.1f}{traced['retained'] / mb:>10.1f}"
+                  f"{measured['peak_rss'] / mb:>10.1f}{measured['rss_growth'] / mb:>10.1f}")
+
+    print("=" * 92)
+
+
+STARTUP_BUDGET_MS = 100  # 캐시가 맞는 --dry-run이 인터프리터 시작 외에 더 쓸 수 있는 시간
+HEAVY_MODULES = ('requests', 'urllib3', 'httpx', 'yaml', 'asyncio', 'ssl', 'multiprocessing')
+
+
+def _run_ms(cmd: List[str], env: Dict[str, str], repeat: int) -> Tuple[float, float]:
+    """명령을 새 프로세스로 repeat번 실행한 (최소, 중앙값) 벽시계 시간 ms"""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run(cmd, env=env, cwd=REPO_DIR, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, check=True)
+        times.append((time.perf_counter() - started) * 1000)
+    return min(times), percentile(times, 50)
+
+
+def _import_times(cmd: List[str], env: Dict[str, str]) -> List[Tuple[int, int, str]]:
+    """
+    -X importtime 출력 → (자체 µs, 누적 µs, 모듈 이름) 목록
+
+    인터프리터 시작(site, .pth 파일)이 import 한 모듈은 빼고 명령이 import 한 것만.
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime'] + cmd, env=env, cwd=REPO_DIR,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        match = re.match(r'import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)', line)
+        if match:
+            rows.append((int(match.group(1)), int(match.group(2)), match.group(3)))
+    site = max((i for i, row in enumerate(rows) if row[2] == 'site'), default=-1)
+    return rows[site + 1:]
+
+
+def bench_startup(paths: List[str], repeat: int, budget_ms: float) -> bool:
+    """
+    CLI 시작 시간: 인터프리터 시작 대비 --dry-run이 더 쓰는 시간 (새 프로세스에서 측정)
+
+    파싱 캐시는 임시 디렉터리를 쓰고, 측정 전에 한 번 실행해 파싱 캐시와 바이트코드
+    캐시를 채운다. 캐시가 맞는 --dry-run이 예산(budget_ms)을 넘거나,
+    네트워크 / 선택 의존성 모듈이 로드되면 False.
+    """
+    with tempfile.TemporaryDirectory() as cache_home:
+        env = dict(os.environ, XDG_CACHE_HOME=cache_home)
+        env.pop('PYTHONDONTWRITEBYTECODE', None)  # 첫 실행이 __pycache__를 쓰도록 (보통 실행과 같게)
+        dry_run = paths + ['--dry-run']
+        subprocess.run([sys.executable, '-m', 'md_to_plane'] + dry_run, env=env, cwd=REPO_DIR,
+                       stdout=subprocess.DEVNULL, check=True)  # 캐시와 __pycache__ 채우기
+
+        cases = [
+            ('인터프리터 (python -c pass)', [sys.executable, '-c', 'pass']),
+            ('import md_to_plane', [sys.executable, '-c', 'import md_to_plane']),
+            ('-m md_to_plane --dry-run', [sys.executable, '-m', 'md_to_plane'] + dry_run),
+            ('  └ --no-parse-cache', [sys.executable, '-m', 'md_to_plane', '--no-parse-cache']
+             + dry_run),
+            ('md_to_plane.py --dry-run', [sys.executable, 'md_to_plane.py'] + dry_run),
+        ]
+        print("=" * 72)
+        print(f"{'실행':<36}{'최소(ms)':>10}{'중앙값(ms)':>12}{'시작 대비':>12}")
+        print("=" * 72)
+        results = {}
+        for label, cmd in cases:
+            best, median = results[label] = _run_ms(cmd, env, repeat)
+            extra = best - results[cases[0][0]][0]
+            print(f"{label:<36}{best:>10.1f}{median:>12.1f}{extra:>+11.1f}")
+        print("=" * 72)
+
+        imports = _import_times(['-c', 'import md_to_plane'], env)
+        dry_run_imports = _import_times(['-m', 'md_to_plane'] + dry_run, env)
+
+    total = sum(cumulative for _, cumulative, name in imports if name == 'md_to_plane')
+    print(f"\n-X importtime: import md_to_plane {total / 1000:.1f}ms, 자체 시간 상위 모듈:")
+    for own, cumulative, name in sorted(imports, reverse=True)[:8]:
+        print(f"   {name:<40}{own / 1000:>8.1f}ms (누적 {cumulative / 1000:.1f}ms)")
+
+    loaded = sorted({name.split('.')[0] for _, _, name in dry_run_imports} & set(HEAVY_MODULES))
+    overhead = results[cases[2][0]][0] - results[cases[0][0]][0]
+    ok = overhead <= budget_ms and not loaded
+    print(f"\n{'✅' if ok else '❌'} --dry-run 시작 비용 {overhead:.1f}ms (예산 {budget_ms:.0f}ms)"
+          + (f", 로드된 무거운 모듈: {', '.join(loaded)}" if loaded else ""))
+    return ok
+
+
+def _collect_plans(paths: List[str], sizes: List[int], tmpdir: str) -> List[Tuple[str, str]]:
+    plans = [(os.path.basename(p), p) for p in (paths or sorted(glob.glob(PLANS_GLOB)))]
+    return plans + write_synthetic_plans(sizes, tmpdir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='md_to_plane.py 성능 벤치마크')
+    sub = parser.add_subparsers(dest='command')
+    sub.required = True
+
+    parse_cmd = sub.add_parser('parse', help='정규식 파서 vs 스트리밍 파서 파싱 시간 비교')
+    parse_cmd.add_argument('files', nargs='*', help='기획서 파일 (기본값: plans/*.md)')
+    parse_cmd.add_argument('--sizes', type=int, nargs='*', default=DEFAULT_SIZES,
+                           help=f'합성 기획서 Issue 수 (기본값: {DEFAULT_SIZES})')
+    parse_cmd.add_argument('--repeat', type=int, default=3, help='반복 횟수 (최소값 사용)')
+
+    upload_cmd = sub.add_parser('upload', help='Mock Plane 서버 업로드 처리량 / 지연 측정')
+    upload_cmd.add_argument('files', nargs='*', help='기획서 파일 (기본값: plans/*.md)')
+    upload_cmd.add_argument('--sizes', type=int, nargs='*', default=DEFAULT_SIZES,
+                            help=f'합성 기획서 Issue 수 (기본값: {DEFAULT_SIZES})')
+    upload_cmd.add_argument('--concurrency', '-c', type=int, nargs='+', default=[8],
+                            help='비교할 동시 업로드 수 (기본값: 8)')
+    upload_cmd.add_argument('--api-url', help='이미 실행 중인 서버 주소 (기본값: Mock 서버 자동 실행)')
+    upload_cmd.add_argument('--latency', type=float, default=10.0, help='서버 응답 지연 ms (기본값: 10)')
+    upload_cmd.add_argument('--jitter', type=float, default=0.0, help='서버 응답 지연 편차 ±ms')
+    upload_cmd.add_argument('--throttle-rate', type=float, default=0.0, help='서버 무작위 429 비율 0~1')
+    upload_cmd.add_argument('--failure-rate', type=float, default=0.0, help='서버 무작위 500 비율 0~1')
+    upload_cmd.add_argument('--server-rate-limit', type=int, default=0,
+                            help='서버 분당 허용 요청 수 (기본값: 0 = 무제한)')
+    upload_cmd.add_argument('--seed', type=int, help='서버 장애 주입 난수 시드')
+    upload_cmd.add_argument('--rate-limit', type=float, default=0,
+                            help='클라이언트 분당 요청 제한 (기본값: 0 = 무제한)')
+    upload_cmd.add_argument('--max-retries', type=int, default=5, help='429 재시도 횟수')
+    upload_cmd.add_argument('--bulk-size', type=int, nargs='+', default=[0],
+                            help='Issue 일괄 생성 묶음 크기 (여러 개면 비교, 기본값: 0 = 사용 안 함)')
+    upload_cmd.add_argument('--gzip', action='store_true', help='요청 본문 gzip 압축')
+    upload_cmd.add_argument('--gzip-min-bytes', type=int, default=1024, help='압축할 최소 본문 크기')
+    upload_cmd.add_argument('--metadata', action='store_true',
+                            help='상태 / 라벨 / 멤버 / 추정치 조회와 라벨 생성 포함')
+
+    roundtrip_cmd = sub.add_parser('roundtrip', help='업로드 → 내보내기 → 다시 파싱 왕복 측정')
+    roundtrip_cmd.add_argument('files', nargs='*', help='기획서 파일 (기본값: plans/*.md)')
+    roundtrip_cmd.add_argument('--sizes', type=int, nargs='*', default=DEFAULT_SIZES,
+                               help=f'합성 기획서 Issue 수 (기본값: {DEFAULT_SIZES})')
+    roundtrip_cmd.add_argument('--concurrency', '-c', type=int, default=8,
+                               help='업로드 / 내보내기 동시 요청 수 (기본값: 8)')
+    roundtrip_cmd.add_argument('--latency', type=float, default=10.0,
+                               help='서버 응답 지연 ms (기본값: 10)')
+
+    memory_cmd = sub.add_parser('memory', help='파싱 결과 메모리 / 최대 RSS 측정')
+    memory_cmd.add_argument('files', nargs='*', help='기획서 파일 (기본값: plans/*.md)')
+    memory_cmd.add_argument('--sizes', type=int, nargs='*', default=DEFAULT_SIZES,
+                            help=f'합성 기획서 Issue 수 (기본값: {DEFAULT_SIZES})')
+
+    startup_cmd = sub.add_parser('startup', help='CLI 시작 시간 (-X importtime, --dry-run 예산)')
+    startup_cmd.add_argument('files', nargs='*', help='기획서 파일 (기본값: plans/*.md)')
+    startup_cmd.add_argument('--repeat', type=int, default=10, help='반복 횟수 (기본값: 10)')
+    startup_cmd.add_argument('--budget-ms', type=float, default=STARTUP_BUDGET_MS,
+                             help=f'캐시가 맞는 --dry-run의 인터프리터 시작 대비 허용 시간 '
+                                  f'(기본값: {STARTUP_BUDGET_MS}ms, 넘으면 종료 코드 1)')
+
+    args = parser.parse_args()
+
+    if args.command == 'startup':
+        paths = [os.path.abspath(p) for p in (args.files or sorted(glob.glob(PLANS_GLOB)))]
+        sys.exit(0 if bench_startup(paths, args.repeat, args.budget_ms) else 1)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        plans = _collect_plans(args.files, args.sizes, tmpdir)
+        if args.command == 'parse':
+            bench_parse(plans, args.repeat)
+        elif args.command == 'upload':
+            bench_upload(plans, args)
+        elif args.command == 'roundtrip':
+            bench_roundtrip(plans, args)
+        elif args.command == 'memory':
+            bench_memory(plans)
+
+
+if __name__ == '__main__':
+    main()
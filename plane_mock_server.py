@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+오프라인 Plane API 대역 서버 (md_to_plane.py 테스트 / 벤치마크용)
+
+md_to_plane.py가 쓰는 엔드포인트만 메모리에 흉내 낸다:
+    /api/v1/workspaces/{slug}/projects/{id}/         (GET 프로젝트 정보)
+        modules/  issues/  cycles/  labels/          (GET 목록, POST 생성)
+        modules/{id}/  issues/{id}/  cycles/{id}/     (GET, PATCH)
+        issues/bulk-create/                           (POST 일괄 생성, --bulk-endpoint)
+        modules/{id}/module-issues/                   (GET 소속 Issues, POST 연결)
+        cycles/{id}/cycle-issues/                     (GET 소속 Issues, POST 연결)
+        states/  members/  estimates/                 (GET 목록)
+    /_stats                                           (GET 서버 통계)
+
+사용법:
+    python plane_mock_server.py --port 8800 --latency 20 --rate-limit 600
+    python md_to_plane.py plans/my-service.md -w demo -p demo -k x \\
+        --api-url http://127.0.0.1:8800
+
+    --port 0이면 빈 포트를 골라 첫 줄에 주소를 출력한다.
+
+요구사항:
+    - Python 3.7+ (표준 라이브러리만 사용)
+"""
+
+import sys
+import json
+import gzip
+import time
+import uuid
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from typing import Dict, List, Optional, Tuple
+
+
+COLLECTIONS = ('modules', 'issues', 'cycles', 'labels')
+LINKS = {'module-issues': 'modules', 'cycle-issues': 'cycles'}
+BULK_CREATE = 'bulk-create'
+
+DEFAULT_METADATA = {
+    'states': [
+        {'id': 'state-backlog', 'name': 'Backlog', 'group': 'backlog'},
+        {'id': 'state-todo', 'name': 'Todo', 'group': 'unstarted'},
+        {'id': 'state-progress', 'name': 'In Progress', 'group': 'started'},
+        {'id': 'state-done', 'name': 'Done', 'group': 'completed'},
+    ],
+    'members': [
+        {'id': 'member-lead', 'display_name': 'lead', 'email': 'lead@example.com'},
+        {'id': 'member-dev1', 'display_name': 'dev1', 'email': 'dev1@example.com'},
+        {'id': 'member-dev2', 'display_name': 'dev2', 'email': 'dev2@example.com'},
+    ],
+    'estimates': [
+        {'id': 'estimate-fib', 'points': [
+            {'id': f'point-{value}', 'value': str(value)} for value in (1, 2, 3, 5, 8, 13)
+        ]},
+    ],
+}
+
+
+class MockPlane:
+    """
+    메모리 저장소 + 장애 주입 설정 (스레드 안전)
+
+    장애 주입:
+        latency / jitter: 요청마다 latency ± jitter 초 지연
+        rate_limit: API 키별 분당 허용 요청 수 (0 = 무제한). 넘으면 429 + Retry-After
+        throttle_rate: 무작위 429 비율 (0~1)
+        failure_rate: 무작위 500 비율 (0~1, 쓰기 요청만)
+        reject_gzip: gzip 요청 본문을 415로 거부
+
+    bulk: issues/bulk-create/ 제공 여부 (없으면 실제 구버전 서버처럼 405)
+    identifier: 프로젝트 식별자 (Issue는 Plane처럼 1부터 sequence_id를 받음)
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, rate_limit: int = 0,
+                 throttle_rate: float = 0.0, failure_rate: float = 0.0,
+                 reject_gzip: bool = False, bulk: bool = False, seed: Optional[int] = None,
+                 identifier: str = 'MOCK'):
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.throttle_rate = throttle_rate
+        self.failure_rate = failure_rate
+        self.reject_gzip = reject_gzip
+        self.bulk = bulk
+        self.random = random.Random(seed)
+        self.project = {'name': 'Mock Project', 'identifier': identifier}
+
+        self.store: Dict[str, Dict[str, Dict]] = {name: {} for name in COLLECTIONS}
+        self.links: Dict[str, Dict[str, List[str]]] = {name: {} for name in LINKS}
+        self.metadata = {kind: list(items) for kind, items in DEFAULT_METADATA.items()}
+        self.stats = {'requests': 0, 'throttled': 0, 'failed': 0, 'bytes_received': 0,
+                      'by_endpoint': {}}
+
+        self._windows: Dict[str, List] = {}  # API 키 -> [창 시작 시각, 요청 수]
+        self._lock = threading.Lock()
+
+    def admit(self, endpoint: str, write: bool, size: int,
+              api_key: str = '') -> Tuple[int, Dict[str, str]]:
+        """
+        요청 하나를 받아들일지 결정
+
+        (상태 코드, 응답 헤더) 반환. 상태 코드가 0이면 정상 처리.
+        """
+        with self._lock:
+            self.stats['requests'] += 1
+            self.stats['bytes_received'] += size
+            by_endpoint = self.stats['by_endpoint']
+            by_endpoint[endpoint] = by_endpoint.get(endpoint, 0) + 1
+
+            headers = {}
+            if self.rate_limit:
+                now = time.monotonic()
+                window = self._windows.setdefault(api_key, [now, 0])
+                if now - window[0] >= 60:
+                    window[:] = [now, 0]
+                window[1] += 1
+                reset = max(1, int(60 - (now - window[0]) + 0.999))
+                headers = {
+                    'X-RateLimit-Limit': str(self.rate_limit),
+                    'X-RateLimit-Remaining': str(max(0, self.rate_limit - window[1])),
+                    'X-RateLimit-Reset': str(int(time.time()) + reset),
+                }
+                if window[1] > self.rate_limit:
+                    self.stats['throttled'] += 1
+                    return 429, dict(headers, **{'Retry-After': str(reset)})
+
+            if self.throttle_rate and self.random.random() < self.throttle_rate:
+                self.stats['throttled'] += 1
+                return 429, dict(headers, **{'Retry-After': '1'})
+
+            if write and self.failure_rate and self.random.random() < self.failure_rate:
+                self.stats['failed'] += 1
+                return 500, headers
+
+            return 0, headers
+
+    def delay(self):
+        """설정된 응답 지연"""
+        if self.latency or self.jitter:
+            with self._lock:
+                offset = self.random.uniform(-self.jitter, self.jitter)
+            time.sleep(max(0.0, self.latency + offset))
+
+    def create(self, collection: str, body: Dict) -> Dict:
+        return self.create_many(collection, [body])[0]
+
+    def create_many(self, collection: str, bodies: List[Dict]) -> List[Dict]:
+        """한 번에 생성 (요청 순서대로 반환)"""
+        items = [dict(body, id=str(uuid.uuid4())) for body in bodies]
+        with self._lock:
+            for item in items:
+                if collection == 'issues':
+                    item['sequence_id'] = len(self.store[collection]) + 1
+                self.store[collection][item['id']] = item
+        return items
+
+    def get(self, collection: str, item_id: str) -> Optional[Dict]:
+        with self._lock:
+            return self.store[collection].get(item_id)
+
+    def update(self, collection: str, item_id: str, body: Dict) -> Optional[Dict]:
+        with self._lock:
+            item = self.store[collection].get(item_id)
+            if item is not None:
+                item.update(body)
+            return item
+
+    def link(self, link: str, target_id: str, issue_ids: List[str]) -> bool:
+        with self._lock:
+            if target_id not in self.store[LINKS[link]]:
+                return False
+            linked = self.links[link].setdefault(target_id, [])
+            linked.extend(i for i in issue_ids if i not in linked)
+            return True
+
+    def linked(self, link: str, target_id: str) -> Optional[List[Dict]]:
+        """Module / Cycle에 연결된 Issues (대상이 없으면 None)"""
+        with self._lock:
+            if target_id not in self.store[LINKS[link]]:
+                return None
+            issues = self.store['issues']
+            return [issues[i] for i in self.links[link].get(target_id, []) if i in issues]
+
+    def items(self, collection: str) -> List[Dict]:
+        with self._lock:
+            if collection in self.store:
+                return list(self.store[collection].values())
+            return list(self.metadata[collection])
+
+    def snapshot(self) -> Dict:
+        """/_stats 응답"""
+        with self._lock:
+            return dict(
+                self.stats,
+                by_endpoint=dict(self.stats['by_endpoint']),
+                counts={name: len(items) for name, items in self.store.items()},
+                links={name: sum(len(ids) for ids in targets.values())
+                       for name, targets in self.links.items()},
+            )
+
+
+class MockPlaneHandler(BaseHTTPRequestHandler):
+    """Plane API v1 요청 처리"""
+
+    protocol_version = 'HTTP/1.1'  # keep-alive
+    disable_nagle_algorithm = True  # 헤더 / 본문을 나눠 쓰므로 지연 ACK 40ms 대기 방지
+    server: 'MockPlaneServer'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def do_PATCH(self):
+        self._handle('PATCH')
+
+    def _handle(self, method: str):
+        plane = self.server.plane
+        url = urlsplit(self.path)
+        raw = self._read_body()
+
+        if url.path.rstrip('/') == '/_stats':
+            return self._reply(200, plane.snapshot())
+
+        parts = self._project_path(url.path)
+        if parts is None:
+            return self._reply(404, {'error': 'Not found'})
+        project_id = url.path.split('/')[6]
+
+        endpoint = '/'.join(p if i % 2 == 0 or p == BULK_CREATE else '{id}'
+                            for i, p in enumerate(parts))
+        status, headers = plane.admit(f"{method} {endpoint}", method != 'GET', len(raw),
+                                     self.headers.get('X-API-Key', ''))
+        plane.delay()
+        if status:
+            return self._reply(status, {'error': 'Injected failure'}, headers)
+
+        if method != 'GET':
+            if self.headers.get('Content-Encoding') == 'gzip':
+                if plane.reject_gzip:
+                    return self._reply(415, {'error': 'Unsupported Content-Encoding'}, headers)
+                raw = gzip.decompress(raw)
+            try:
+                body = json.loads(raw or b'{}')
+            except ValueError:
+                return self._reply(400, {'error': 'Invalid JSON'}, headers)
+
+        if not parts:
+            if method != 'GET':
+                return self._reply(405, {'error': 'Not allowed'}, headers)
+            return self._reply(200, dict(plane.project, id=project_id), headers)
+
+        collection = parts[0]
+        if len(parts) == 1 and method == 'GET' and (collection in COLLECTIONS
+                                                    or collection in plane.metadata):
+            return self._reply(200, self._page(plane.items(collection), url.query), headers)
+
+        if collection not in COLLECTIONS:
+            return self._reply(404, {'error': 'Not found'}, headers)
+
+        if len(parts) == 1 and method == 'POST':
+            if not body.get('name'):
+                return self._reply(400, {'name': ['This field is required.']}, headers)
+            return self._reply(201, plane.create(collection, body), headers)
+
+        if parts[1:] == [BULK_CREATE] and method == 'POST' and collection == 'issues':
+            if not plane.bulk:
+                return self._reply(405, {'error': 'Not allowed'}, headers)
+            issues = body.get('issues')
+            if not isinstance(issues, list):
+                return self._reply(400, {'issues': ['This field is required.']}, headers)
+            # 하나라도 잘못되면 아무것도 만들지 않음
+            errors = {str(i): {'name': ['This field is required.']}
+                      for i, issue in enumerate(issues) if not issue.get('name')}
+            if errors:
+                return self._reply(400, errors, headers)
+            return self._reply(201, plane.create_many(collection, issues), headers)
+
+        if len(parts) == 2 and method in ('GET', 'PATCH'):
+            if method == 'GET':
+                item = plane.get(collection, parts[1])
+            else:
+                item = plane.update(collection, parts[1], body)
+            if item is None:
+                return self._reply(404, {'error': 'Not found'}, headers)
+            return self._reply(200, item, headers)
+
+        if len(parts) == 3 and method == 'GET' and LINKS.get(parts[2]) == collection:
+            issues = plane.linked(parts[2], parts[1])
+            if issues is None:
+                return self._reply(404, {'error': 'Not found'}, headers)
+            return self._reply(200, self._page(issues, url.query), headers)
+
+        if len(parts) == 3 and method == 'POST' and LINKS.get(parts[2]) == collection:
+            if not plane.link(parts[2], parts[1], body.get('issues', [])):
+                return self._reply(404, {'error': 'Not found'}, headers)
+            return self._reply(201, {'issues': body.get('issues', [])}, headers)
+
+        return self._reply(405 if len(parts) <= 2 else 404, {'error': 'Not allowed'}, headers)
+
+    def _project_path(self, path: str) -> Optional[List[str]]:
+        """/api/v1/workspaces/{slug}/projects/{id}/... → 프로젝트 하위 경로 조각"""
+        parts = [p for p in path.split('/') if p]
+        if len(parts) < 6 or parts[:3] != ['api', 'v1', 'workspaces'] or parts[4] != 'projects':
+            return None
+        return parts[6:]
+
+    def _page(self, items: List[Dict], query: str) -> Dict:
+        """커서 페이지네이션 (cursor = '페이지크기:페이지번호:0', order_by=-created_at이면 최신순)"""
+        params = parse_qs(query)
+        if params.get('order_by') == ['-created_at']:
+            items = items[::-1]
+        per_page = int(params.get('per_page', ['100'])[0])
+        page = 0
+        if params.get('cursor'):
+            page = int(params['cursor'][0].split(':')[1])
+        start = page * per_page
+        more = start + per_page < len(items)
+        return {
+            'results': items[start:start + per_page],
+            'total_count': len(items),
+            'next_cursor': f"{per_page}:{page + 1}:0" if more else None,
+            'next_page_results': more,
+        }
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def _reply(self, status: int, body, headers: Optional[Dict[str, str]] = None):
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class MockPlaneServer(ThreadingHTTPServer):
+    """
+    MockPlane을 제공하는 HTTP 서버
+
+    with MockPlaneServer(MockPlane(latency=0.02)) as server:
+        client = PlaneAPIClient(server.url, 'key', 'demo', 'demo')
+    """
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, plane: Optional[MockPlane] = None, host: str = '127.0.0.1',
+                 port: int = 0, verbose: bool = False):
+        super().__init__((host, port), MockPlaneHandler)
+        self.plane = plane or MockPlane()
+        self.verbose = verbose
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> 'MockPlaneServer':
+        """백그라운드 스레드에서 서버 시작"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self) -> 'MockPlaneServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='오프라인 Plane API 대역 서버')
+    parser.add_argument('--host', default='127.0.0.1', help='바인드 주소 (기본값: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8800, help='포트 (기본값: 8800, 0 = 빈 포트)')
+    parser.add_argument('--latency', type=float, default=0.0, help='응답 지연 ms (기본값: 0)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='응답 지연 편차 ±ms (기본값: 0)')
+    parser.add_argument('--rate-limit', type=int, default=0,
+                        help='API 키별 분당 허용 요청 수, 넘으면 429 (기본값: 0 = 무제한)')
+    parser.add_argument('--throttle-rate', type=float, default=0.0,
+                        help='무작위 429 비율 0~1 (기본값: 0)')
+    parser.add_argument('--failure-rate', type=float, default=0.0,
+                        help='쓰기 요청의 무작위 500 비율 0~1 (기본값: 0)')
+    parser.add_argument('--reject-gzip', action='store_true', help='gzip 요청 본문을 415로 거부')
+    parser.add_argument('--bulk-endpoint', action='store_true',
+                        help='Issue 일괄 생성 엔드포인트 제공 (issues/bulk-create/)')
+    parser.add_argument('--seed', type=int, help='장애 주입 난수 시드')
+    parser.add_argument('--identifier', default='MOCK',
+                        help='프로젝트 식별자 (기본값: MOCK)')
+    parser.add_argument('--verbose', '-v', action='store_true', help='요청 로그 출력')
+    args = parser.parse_args()
+
+    plane = MockPlane(latency=args.latency / 1000, jitter=args.jitter / 1000,
+                      rate_limit=args.rate_limit, throttle_rate=args.throttle_rate,
+                      failure_rate=args.failure_rate, reject_gzip=args.reject_gzip,
+                      bulk=args.bulk_endpoint, seed=args.seed, identifier=args.identifier)
+    server = MockPlaneServer(plane, args.host, args.port, verbose=args.verbose)
+    print(f"🛰️  Mock Plane 서버: {server.url}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n📊 {json.dumps(plane.snapshot(), ensure_ascii=False)}")
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())